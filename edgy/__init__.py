@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from .conf import settings
     from .conf.global_settings import EdgySettings
     from .core import files, marshalls
-    from .core.connection import Database, DatabaseURL, Registry
+    from .core.connection import Database, DatabaseURL, ReflectionCache, Registry
     from .core.db import fields
     from .core.db.constants import (
         CASCADE,
@@ -158,6 +158,7 @@ __all__ = [
     # base connection
     "Database",
     "DatabaseURL",
+    "ReflectionCache",
     "Registry",
 ]
 monkay = create_monkay(globals(), __all__)
@@ -108,7 +108,7 @@ def create_monkay(global_dict: dict, all_var: list[str]) -> Monkay[Instance, Edg
         monkay.add_lazy_import(name, f"edgy.core.db.constants.{name}")
 
     # Add lazy imports for connection-related classes
-    for name in ["Database", "DatabaseURL", "Registry"]:
+    for name in ["Database", "DatabaseURL", "ReflectionCache", "Registry"]:
         monkay.add_lazy_import(name, f"edgy.core.connection.{name}")
 
     # Add lazy imports for queryset and query-related classes
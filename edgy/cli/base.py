@@ -1,19 +1,34 @@
 import argparse
+import asyncio
 import inspect
+import json
+import multiprocessing
 import os
+import time
 import typing
 import warnings
-from collections.abc import Awaitable, Callable
+import zlib
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from functools import partial
 from importlib import import_module
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
+import sqlalchemy
 from alembic import __version__ as __alembic_version__
 from alembic import command
 from alembic.config import Config as AlembicConfig
+from alembic.script import ScriptDirectory
+from alembic.util import CommandError
 
 import edgy
-from edgy.cli.constants import DEFAULT_TEMPLATE_NAME
+from edgy.cli.constants import DEFAULT_TEMPLATE_NAME, MAIN_DATABASE_NAME
 from edgy.core.db.context_vars import with_force_fields_nullable
 from edgy.core.signals import post_migrate, pre_migrate
 from edgy.utils.compat import is_class_and_subclass
@@ -289,6 +304,275 @@ def upgrade(
     )
 
 
+class MigrationTarget(NamedTuple):
+    """
+    A database (None for the main database) and optionally a tenant schema of it.
+    """
+
+    database: str | None = None
+    schema: str | None = None
+
+    def __str__(self) -> str:
+        name = self.database or "main"
+        return f"{name}:{self.schema}" if self.schema else name
+
+
+class MigrationReport(NamedTuple):
+    """
+    Summary of `upgrade_parallel`.
+
+    Attributes:
+        succeeded: The upgraded targets.
+        skipped: The targets done in a former run (see `progress_file`).
+        locked: The targets locked by another migration run.
+        failed: The failed targets with the error message.
+        duration: The duration of the run in seconds.
+    """
+
+    succeeded: list[MigrationTarget]
+    skipped: list[MigrationTarget]
+    locked: list[MigrationTarget]
+    failed: list[tuple[MigrationTarget, str]]
+    duration: float
+
+
+class MigrationTargetLocked(Exception):
+    """
+    Raised when a target is migrated by another run.
+    """
+
+
+def get_tenant_schemas() -> list[str]:
+    """
+    Returns the schemas of the tenants of the contrib tenant model (setting `tenant_model`).
+    """
+    registry = edgy.get_migration_prepared_registry()
+    tenant_model_name = getattr(edgy.monkay.settings, "tenant_model", None)
+    assert tenant_model_name, "The setting `tenant_model` is required for finding the tenants."
+
+    async def fetch() -> list[str]:
+        tenant_model = registry.get_model(tenant_model_name.rsplit(".", 1)[-1])
+        async with registry:
+            return cast(
+                list[str], await tenant_model.query.values_list(["schema_name"], flat=True)
+            )
+
+    return cast(list[str], edgy.run_sync(fetch()))
+
+
+def get_migration_targets(schemas: Sequence[str] = ()) -> list[MigrationTarget]:
+    """
+    Returns the databases of the setting `migrate_databases` and the `schemas`
+    of the main database as targets.
+    """
+    targets = [MigrationTarget(name) for name in edgy.monkay.settings.migrate_databases]
+    targets.extend(MigrationTarget(None, schema) for schema in schemas)
+    return targets
+
+
+async def _run_locked(target: MigrationTarget, fn: Callable[[], None]) -> None:
+    registry = edgy.get_migration_prepared_registry()
+    database = registry.database if target.database is None else registry.extra[target.database]
+    if database.url.dialect != "postgresql":
+        await asyncio.to_thread(fn)
+        return
+    key = zlib.crc32(f"edgy-migrate:{target}".encode())
+    # a separate pool, the migration connects the registry itself
+    async with edgy.Database(database) as lock_database, lock_database.connection() as connection:
+        acquired = await connection.fetch_val(
+            sqlalchemy.text("SELECT pg_try_advisory_lock(:key)").bindparams(key=key)
+        )
+        if not acquired:
+            raise MigrationTargetLocked(str(target))
+        try:
+            await asyncio.to_thread(fn)
+        finally:
+            await connection.fetch_val(
+                sqlalchemy.text("SELECT pg_advisory_unlock(:key)").bindparams(key=key)
+            )
+
+
+def _upgrade_target(
+    target: MigrationTarget, revision: str, tag: str | None, arg: typing.Any | None
+) -> None:
+    # the env.py selects the target via environment variables
+    environ = {
+        "EDGY_DATABASE": target.database or MAIN_DATABASE_NAME,
+        "EDGY_DATABASE_URL": None,
+        "EDGY_MIGRATE_SCHEMA": target.schema,
+    }
+    old_environ = {key: os.environ.get(key) for key in environ}
+    _update_environ(environ)
+    try:
+        config = Config.get_instance(args=arg)
+        asyncio.run(_run_locked(target, partial(command.upgrade, config, revision, tag=tag)))
+    finally:
+        _update_environ(old_environ)
+
+
+def _update_environ(environ: dict[str, str | None]) -> None:
+    for key, value in environ.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+
+def _resolve_revision(config: AlembicConfig, revision: str) -> str | None:
+    # symbolic revisions like "head" move with new migrations, so the progress is keyed
+    # by the concrete revision ids. Relative revisions depend on the target and can't be.
+    script_directory = ScriptDirectory.from_config(config)
+    try:
+        scripts = script_directory.get_revisions(revision)
+    except CommandError:
+        return None
+    revisions = sorted(script.revision for script in scripts if script is not None)
+    return ",".join(revisions) or revision
+
+
+def _check_env_supports_schemas(config: AlembicConfig) -> None:
+    # an env.py ignoring the variable would upgrade the main schema once per tenant schema
+    env_py = ScriptDirectory.from_config(config).env_py_location
+    with open(env_py) as f:
+        if "EDGY_MIGRATE_SCHEMA" not in f.read():
+            raise CommandError(
+                f"{env_py} doesn't handle the environment variable EDGY_MIGRATE_SCHEMA, "
+                "tenant schemas can't be upgraded. Copy the handling from the template."
+            )
+
+
+def _load_progress(progress_file: str | None, revision: str) -> set[str]:
+    if not progress_file or not os.path.exists(progress_file):
+        return set()
+    with open(progress_file) as f:
+        progress = json.load(f)
+    if progress.get("revision") != revision:
+        return set()
+    return set(progress.get("done", ()))
+
+
+def _save_progress(progress_file: str, revision: str, done: set[str]) -> None:
+    tmp_file = f"{progress_file}.tmp"
+    with open(tmp_file, "w") as f:
+        json.dump({"revision": revision, "done": sorted(done)}, f)
+    os.replace(tmp_file, progress_file)
+
+
+def upgrade_parallel(
+    revision: str = "head",
+    targets: Sequence[MigrationTarget] | None = None,
+    workers: int = 4,
+    progress_file: str | None = None,
+    tag: str | None = None,
+    arg: typing.Any | None = None,
+    progress: Callable[[MigrationTarget, str], None] | None = None,
+) -> MigrationReport:
+    """
+    Upgrades many databases and tenant schemas in parallel.
+
+    Every target is upgraded in a worker process, so alembic runs isolated. The databases
+    are upgraded before the tenant schemas, tenant schemas of a database whose upgrade
+    failed are reported as failed. On PostgreSQL an advisory lock per target prevents
+    concurrent runs from migrating the same target, locked targets are reported and skipped.
+
+    Args:
+        revision: The revision to upgrade to.
+        targets: The targets. Defaults to the databases of `migrate_databases`.
+        workers: The amount of worker processes.
+        progress_file: A json file recording the finished targets. A rerun upgrading to the
+            same revisions skips them, so an interrupted run can be resumed. Symbolic
+            revisions like `head` are resolved first, relative revisions can't be resumed.
+        tag: Passed to alembic.
+        arg: Additional arguments for the env.py.
+        progress: Called with the target and its status after every target.
+
+    Raises:
+        CommandError: If tenant schemas are upgraded but the env.py doesn't handle
+            `EDGY_MIGRATE_SCHEMA`.
+    """
+    start = time.monotonic()
+    if targets is None:
+        targets = get_migration_targets()
+    config = Config.get_instance(args=arg)
+    if any(target.schema is not None for target in targets):
+        _check_env_supports_schemas(config)
+    progress_revision = revision
+    if progress_file:
+        resolved_revision = _resolve_revision(config, revision)
+        if resolved_revision is None:
+            warnings.warn(
+                f"Upgrades to the relative revision {revision!r} can't be resumed, "
+                "the progress file is ignored.",
+                stacklevel=2,
+            )
+            progress_file = None
+        else:
+            progress_revision = resolved_revision
+    done = _load_progress(progress_file, progress_revision)
+    report = MigrationReport(succeeded=[], skipped=[], locked=[], failed=[], duration=0)
+    pending: list[MigrationTarget] = []
+    for target in targets:
+        if str(target) in done:
+            report.skipped.append(target)
+        else:
+            pending.append(target)
+
+    pre_migrate.send(
+        "upgrade", _async_wrapper=_async_wrapper, config=config, revision=revision, tag=tag
+    )
+    executor: Executor
+    if "fork" in multiprocessing.get_all_start_methods():
+        # the forked workers inherit the loaded app
+        executor = ProcessPoolExecutor(
+            max_workers=max(workers, 1), mp_context=multiprocessing.get_context("fork")
+        )
+    else:
+        warnings.warn(
+            "Parallel migrations require the fork start method, migrating sequentially.",
+            stacklevel=2,
+        )
+        executor = ThreadPoolExecutor(max_workers=1)
+    with executor:
+        # the main schemas first, the tenant schemas can depend on them (e.g. shared types)
+        for phase in (
+            [target for target in pending if target.schema is None],
+            [target for target in pending if target.schema is not None],
+        ):
+            not_upgraded = {
+                target.database for target in report.locked if target.schema is None
+            } | {target.database for target, _ in report.failed if target.schema is None}
+            futures: dict[Future, MigrationTarget] = {}
+            for target in phase:
+                if target.database in not_upgraded:
+                    report.failed.append((target, "The main schema wasn't upgraded."))
+                    if progress is not None:
+                        progress(target, "failed")
+                    continue
+                futures[executor.submit(_upgrade_target, target, revision, tag, arg)] = target
+            for future in as_completed(futures):
+                target = futures[future]
+                try:
+                    future.result()
+                except MigrationTargetLocked:
+                    report.locked.append(target)
+                    status = "locked"
+                except Exception as exc:
+                    report.failed.append((target, f"{exc.__class__.__name__}: {exc}"))
+                    status = "failed"
+                else:
+                    report.succeeded.append(target)
+                    status = "done"
+                    if progress_file:
+                        done.add(str(target))
+                        _save_progress(progress_file, progress_revision, done)
+                if progress is not None:
+                    progress(target, status)
+    post_migrate.send(
+        "upgrade", _async_wrapper=_async_wrapper, config=config, revision=revision, tag=tag
+    )
+    return report._replace(duration=time.monotonic() - start)
+
+
 def downgrade(
     revision: str = "-1",
     sql: bool = False,
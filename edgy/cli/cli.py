@@ -21,8 +21,10 @@ from edgy.cli.operations import (
     current,
     downgrade,
     edit,
+    export_data,
     heads,
     history,
+    import_data,
     init,
     inspect_db,
     list_templates,
@@ -134,4 +136,6 @@ edgy_cli.add_command(stamp, name="stamp")
 edgy_cli.add_command(check, name="check")
 edgy_cli.add_command(shell, name="shell")
 edgy_cli.add_command(inspect_db, name="inspectdb")
+edgy_cli.add_command(export_data, name="export")
+edgy_cli.add_command(import_data, name="import")
 edgy_cli.add_command(admin_serve, name="admin_serve")
@@ -1,3 +1,5 @@
 DEFAULT_TEMPLATE_NAME = "default"
 DISCOVERY_PRELOADS = ["application", "app", "main", "asgi"]
 COMMANDS_WITHOUT_APP = ["list-templates", "inspectdb", "init"]
+# name of the main database in EDGY_DATABASE, see the env.py of the templates
+MAIN_DATABASE_NAME = " "
@@ -15,4 +15,6 @@ from .revision import revision as revision  # noqa
 from .shell import shell as shell  # noqa
 from .show import show as show  # noqa
 from .stamp import stamp as stamp  # noqa
+from .transfer import export_data as export_data  # noqa
+from .transfer import import_data as import_data  # noqa
 from .admin_serve import admin_serve as admin_serve  # noqa
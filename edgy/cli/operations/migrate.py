@@ -1,5 +1,14 @@
+from typing import Annotated
+
 import sayer
+from alembic.util import CommandError
 
+from edgy.cli.base import (
+    MigrationTarget,
+    get_migration_targets,
+    get_tenant_schemas,
+    upgrade_parallel,
+)
 from edgy.cli.base import upgrade as _upgrade
 
 from ..common_params import (
@@ -11,6 +20,10 @@ from ..common_params import (
 )
 
 
+def _print_progress(target: MigrationTarget, status: str) -> None:
+    sayer.info(f"{target}: {status}")
+
+
 @sayer.command(context_settings={"ignore_unknown_options": True})
 def migrate(
     sql: SQLOption,
@@ -18,9 +31,76 @@ def migrate(
     arg: ExtraArgOption,
     revision: RevisionHeadArgument,
     directory: DirectoryOption,
+    workers: Annotated[
+        int,
+        sayer.Option(
+            1,
+            "-w",
+            help="Amount of worker processes. More than one upgrades the targets in parallel.",
+            show_default=True,
+        ),
+    ],
+    schema: Annotated[
+        list[str],
+        sayer.Option(
+            (),
+            "-s",
+            multiple=True,
+            help="Tenant schema of the main database to upgrade in addition.",
+        ),
+    ],
+    tenants: Annotated[
+        bool,
+        sayer.Option(
+            False,
+            is_flag=True,
+            help="Upgrade the schemas of all tenants of the setting `tenant_model` in addition.",
+        ),
+    ],
+    progress_file: Annotated[
+        str | None,
+        sayer.Option(
+            None,
+            help="Json file recording the upgraded targets. Reruns skip them.",
+        ),
+    ],
 ) -> None:
     """
     Upgrades to the latest version or to a specific version
     provided by the --tag.
+
+    With workers, schemas or a progress file the databases and tenant schemas are
+    upgraded in parallel worker processes.
     """
-    _upgrade(revision, sql, tag, arg)
+    if workers <= 1 and not schema and not tenants and not progress_file:
+        _upgrade(revision, sql, tag, arg)
+        return
+    if sql:
+        sayer.error("--sql is not supported for parallel upgrades.")
+        raise SystemExit(1)
+    schemas = list(schema)
+    if tenants:
+        schemas.extend(name for name in get_tenant_schemas() if name not in schemas)
+    try:
+        report = upgrade_parallel(
+            revision,
+            targets=get_migration_targets(schemas),
+            workers=workers,
+            progress_file=progress_file,
+            tag=tag,
+            arg=arg,
+            progress=_print_progress,
+        )
+    except CommandError as exc:
+        sayer.error(str(exc))
+        raise SystemExit(1) from None
+    for target, error in report.failed:
+        sayer.error(f"{target}: {error}")
+    summary = (
+        f"Upgraded {len(report.succeeded)} targets in {report.duration:.1f}s, "
+        f"skipped {len(report.skipped)}, locked {len(report.locked)}, failed {len(report.failed)}."
+    )
+    if report.failed:
+        sayer.error(summary)
+        raise SystemExit(1)
+    sayer.success(summary)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+import click
+import sayer
+
+import edgy
+from edgy.utils.transfer import TRANSFER_FORMATS, export_models, import_models
+
+ModelsArgument = Annotated[list[str], sayer.Argument(nargs=-1, required=False)]
+FormatOption = Annotated[
+    str,
+    sayer.Option(
+        "ndjson",
+        "-f",
+        type=click.Choice(TRANSFER_FORMATS),
+        help="File format. Parquet requires pyarrow.",
+        show_default=True,
+    ),
+]
+ChunkSizeOption = Annotated[
+    int,
+    sayer.Option(
+        1000,
+        help="Maximal amount of rows held in memory per chunk.",
+        show_default=True,
+    ),
+]
+
+
+def _get_registry() -> edgy.Registry:
+    instance = edgy.monkay.instance
+    if instance is None:
+        raise RuntimeError(
+            "Auto-detection of app failed.\n"
+            'You need to specify an app which registry is used. For experimenting use: --app="tests.cli.main"'
+        )
+    return instance.registry
+
+
+def _print_progress(model_name: str, count: int) -> None:
+    sayer.info(f"{model_name}: {count} rows")
+
+
+@sayer.command
+def export_data(
+    models: ModelsArgument,
+    directory: Annotated[
+        str,
+        sayer.Option(
+            ".",
+            "-d",
+            help="Directory in which the files are written. One file per model.",
+            show_default=True,
+        ),
+    ],
+    format: FormatOption,
+    chunk_size: ChunkSizeOption,
+) -> None:
+    """
+    Streams the rows of the given models (default: all) into files.
+
+    The models are resolved by name from the registry of the app.
+
+    How to run: `edgy export User Group -d data/ -f csv`
+    """
+    result = edgy.run_sync(
+        export_models(
+            _get_registry(),
+            list(models),
+            directory,
+            format=format,  # type: ignore
+            chunk_size=chunk_size,
+            progress=_print_progress,
+        )
+    )
+    sayer.success(f"Exported {sum(result.values())} rows of {len(result)} models.")
+
+
+@sayer.command
+def import_data(
+    models: ModelsArgument,
+    directory: Annotated[
+        str,
+        sayer.Option(
+            ".",
+            "-d",
+            help="Directory containing the files. One file per model.",
+            show_default=True,
+        ),
+    ],
+    format: FormatOption,
+    chunk_size: ChunkSizeOption,
+    workers: Annotated[
+        int,
+        sayer.Option(
+            1,
+            "-w",
+            help="Amount of chunks inserted concurrently per model.",
+            show_default=True,
+        ),
+    ],
+    ignore_conflicts: Annotated[
+        bool,
+        sayer.Option(False, is_flag=True, help="Skip rows conflicting with existing rows."),
+    ],
+) -> None:
+    """
+    Streams the rows of files into the tables of the given models
+    (default: all models with a file).
+
+    The models are imported in the given order, referenced models must come first.
+
+    How to run: `edgy import User Group -d data/ -f csv`
+    """
+    result = edgy.run_sync(
+        import_models(
+            _get_registry(),
+            list(models),
+            directory,
+            format=format,  # type: ignore
+            chunk_size=chunk_size,
+            workers=workers,
+            ignore_conflicts=ignore_conflicts,
+            progress=_print_progress,
+        )
+    )
+    sayer.success(f"Imported {sum(result.values())} rows of {len(result)} models.")
@@ -110,16 +110,27 @@ def do_run_migrations(connection: Any, name: str, metadata: "sqlalchemy.MetaData
                 directives[:] = []
                 console.print("[bright_red]No changes in schema detected.")
 
+    ctx_kwargs = dict(edgy.monkay.settings.alembic_ctx_kwargs)
+    # set by the parallel migration runner for migrating a tenant schema
+    schema: str | None = os.environ.get("EDGY_MIGRATE_SCHEMA") or None
+    if schema:
+        ctx_kwargs["version_table_schema"] = schema
+
     context.configure(
         connection=connection,
         target_metadata=metadata,
         upgrade_token=f"{name or ''}_upgrades",
         downgrade_token=f"{name or ''}_downgrades",
         process_revision_directives=process_revision_directives,
-        **edgy.monkay.settings.alembic_ctx_kwargs,
+        **ctx_kwargs,
     )
 
     with context.begin_transaction():
+        if schema and connection.dialect.name == "postgresql":
+            # unqualified operations target the tenant schema, shared types and extensions
+            # stay available
+            quoted = connection.dialect.identifier_preparer.quote(schema)
+            connection.exec_driver_sql(f"SET search_path TO {quoted}, public")
         # for compatibility with flask migrate multidb kwarg is called engine_name
         context.run_migrations(engine_name=name or "")
 
@@ -5,7 +5,7 @@ import re
 import shlex
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from monkay import ExtensionProtocol
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -57,6 +57,18 @@ class MediaSettings(BaseSettings):
     generating their public URLs. Defaults to an empty string.
     """
 
+    file_storage_threads: int = 8
+    """
+    The maximum amount of threads the async methods of the storages (`asave`, `aopen`, ...)
+    use for the blocking file operations.
+    """
+    file_cleanup_model: str | None = None
+    """
+    The name of a model derived from `edgy.contrib.file_cleanup.BaseFileCleanup`.
+
+    If set, the files of deleted model instances are queued in its table (in the
+    transaction of the deletion) instead of being deleted instantly. A worker deletes them.
+    """
     storages: dict[str, dict] = {
         "default": {
             "backend": "edgy.core.files.storage.filesystem.FileSystemStorage",
@@ -221,6 +233,36 @@ class EdgySettings(ConcurrencySettings):
     These extensions provide additional functionalities and integrations to
     the Monkay-based Edgy environment. Defaults to an empty tuple.
     """
+    schema_table_cache_size: int | None = 5000
+    """
+    The maximum amount of per-schema table copies (`<model>.table_schema(schema)`) cached
+    across all models. The least recently used copies are evicted first.
+
+    - If set to `None`, the amount is unbounded.
+    """
+    schema_table_cache_memory: int | None = None
+    """
+    The maximum estimated memory in bytes used by the cached per-schema table copies.
+
+    - If set to `None` (default), only `schema_table_cache_size` bounds the cache.
+    """
+    model_defer_build: bool = False
+    """
+    Defer building the pydantic schemas of models to their first validation or serialization.
+
+    Speeds up importing many models, e.g. for CLI commands and short-lived jobs using
+    only a few of them. The first use of a model is slower instead. Models can also opt in
+    via `model_config = ConfigDict(defer_build=True)`.
+    """
+    tenancy_mode: Literal["qualified", "search_path"] = "qualified"
+    """
+    How querysets bind a schema selected via `using(schema=...)`, `with_schema` or `with_tenant`.
+
+    - `qualified` (default): The queries use schema-qualified table copies.
+    - `search_path`: On PostgreSQL the queries of models without an explicit schema use the
+      unqualified default tables and the schema is bound by setting `search_path` on the
+      connection. The compiled statements are shared by all tenants.
+    """
 
     @property
     def ipython_args(self) -> list[str] | tuple[str, ...]:
@@ -17,6 +17,7 @@ from .controllers import (
     ModelObjectDeleteView,
     ModelObjectDetailView,
     ModelObjectEditView,
+    ModelObjectRelatedView,
     ModelOverview,
 )
 
@@ -76,6 +77,11 @@ def create_admin_app(
                 handler=ModelObjectDetailView,
                 name="model-object",
             ),
+            RoutePath(
+                "/models/{name}/{id}/related/{field}",
+                handler=ModelObjectRelatedView,
+                name="model-object-related",
+            ),
             RoutePath(
                 "/models/{name}/{id}/edit",
                 handler=ModelObjectEditView,
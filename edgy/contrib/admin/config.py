@@ -54,6 +54,22 @@ class AdminConfig(BaseSettings):
     The title displayed on the main dashboard page of the admin interface.
     Defaults to "Edgy Admin Dashboard".
     """
+    count_estimate_threshold: int | None = 100_000
+    """
+    Row estimates of the database statistics at least this large are shown instead of
+    counting the rows of the listings and the dashboard. `None` always counts.
+    Defaults to 100,000.
+    """
+    count_cache_ttl: float = 5.0
+    """
+    The time in seconds exact counts are cached (and refreshed in the background afterwards).
+    0 disables the cache. Defaults to 5 seconds.
+    """
+    related_items_limit: int = 20
+    """
+    The amount of related objects (many to many and reverse relations) shown on the object
+    page. More objects are loaded on demand. Defaults to 20.
+    """
     SECRET_KEY: str | bytes = Field(default_factory=lambda: os.urandom(64))
     """
     A secret key used for security purposes, such as signing session cookies.
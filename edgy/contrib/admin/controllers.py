@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING, Any, cast
 
 import anyio
@@ -10,26 +11,32 @@ from lilya.exceptions import NotFound
 from lilya.requests import Request
 from lilya.responses import JSONResponse, RedirectResponse
 from lilya.templating.controllers import TemplateController
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 import edgy
 from edgy.contrib.admin.mixins import AdminMixin, get_templates
 from edgy.contrib.admin.utils.messages import add_message
-from edgy.contrib.pagination import Paginator
+from edgy.contrib.pagination import BasePage, CursorPaginator, Paginator
+from edgy.contrib.pagination.cursor import decode_cursor
 from edgy.core.db.fields.file_field import ConcreteFileField
 from edgy.core.db.fields.many_to_many import BaseManyToManyForeignKeyField
+from edgy.core.db.querysets.counting import get_total
 from edgy.core.db.relationships.related_field import RelatedField
 from edgy.exceptions import ObjectNotFound
 
 from .utils.models import (
     add_to_recent_models,
+    apply_search,
     get_model_json_schema,
     get_recent_models,
     get_registered_models,
+    get_related_items,
 )
 from .utils.models import get_model as _get_model
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from edgy.core.db.models.model import Model
     from edgy.core.db.querysets.queryset import QuerySet
 
@@ -53,6 +60,31 @@ def get_registered_model(model: str) -> type[Model]:
         raise NotFound() from None
 
 
+def decode_pk_cursor(model: type[Model], token: str) -> tuple[Any, ...]:
+    """
+    Decodes a cursor token of the model list and validates its values against the types
+    of the primary key fields.
+
+    Args:
+        model (type[Model]): The listed model.
+        token (str): The token from the `after` or `before` query parameter.
+
+    Returns:
+        tuple[Any, ...]: The cursor vector.
+
+    Raises:
+        ValueError: If the token is invalid or its values don't fit the primary key.
+    """
+    pknames = cast("Sequence[str]", model.pknames)
+    vector = decode_cursor(token)
+    if len(vector) != len(pknames):
+        raise ValueError(f"Invalid cursor token: {token!r}")
+    return tuple(
+        TypeAdapter(model.meta.fields[name].field_type).validate_python(value)
+        for name, value in zip(pknames, vector, strict=True)
+    )
+
+
 class JSONSchemaView(Controller):
     """
     Controller for serving the JSON schema of an Edgy model.
@@ -151,6 +183,7 @@ class AdminDashboard(AdminMixin, TemplateController):
                     model_stats, key=lambda m: m["verbose"]
                 ),  # Sorted list of models with stats.
                 "total_records": total_records,  # Total number of records across all models.
+                "total_is_estimate": any(m["count_is_estimate"] for m in model_stats),
                 "top_model": top_model,  # The model with the highest record count.
                 "recent_models": get_recent_models(),  # List of recently accessed models.
             }
@@ -167,18 +200,24 @@ class AdminDashboard(AdminMixin, TemplateController):
             name (str): The internal name of the model.
             model (edgy.Model): The Edgy model class.
         """
+        admin_config = edgy.monkay.settings.admin_config
         try:
-            # Attempt to get the record count for the model.
-            count = await model.query.count()
+            # Attempt to get the (estimated) record count for the model.
+            count, is_estimate = await get_total(
+                model.query.all(),
+                estimate_threshold=admin_config.count_estimate_threshold,
+                cache_ttl=admin_config.count_cache_ttl,
+            )
         except Exception:
             # If an error occurs (e.g., table does not exist), set count to 0.
-            count = 0
+            count, is_estimate = 0, False
 
         model_stats.append(
             {
                 "name": name,  # Internal name of the model.
                 "verbose": model.__name__,  # Human-readable name of the model.
                 "count": count,  # Number of records in the model.
+                "count_is_estimate": is_estimate,  # Whether the count is estimated.
                 "no_admin_create": model.meta.no_admin_create,  # Whether model can be created via admin.
             }
         )
@@ -288,7 +327,8 @@ class ModelDetailView(AdminMixin, TemplateController):
 
         # Extract pagination and search parameters from query.
         query = request.query_params.get("q", "").strip()
-        page = int(request.query_params.get("page", 1))
+        after = request.query_params.get("after") or None
+        before = request.query_params.get("before") or None
         page_size = int(request.query_params.get("per_page", 25))
         # Ensure page_size is within a reasonable range.
         page_size = min(max(page_size, 1), 250)
@@ -302,36 +342,88 @@ class ModelDetailView(AdminMixin, TemplateController):
         queryset = model.query.all()
 
         if query:
-            filters = []
-            # Apply text-based search filters to string fields.
-            for field in model.model_fields.values():
-                if field.annotation is str:
-                    column = model.table.c.get(field.name)
-                    if column is not None:
-                        filters.append(column.ilike(f"%{query}%"))
-
-            if filters:
-                # Apply filters to the queryset if any were generated.
-                queryset = queryset.filter(*filters)
-
-        # Initialize Paginator with the ordered queryset and page size.
-        paginator = Paginator(queryset.order_by(*model.pknames), page_size=page_size)
-        # Get the current page of objects.
-        page_obj = await paginator.get_page(page)
-
-        # Get the total number of pages.
-        total_pages = await paginator.get_amount_pages()
+            # Use the configured full-text index or ILIKE over the string fields.
+            queryset = apply_search(queryset, query)
+
+        ordered_queryset = queryset.order_by(*model.pknames)
+        previous_query: str | None = None
+        next_query: str | None = None
+        page_number: int | None = None
+        if any(name in model.meta.foreign_key_fields for name in model.pknames):
+            # Foreign keys in the primary key can't be used as cursor values, use offsets.
+            page_number = max(int(request.query_params.get("page", 1)), 1)
+            numbered_page = await Paginator(ordered_queryset, page_size=page_size).get_page(
+                page_number
+            )
+            content = numbered_page.content
+            if not numbered_page.is_first:
+                previous_query = f"page={page_number - 1}"
+            if not numbered_page.is_last:
+                next_query = f"page={page_number + 1}"
+        else:
+            # Keyset pagination on the primary key, the latency doesn't depend on the position.
+            paginator = CursorPaginator(ordered_queryset, page_size=page_size, cursor_tokens=True)
+            show_first_page = False
+            try:
+                if before is not None:
+                    # The items before the cursor, fetched in reverse order.
+                    reverse_page = await paginator.get_reverse_paginator().get_page(
+                        decode_pk_cursor(model, before)
+                    )
+                    content = reverse_page.content[::-1]
+                    has_previous = has_next = True
+                    # Back at the start, show a complete first page instead of the rest.
+                    show_first_page = reverse_page.is_last
+                else:
+                    page_obj = await paginator.get_page(
+                        decode_pk_cursor(model, after) if after is not None else None
+                    )
+                    content = page_obj.content
+                    has_previous = not page_obj.is_first
+                    has_next = not page_obj.is_last
+            except (ValueError, TypeError):
+                # Invalid cursor token (e.g. values not matching the primary key).
+                show_first_page = True
+            if show_first_page:
+                page_obj = await paginator.get_page()
+                content = page_obj.content
+                has_previous = False
+                has_next = not page_obj.is_last
+            if has_previous and content:
+                previous_query = f"before={paginator.obj_to_cursor(content[0])}"
+            if has_next and content:
+                next_query = f"after={paginator.obj_to_cursor(content[-1])}"
+
+        admin_config = edgy.monkay.settings.admin_config
+        total_records, total_is_estimate = await get_total(
+            queryset,
+            estimate_threshold=admin_config.count_estimate_threshold,
+            cache_ttl=admin_config.count_cache_ttl,
+        )
+        # Only offset pagination has page numbers.
+        total_pages = (
+            max(math.ceil(total_records / page_size), 1) if page_number is not None else None
+        )
 
         context.update(
             {
                 "title": f"{model.__name__} Details",  # Page title.
                 "model": model,  # The model class.
                 "marshall_class": marshall_class,  # Marshall class for data display.
-                "page": page_obj,  # Paginated objects for the current page.
+                "page": BasePage(
+                    content=content,
+                    is_first=previous_query is None,
+                    is_last=next_query is None,
+                ),  # Paginated objects for the current page.
+                "previous_query": previous_query,  # Query parameters of the previous page.
+                "next_query": next_query,  # Query parameters of the next page.
+                "page_number": page_number,  # Current page number, None for keyset pages.
+                "total_pages": total_pages,  # Amount of pages, None for keyset pages.
                 "model_name": model_name,  # Name of the model.
                 "query": query,  # Current search query.
                 "per_page": page_size,  # Number of items per page.
-                "total_pages": total_pages,  # Total number of pages.
+                "total_records": total_records,  # Total number of matching records.
+                "total_is_estimate": total_is_estimate,  # Whether it is estimated.
             }
         )
         return context
@@ -497,25 +589,31 @@ class ModelObjectDetailView(BaseObjectView, AdminMixin, TemplateController):
         marshall_class = instance.get_admin_marshall_class(phase="view", for_schema=False)
         marshall = marshall_class(instance=instance)
         relationship_fields = {}
-        overwrite_values = {}
+        overwrite_values: dict[str, Any] = {}
+        related_items_limit = edgy.monkay.settings.admin_config.related_items_limit
+
+        async def load_related(name: str) -> None:
+            # Only the first objects, the rest is loaded on demand via `ModelObjectRelatedView`.
+            overwrite_values[name] = await get_related_items(
+                getattr(instance, name).all(), limit=related_items_limit
+            )
 
         # Iterate through marshall class fields to identify relationship types and preload data.
-        for name, field in marshall_class.model_fields.items():
-            if isinstance(field, BaseManyToManyForeignKeyField):
-                relationship_fields[name] = "many_to_many"
-                # Load all related objects for ManyToMany fields.
-                overwrite_values[name] = await getattr(instance, name).all()
-            elif isinstance(field, RelatedField):
-                relationship_fields[name] = "related_field"
-                # Load all related objects for generic related fields.
-                overwrite_values[name] = await getattr(instance, name).all()
-            elif name in model.meta.foreign_key_fields:
-                relationship_fields[name] = "foreign_key"
-                # Get the direct foreign key value.
-                overwrite_values[name] = getattr(instance, name)
-            elif isinstance(field, ConcreteFileField):
-                # Get the file field value.
-                overwrite_values[name] = getattr(instance, name)
+        async with anyio.create_task_group() as tg:
+            for name, field in marshall_class.model_fields.items():
+                if isinstance(field, BaseManyToManyForeignKeyField):
+                    relationship_fields[name] = "many_to_many"
+                    tg.start_soon(load_related, name)
+                elif isinstance(field, RelatedField):
+                    relationship_fields[name] = "related_field"
+                    tg.start_soon(load_related, name)
+                elif name in model.meta.foreign_key_fields:
+                    relationship_fields[name] = "foreign_key"
+                    # Get the direct foreign key value.
+                    overwrite_values[name] = getattr(instance, name)
+                elif isinstance(field, ConcreteFileField):
+                    # Get the file field value.
+                    overwrite_values[name] = getattr(instance, name)
 
         # Dump model values, excluding those already handled in `overwrite_values`.
         values = marshall.model_dump(exclude=overwrite_values.keys())
@@ -566,6 +664,77 @@ class ModelObjectDetailView(BaseObjectView, AdminMixin, TemplateController):
         return await self.render_template(request, **kwargs)
 
 
+class ModelObjectRelatedView(AdminMixin, Controller):
+    """
+    Controller for loading the related objects of an object incrementally.
+
+    Serves the objects of a many to many or reverse relation shown on the object page
+    in slices as JSON.
+    """
+
+    async def get(self, request: Request, **kwargs: Any) -> JSONResponse:
+        """
+        Handles GET requests to retrieve a slice of related objects.
+
+        Args:
+            request (Request): The incoming Lilya request object, expected to contain
+                               `name`, `id` and `field` in path parameters and optional
+                               `offset` and `limit` in query parameters.
+            **kwargs (Any): Additional keyword arguments from the path parameters.
+
+        Returns:
+            JSONResponse: A JSON response with the `items` (primary key, label and url),
+                          the `total`, `total_is_estimate` and the `next_offset`.
+
+        Raises:
+            NotFound: If the model, the object or the relation is not found.
+        """
+        model = get_registered_model(request.path_params.get("name"))
+        field_name = request.path_params.get("field")
+        try:
+            offset = max(int(request.query_params.get("offset", 0)), 0)
+            limit = int(
+                request.query_params.get(
+                    "limit", edgy.monkay.settings.admin_config.related_items_limit
+                )
+            )
+        except ValueError:
+            raise NotFound() from None
+        # Ensure limit is within a reasonable range.
+        limit = min(max(limit, 1), 250)
+
+        # Only relations shown on the object page are served.
+        marshall_class = model.get_admin_marshall_class(phase="view", for_schema=False)
+        field = marshall_class.model_fields.get(field_name)
+        if not isinstance(field, BaseManyToManyForeignKeyField | RelatedField):
+            raise NotFound()
+
+        instance: Model | None = await model.query.get_or_none(pk=self.get_object_pk(request))
+        if not instance:
+            raise NotFound()
+
+        result = await get_related_items(
+            getattr(instance, field_name).all(), limit=limit, offset=offset
+        )
+        related_model = field.get_related_model_for_admin()
+        url_prefix = self.get_admin_prefix_url(request)
+        items = []
+        for item in result["items"]:
+            object_pk = self.create_object_pk(item)
+            items.append(
+                {
+                    "pk": object_pk,
+                    "label": str(item),
+                    "url": f"{url_prefix}/models/{related_model.__name__}/{object_pk}"
+                    if related_model is not None
+                    else None,
+                }
+            )
+        result["items"] = items
+        with JSONResponse.with_transform_kwargs({"json_encode_fn": orjson.dumps}):
+            return JSONResponse(result)
+
+
 class ModelObjectEditView(BaseObjectView, AdminMixin, TemplateController):
     """
     View for displaying and processing the form to edit an existing model instance.
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+import re
+from collections.abc import Hashable
 from typing import TYPE_CHECKING, Any, Literal, cast
+from weakref import WeakKeyDictionary
 
+import sqlalchemy
 from lilya.context import session
 from pydantic.json_schema import GenerateJsonSchema, NoDefault
-from pydantic_core import core_schema
+from pydantic_core import PydanticSerializationError, core_schema
 
 import edgy
+from edgy.core.db.models.metaclasses import MetaInfo
+from edgy.core.db.models.mixins.admin import clear_admin_marshall_classes
+from edgy.core.db.querysets.counting import get_total
+from edgy.core.db.relationships.utils import crawl_relationship
 
 if TYPE_CHECKING:
     from edgy.core.db.models.model import Model
+    from edgy.core.db.querysets.queryset import QuerySet
+
+_identifier = re.compile(r"^\w+$")
 
 
 class CallableDefaultJsonSchema(GenerateJsonSchema):
@@ -68,6 +79,78 @@ class NoCallableDefaultJsonSchema(GenerateJsonSchema):
         return value
 
 
+class _CallableDefault:
+    """
+    Placeholder of a callable default in a cached JSON schema.
+    """
+
+    __slots__ = ("factory", "generator")
+
+    def __init__(self, factory: Any, generator: GenerateJsonSchema) -> None:
+        self.factory = factory
+        self.generator = generator
+
+
+class DeferredCallableDefaultJsonSchema(GenerateJsonSchema):
+    """
+    A JSON schema generator keeping callable defaults as placeholders.
+
+    The generated schema can be cached. `resolve_callable_defaults` either calls the
+    callables (like `CallableDefaultJsonSchema`) or drops them (like
+    `NoCallableDefaultJsonSchema`).
+    """
+
+    def get_default_value(self, schema: core_schema.WithDefaultSchema) -> Any:
+        value = super().get_default_value(schema)
+        if callable(value):
+            value = _CallableDefault(value, self)
+        return value
+
+    def encode_default(self, dft: Any) -> Any:
+        if isinstance(dft, _CallableDefault):
+            return dft
+        return super().encode_default(dft)
+
+
+def resolve_callable_defaults(value: Any, include_callable_defaults: bool) -> Any:
+    """
+    Copies a schema generated by `DeferredCallableDefaultJsonSchema`, calling the
+    callable defaults freshly or dropping them.
+    """
+    if isinstance(value, dict):
+        result = {}
+        for key, item in value.items():
+            if isinstance(item, _CallableDefault):
+                if not include_callable_defaults:
+                    continue
+                try:
+                    item = item.generator.encode_default(item.factory())
+                except PydanticSerializationError:
+                    # like pydantic: exclude defaults which aren't serializable
+                    continue
+            else:
+                item = resolve_callable_defaults(item, include_callable_defaults)
+            result[key] = item
+        return result
+    if isinstance(value, list):
+        return [resolve_callable_defaults(item, include_callable_defaults) for item in value]
+    return value
+
+
+# JSON schemas by marshall class and (mode, kwargs): (invalidation generation, schema)
+_json_schema_cache: WeakKeyDictionary[type, dict[Hashable, tuple[int, dict]]] = WeakKeyDictionary()
+
+
+def clear_admin_caches() -> None:
+    """
+    Clears the cached JSON schemas and admin marshall classes.
+
+    They are also dropped automatically when model fields are invalidated.
+    """
+    _json_schema_cache.clear()
+    clear_admin_marshall_classes()
+
+
 def get_registered_models() -> dict[str, type[Model]]:
     """
     Retrieves a dictionary of all Edgy models registered for the admin interface.
@@ -148,16 +231,147 @@ def get_model_json_schema(
     # Get the appropriate admin marshall class for the specified phase.
     marshall_class = model.get_admin_marshall_class(phase=phase, for_schema=True)
 
-    # Determine which schema generator to use based on `include_callable_defaults`.
-    schema_generator = (
-        CallableDefaultJsonSchema if include_callable_defaults else NoCallableDefaultJsonSchema
-    )
-    # Generate and return the JSON schema.
-    return marshall_class.model_json_schema(
-        schema_generator=schema_generator,
-        mode=mode,
-        **kwargs,
-    )
+    try:
+        key: Hashable = (mode, frozenset(kwargs.items()))
+    except TypeError:
+        key = None
+    if key is None or mode != "validation":
+        # Uncacheable arguments. In serialization mode pydantic applies serializers to the
+        # default values, which isn't supported for placeholders.
+        # Determine which schema generator to use based on `include_callable_defaults`.
+        schema_generator = (
+            CallableDefaultJsonSchema if include_callable_defaults else NoCallableDefaultJsonSchema
+        )
+        # Generate and return the JSON schema.
+        return marshall_class.model_json_schema(
+            schema_generator=schema_generator,
+            mode=mode,
+            **kwargs,
+        )
+    generation = MetaInfo._invalidation_generation
+    schemas = _json_schema_cache.setdefault(marshall_class, {})
+    cached = schemas.get(key)
+    if cached is None or cached[0] != generation:
+        cached = schemas[key] = (
+            generation,
+            marshall_class.model_json_schema(
+                schema_generator=DeferredCallableDefaultJsonSchema, mode=mode, **kwargs
+            ),
+        )
+    # a copy with fresh callable defaults
+    return cast(dict, resolve_callable_defaults(cached[1], include_callable_defaults))
+
+
+def apply_search(queryset: QuerySet, query: str) -> QuerySet:
+    """
+    Filters the queryset by the search query of the admin model list.
+
+    Uses the full-text index configured by `get_admin_search_config` of the model if it
+    matches the dialect, otherwise `ILIKE` over the string fields.
+
+    Args:
+        queryset (QuerySet): The queryset of the model list.
+        query (str): The search query.
+
+    Returns:
+        QuerySet: The filtered queryset.
+    """
+    model = queryset.model_class
+    table = queryset.table
+    config = model.get_admin_search_config()
+    dialect = queryset.database.url.dialect
+
+    if config.get("tsvector") and dialect == "postgresql":
+        tsvector_config = config.get("tsvector_config", "simple")
+        if not _identifier.match(tsvector_config):
+            raise ValueError(f"Invalid text search config: {tsvector_config!r}")
+        regconfig: Any = sqlalchemy.literal_column(f"'{tsvector_config}'::regconfig")
+        if isinstance(config["tsvector"], str):
+            vector: Any = table.c[config["tsvector"]]
+        else:
+            # the same expression as the index: coalesce(a, '') || ' ' || coalesce(b, '')
+            document: Any = None
+            for field_name in config["tsvector"]:
+                part = sqlalchemy.func.coalesce(
+                    table.c[field_name], sqlalchemy.literal_column("''")
+                )
+                document = (
+                    part
+                    if document is None
+                    else document.op("||")(sqlalchemy.literal_column("' '")).op("||")(part)
+                )
+            vector = sqlalchemy.func.to_tsvector(regconfig, document)
+        return queryset.filter(
+            vector.op("@@")(sqlalchemy.func.websearch_to_tsquery(regconfig, query))
+        )
+
+    if config.get("fts5_table") and dialect == "sqlite":
+        fts5_table = config["fts5_table"]
+        if not _identifier.match(fts5_table):
+            raise ValueError(f"Invalid FTS5 table: {fts5_table!r}")
+        # quoted as a phrase, the FTS5 query syntax would raise on unbalanced quotes
+        phrase = '"{}"'.format(query.replace('"', '""'))
+        matches: Any = (
+            sqlalchemy.select(sqlalchemy.literal_column("rowid"))
+            .select_from(sqlalchemy.table(fts5_table))
+            .where(sqlalchemy.literal_column(f'"{fts5_table}"').op("MATCH")(phrase))
+        )
+        return queryset.filter(table.c[model.pkcolumns[0]].in_(matches))
+
+    filters = []
+    # Apply text-based search filters to string fields.
+    for field in model.model_fields.values():
+        if field.annotation is str:
+            column = table.c.get(field.name)
+            if column is not None:
+                filters.append(column.ilike(f"%{query}%"))
+    if filters:
+        # Apply filters to the queryset if any were generated, a match in any field suffices.
+        queryset = queryset.filter(cast(Any, sqlalchemy.or_(*filters)))
+    return queryset
+
+
+async def get_related_items(queryset: QuerySet, *, limit: int, offset: int = 0) -> dict[str, Any]:
+    """
+    Loads a bounded slice of related objects for the admin object views.
+
+    Fetches `limit + 1` objects ordered by the primary key of the queried model, so
+    whether more objects exist is known without counting. The relation is only counted
+    (estimated and cached like the model list) when it has more objects.
+
+    Args:
+        queryset (QuerySet): The queryset of the relation.
+        limit (int): The maximum amount of returned objects.
+        offset (int): The amount of objects to skip.
+
+    Returns:
+        dict[str, Any]: The `items`, the `total` amount of related objects, whether the
+            total is an estimate (`total_is_estimate`) and the `next_offset` or `None`.
+    """
+    model = queryset.model_class
+    if queryset.embed_parent_filters:
+        # the paths are relative to the embedded model, e.g. the target of a many to many
+        model = crawl_relationship(
+            model, queryset.embed_parent_filters[0], traverse_last=True
+        ).model_class
+    items = await queryset.order_by(*model.pknames).offset(offset).limit(limit + 1)
+    has_more = len(items) > limit
+    items = items[:limit]
+    if has_more or (offset and not items):
+        admin_config = edgy.monkay.settings.admin_config
+        total, total_is_estimate = await get_total(
+            queryset,
+            estimate_threshold=admin_config.count_estimate_threshold,
+            cache_ttl=admin_config.count_cache_ttl,
+        )
+    else:
+        total, total_is_estimate = offset + len(items), False
+    return {
+        "items": items,
+        "total": total,
+        "total_is_estimate": total_is_estimate,
+        "next_offset": offset + limit if has_more else None,
+    }
 
 
 def add_to_recent_models(model: type[Model]) -> None:
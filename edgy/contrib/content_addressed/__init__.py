@@ -0,0 +1,4 @@
+from .models import BaseContentBlob
+from .storage import ContentAddressedStorage
+
+__all__ = ["BaseContentBlob", "ContentAddressedStorage"]
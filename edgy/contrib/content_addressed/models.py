@@ -0,0 +1,23 @@
+import edgy
+
+
+class BaseContentBlob(edgy.Model):
+    """
+    Abstract base model for the reference counts of the blobs of a
+    `ContentAddressedStorage`.
+
+    Subclass it in the registry of the application and pass the model (or its name)
+    as `blob_model` option to the storage.
+    """
+
+    name: str = edgy.fields.CharField(max_length=255, primary_key=True)
+    """
+    The name of the blob in the storage.
+    """
+    refcount: int = edgy.fields.IntegerField(default=0)
+    """
+    The amount of file fields referencing the blob. The blob is deleted with the last reference.
+    """
+
+    class Meta:
+        abstract = True
@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import re
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, BinaryIO, cast
+from uuid import uuid4
+
+import sqlalchemy
+
+from edgy.core.files.scan import FileScan, scan_file
+from edgy.core.files.storage.base import is_async_readable, run_in_storage_thread
+from edgy.core.files.storage.filesystem import FileSystemStorage
+from edgy.core.utils.sync import run_sync
+from edgy.exceptions import FileOperationError, SuspiciousFileOperation
+
+if TYPE_CHECKING:
+    from edgy.core.files.base import File
+
+    from .models import BaseContentBlob
+
+_HEX_DIGEST = re.compile(r"[0-9a-f]+")
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    A filesystem storage storing blobs under the hash of their content in a sharded
+    directory layout (e.g. `ab/cd/abcd...`).
+
+    Identical content is stored once. The references are counted in the database by a
+    model derived from `BaseContentBlob`: saving adds a reference, deleting removes one
+    and the blob is only deleted with the last reference.
+
+    Names are derived from the content by `get_content_name`, which `FieldFile.save` calls.
+    Blobs without a reference row (e.g. names set by queryset updates) are never deleted.
+    """
+
+    content_addressed = True
+
+    def __init__(
+        self,
+        location: str | os.PathLike | None = None,
+        base_url: str | None = None,
+        file_permissions_mode: int | None = None,
+        directory_permissions_mode: int | None = None,
+        *,
+        blob_model: str | type[BaseContentBlob] = "ContentBlob",
+        hash_algorithm: str = "sha256",
+        shard_depth: int = 2,
+        shard_width: int = 2,
+    ) -> None:
+        """
+        Initializes the ContentAddressedStorage instance.
+
+        Args:
+            location (str | os.PathLike | None): The root directory of the blobs.
+                                                  If None, `settings.media_root` is used.
+            base_url (str | None): The base URL for serving the blobs.
+                                   If None, `settings.media_url` is used.
+            file_permissions_mode (int | None): The numeric mode for new files.
+            directory_permissions_mode (int | None): The numeric mode for new directories.
+            blob_model (str | type[BaseContentBlob]): The model counting the references or its
+                                                      name in the registry of the edgy instance.
+            hash_algorithm (str): The `hashlib` algorithm for the names.
+            shard_depth (int): The amount of directory levels.
+            shard_width (int): The amount of hex digits of the digest per directory level.
+        """
+        super().__init__(
+            location=location,
+            base_url=base_url,
+            file_permissions_mode=file_permissions_mode,
+            directory_permissions_mode=directory_permissions_mode,
+        )
+        self._blob_model = blob_model
+        self.hash_algorithm = hash_algorithm
+        self.shard_depth = shard_depth
+        self.shard_width = shard_width
+
+    @cached_property
+    def blob_model(self) -> type[BaseContentBlob]:
+        """The model counting the references of the blobs."""
+        if isinstance(self._blob_model, str):
+            from edgy import monkay
+
+            assert monkay.instance is not None, "No edgy instance set."
+            return cast(
+                "type[BaseContentBlob]", monkay.instance.registry.get_model(self._blob_model)
+            )
+        return self._blob_model
+
+    def get_name_for_digest(self, digest: str) -> str:
+        """
+        Returns the sharded name of a blob.
+
+        Args:
+            digest (str): The hex digest of the content.
+
+        Returns:
+            str: The name, e.g. `ab/cd/abcd...`.
+        """
+        width = self.shard_width
+        shards = [digest[i * width : (i + 1) * width] for i in range(self.shard_depth)]
+        return "/".join([*shards, digest])
+
+    def scan_content(self, content: BinaryIO, *, head_size: int = 2048) -> FileScan:
+        """
+        Hashes the content with `hash_algorithm` in one pass.
+
+        Args:
+            content (BinaryIO): The content to be saved.
+            head_size (int): The amount of bytes kept from the start.
+
+        Returns:
+            FileScan: The size, the digest and the head of the content.
+
+        Raises:
+            FileOperationError: If the content is not seekable.
+        """
+        if not getattr(content, "seekable", lambda: False)():
+            raise FileOperationError("ContentAddressedStorage requires seekable content.")
+        return scan_file(content, hash_algorithm=self.hash_algorithm, head_size=head_size)
+
+    def get_content_name(self, content: BinaryIO, name: str, scan: FileScan | None = None) -> str:
+        """
+        Returns the name derived from the hash of the content. The provided name is ignored.
+
+        Args:
+            content (BinaryIO): The content to be saved.
+            name (str): The provided or generated name.
+            scan (FileScan | None): The result of `scan_content`. The content is only read
+                                    when it is missing or has another hash algorithm.
+
+        Returns:
+            str: The name of the blob.
+
+        Raises:
+            FileOperationError: If the content is not seekable.
+        """
+        if scan is None or scan.hash_algorithm != self.hash_algorithm:
+            scan = self.scan_content(content, head_size=0)
+        assert scan.digest is not None
+        return self.get_name_for_digest(scan.digest)
+
+    def sanitize_name(self, name: str) -> str:
+        """
+        Validates that the name is a name of this storage (see `get_name_for_digest`).
+
+        Raises:
+            SuspiciousFileOperation: If the name wasn't generated by `get_content_name`.
+        """
+        name = str(name).replace("\\", "/")
+        digest = name.rsplit("/", 1)[-1]
+        if not _HEX_DIGEST.fullmatch(digest) or self.get_name_for_digest(digest) != name:
+            raise SuspiciousFileOperation(
+                detail=f'"{name}" is not a name of a content addressed storage.'
+            )
+        return name
+
+    def get_available_name(
+        self,
+        name: str,
+        max_length: int | None = None,
+        overwrite: bool = False,
+        multi_process_safe: bool | None = None,
+    ) -> str:
+        """
+        Returns the name unchanged: identical content is stored under the same name.
+        """
+        name = self.sanitize_name(name)
+        if max_length and len(name) > max_length:
+            raise SuspiciousFileOperation(
+                detail=f'The name "{name}" is longer than "max_length" ({max_length}).'
+            )
+        return name
+
+    def reserve_name(self, name: str) -> bool:
+        """Names of blobs don't need reservations."""
+        return True
+
+    def unreserve_name(self, name: str) -> bool:
+        """Names of blobs don't need reservations."""
+        return True
+
+    def _save(self, content: File, name: str) -> None:
+        """
+        Writes the blob if it doesn't exist yet. The content is written into a temporary
+        file which is renamed, so incomplete blobs are never visible.
+        """
+        full_path = self._get_full_path(name)
+        if os.path.exists(full_path):
+            # deduplicated
+            return
+        self._create_directory(full_path)
+        tmp_path = self._save_content(f"{full_path}.{uuid4().hex}.tmp", name, content)
+        try:
+            self._set_permissions(tmp_path)
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+
+    def save(self, content: Any, name: str = "") -> None:
+        """
+        Adds a reference to the blob and writes it if it doesn't exist yet.
+
+        The reference is counted in the database via `run_sync`, which blocks until the query
+        is done. Called from async code this blocks the event loop, use `asave` there (as
+        `FieldFile.execute_operation` does).
+
+        Args:
+            content (Any): The content to be saved.
+            name (str): The name from `get_content_name`. If empty, the `name` attribute
+                        of the `content` object is used.
+        """
+        run_sync(self.asave(content, name))
+
+    async def asave(self, content: Any, name: str = "") -> None:
+        """
+        Adds a reference to the blob and writes it if it doesn't exist yet.
+
+        Args:
+            content (Any): The content to be saved. Async streams are not supported as
+                           the name is derived from the complete content.
+            name (str): The name from `get_content_name`. If empty, the `name` attribute
+                        of the `content` object is used.
+        """
+        if is_async_readable(content):
+            raise FileOperationError("ContentAddressedStorage requires seekable content.")
+        if not name:
+            name = content.name
+        name = self.sanitize_name(name)
+        # The reference is added first, so a concurrent deletion of the last reference
+        # keeps (or restores) the blob.
+        await self._add_reference(name)
+        try:
+            await run_in_storage_thread(super().save, content, name)
+        except BaseException:
+            await self.adelete(name)
+            raise
+
+    def delete(self, name: str) -> None:
+        """
+        Removes a reference to the blob. The blob is deleted with the last reference.
+
+        Like `save`, this blocks on the database via `run_sync`. Use `adelete` in async code.
+
+        Args:
+            name (str): The name of the blob.
+        """
+        run_sync(self.adelete(name))
+
+    async def adelete(self, name: str) -> None:
+        """
+        Removes a reference to the blob. The blob is deleted with the last reference.
+
+        Args:
+            name (str): The name of the blob.
+
+        Raises:
+            ValueError: If `name` is empty.
+        """
+        if not name:
+            raise ValueError("The name must be given to delete().")
+        if not await self._remove_reference(name):
+            return
+        # Move the blob aside and check afterwards, if it was referenced again meanwhile.
+        full_path = self.path(name)
+        tombstone = f"{full_path}.{uuid4().hex}.deleted"
+        try:
+            await run_in_storage_thread(os.replace, full_path, tombstone)
+        except FileNotFoundError:
+            return
+        if await self._get_refcount(name):
+            await run_in_storage_thread(os.replace, tombstone, full_path)
+        else:
+            await run_in_storage_thread(os.remove, tombstone)
+
+    async def _add_reference(self, name: str) -> None:
+        """
+        Increments the reference count of a blob, creating the row if missing.
+
+        Args:
+            name (str): The name of the blob.
+        """
+        model = self.blob_model
+        table = model.table
+        async with model.database as database:
+            while True:
+                row_count = await database.execute(
+                    table.update()
+                    .where(table.c.name == name)
+                    .values(refcount=table.c.refcount + 1)
+                )
+                if row_count:
+                    return
+                try:
+                    # a savepoint, the failed insert must not abort the transaction of a caller
+                    async with database.transaction():
+                        await database.execute(table.insert().values(name=name, refcount=1))
+                except sqlalchemy.exc.IntegrityError:
+                    # inserted concurrently, increment it
+                    continue
+                return
+
+    async def _remove_reference(self, name: str) -> bool:
+        """
+        Decrements the reference count of a blob and removes the row of the last reference.
+
+        Args:
+            name (str): The name of the blob.
+
+        Returns:
+            bool: True if the last reference was removed.
+        """
+        model = self.blob_model
+        table = model.table
+        async with model.database as database, database.transaction():
+            await database.execute(
+                table.update().where(table.c.name == name).values(refcount=table.c.refcount - 1)
+            )
+            row_count = await database.execute(
+                table.delete().where(table.c.name == name, table.c.refcount <= 0)
+            )
+        return bool(row_count)
+
+    async def _get_refcount(self, name: str) -> int:
+        """
+        Returns the reference count of a blob.
+
+        Args:
+            name (str): The name of the blob.
+
+        Returns:
+            int: The reference count, 0 if there is no row.
+        """
+        model = self.blob_model
+        table = model.table
+        async with model.database as database:
+            refcount = await database.fetch_val(
+                sqlalchemy.select(table.c.refcount).where(table.c.name == name)
+            )
+        return refcount or 0
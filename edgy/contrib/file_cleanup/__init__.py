@@ -0,0 +1,4 @@
+from .models import BaseFileCleanup
+from .worker import process_file_cleanups, run_file_cleanup_worker
+
+__all__ = ["BaseFileCleanup", "process_file_cleanups", "run_file_cleanup_worker"]
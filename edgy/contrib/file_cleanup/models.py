@@ -0,0 +1,53 @@
+import edgy
+
+
+class BaseFileCleanup(edgy.Model):
+    """
+    Abstract base model for the queue of files to delete (an outbox table).
+
+    Rows are inserted in the transaction of the deletion of the model instance, so a
+    rollback also drops them and the files are kept. `process_file_cleanups` deletes the
+    queued files in batches.
+    """
+
+    storage: str = edgy.fields.CharField(max_length=100)
+    """
+    The name of the storage of the file.
+    """
+    name: str = edgy.fields.TextField()
+    """
+    The name of the file in the storage.
+    """
+    attempts: int = edgy.fields.IntegerField(default=0)
+    """
+    The amount of failed deletions.
+    """
+
+    @classmethod
+    async def enqueue(cls, storage: str, name: str) -> None:
+        """
+        Queues a file for deletion.
+
+        Args:
+            storage (str): The name of the storage.
+            name (str): The name of the file.
+        """
+        await cls.enqueue_many([{"storage": storage, "name": name}])
+
+    @classmethod
+    async def enqueue_many(cls, files: list[dict[str, str]]) -> None:
+        """
+        Queues files for deletion with a single statement.
+
+        Args:
+            files (list[dict[str, str]]): The `storage` and `name` of the files.
+        """
+        if not files:
+            return
+        async with cls.database as database:
+            await database.execute_many(
+                cls.table.insert(), [{**file, "attempts": 0} for file in files]
+            )
+
+    class Meta:
+        abstract = True
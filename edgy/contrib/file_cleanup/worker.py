@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+import anyio
+import sqlalchemy
+
+from edgy.conf import settings
+
+if TYPE_CHECKING:
+    from edgy.core.files.storage import StorageHandler
+
+    from .models import BaseFileCleanup
+
+logger = logging.getLogger(__name__)
+
+
+async def process_file_cleanups(
+    model: type[BaseFileCleanup],
+    *,
+    batch_size: int = 100,
+    concurrency: int | None = None,
+    storages: StorageHandler | None = None,
+    max_attempts: int | None = 10,
+) -> int:
+    """
+    Deletes a batch of queued files.
+
+    The rows are locked (`FOR UPDATE SKIP LOCKED` where supported), so multiple workers
+    don't delete the same files. Rows of deleted files are removed, failed deletions are
+    retried later. After `max_attempts` failed deletions the row is removed and the file
+    is logged as an error.
+
+    Args:
+        model (type[BaseFileCleanup]): The queue model.
+        batch_size (int): The maximum amount of files deleted.
+        concurrency (int | None): The maximum amount of concurrent deletions.
+                                  Defaults to the `file_storage_threads` setting.
+        storages (StorageHandler | None): The storages of the files. Defaults to the
+                                          storages of the edgy instance.
+        max_attempts (int | None): The amount of failed deletions after which a file
+                                   is dropped from the queue. None retries forever.
+
+    Returns:
+        int: The amount of deleted files. Smaller than `batch_size` when the queue is drained
+             (or deletions failed).
+    """
+    if storages is None:
+        from edgy.core.files.storage import storages as default_storages
+
+        storages = default_storages
+    limiter = anyio.CapacityLimiter(concurrency or settings.file_storage_threads)
+    table = model.table
+    deleted: list[Any] = []
+    failed: list[Any] = []
+
+    async def delete_file(row: Any) -> None:
+        async with limiter:
+            try:
+                await storages[row.storage].adelete(row.name)
+            except Exception:
+                logger.exception(
+                    "Could not delete the file %r of storage %r.", row.name, row.storage
+                )
+                failed.append(row)
+            else:
+                deleted.append(row.id)
+
+    async with model.database as database, database.transaction():
+        rows = await database.fetch_all(
+            sqlalchemy.select(table.c.id, table.c.storage, table.c.name, table.c.attempts)
+            .order_by(table.c.attempts, table.c.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        async with anyio.create_task_group() as task_group:
+            for row in rows:
+                task_group.start_soon(delete_file, row)
+        if deleted:
+            await database.execute(table.delete().where(table.c.id.in_(deleted)))
+        retried: list[Any] = []
+        dropped: list[Any] = []
+        for row in failed:
+            if max_attempts is None or row.attempts + 1 < max_attempts:
+                retried.append(row.id)
+                continue
+            dropped.append(row.id)
+            logger.error(
+                "Gave up deleting the file %r of storage %r after %s attempts.",
+                row.name,
+                row.storage,
+                row.attempts + 1,
+            )
+        if dropped:
+            await database.execute(table.delete().where(table.c.id.in_(dropped)))
+        if retried:
+            await database.execute(
+                table.update().where(table.c.id.in_(retried)).values(attempts=table.c.attempts + 1)
+            )
+    return len(deleted)
+
+
+async def run_file_cleanup_worker(
+    model: type[BaseFileCleanup],
+    *,
+    interval: float = 1.0,
+    batch_size: int = 100,
+    concurrency: int | None = None,
+    storages: StorageHandler | None = None,
+    max_attempts: int | None = 10,
+) -> None:
+    """
+    Deletes the queued files until cancelled. Run it as a background task, e.g. in the
+    lifespan of the application.
+
+    Args:
+        model (type[BaseFileCleanup]): The queue model.
+        interval (float): The seconds waited after the queue was drained.
+        batch_size (int): The maximum amount of files deleted per batch.
+        concurrency (int | None): The maximum amount of concurrent deletions.
+        storages (StorageHandler | None): The storages of the files.
+        max_attempts (int | None): The amount of failed deletions after which a file
+                                   is dropped from the queue. None retries forever.
+    """
+    while True:
+        deleted = await process_file_cleanups(
+            model,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            storages=storages,
+            max_attempts=max_attempts,
+        )
+        if deleted < batch_size:
+            await anyio.sleep(interval)
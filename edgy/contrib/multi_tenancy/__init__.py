@@ -1,5 +1,12 @@
 from .base import TenantModel
+from .databases import TenantDatabaseManager, TenantDatabaseRouter
 from .registry import TenantRegistry
 from .settings import TenancySettings
 
-__all__ = ["TenantModel", "TenantRegistry", "TenancySettings"]
+__all__ = [
+    "TenantModel",
+    "TenantDatabaseManager",
+    "TenantDatabaseRouter",
+    "TenantRegistry",
+    "TenancySettings",
+]
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import weakref
+from collections.abc import Callable
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from edgy.core.connection.database import Database, DatabaseURL
+from edgy.core.db.context_vars import get_tenant
+from edgy.core.db.models.managers import Manager
+
+if TYPE_CHECKING:
+    from edgy.core.db.querysets.queryset import QuerySet
+
+logger = logging.getLogger(__name__)
+
+TenantDatabaseResolver = Callable[[str], "str | DatabaseURL | Database | None"]
+"""
+Maps a tenant to the url of its database. `None` falls back to the database of the model.
+"""
+
+
+class TenantDatabaseStats(NamedTuple):
+    """
+    Metrics of a `TenantDatabaseRouter`.
+
+    Attributes:
+        hits: Lookups served by a known database.
+        misses: Lookups which resolved a new database.
+        evictions: Pools disconnected because `max_pools` was exceeded.
+        pools: Amount of connected pools.
+        idle: Amount of connected pools without active users.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    pools: int
+    idle: int
+
+
+class TenantDatabase(Database):
+    """
+    Database of a tenant managed by a `TenantDatabaseRouter`.
+
+    The pool is opened on the first use and kept open by the router until it is evicted.
+    """
+
+    connects_lazily: bool = True
+
+    def __init__(
+        self,
+        *args: Any,
+        tenant: str = "",
+        router: TenantDatabaseRouter | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.tenant = tenant
+        self._router = weakref.ref(router) if router is not None else None
+        self._pinned = False
+        self.last_used = time.monotonic()
+
+    @property
+    def is_idle(self) -> bool:
+        # the pin of the router is the only reference
+        return self._pinned and self.ref_counter <= 1
+
+    async def connect(self) -> bool:
+        router = self._router() if self._router is not None else None
+        self.last_used = time.monotonic()
+        if router is not None and not self._pinned and router._owns(self):
+            self._pinned = True
+            try:
+                await super().connect()
+            except BaseException:
+                self._pinned = False
+                raise
+            await router._evict(keep=self)
+        return await super().connect()
+
+    async def disconnect(self, force: bool = False, **kwargs: Any) -> bool:
+        self.last_used = time.monotonic()
+        result = await super().disconnect(force, **kwargs)
+        router = self._router() if self._router is not None else None
+        if router is not None and self.is_idle:
+            # the limit may be exceeded while pools are in use
+            await router._evict()
+        return result
+
+    async def unpin(self) -> bool:
+        """
+        Releases the reference of the router. The pool is closed when it is unused.
+        """
+        if not self._pinned:
+            return False
+        self._pinned = False
+        return await self.disconnect()
+
+
+class TenantDatabaseRouter:
+    """
+    Routes tenants to their own databases (database-per-tenant).
+
+    The databases are resolved lazily via `resolver` and their pools are opened on the first
+    query. At most `max_pools` pools are kept open, the least recently used idle pools are
+    disconnected first. Pools in use are never evicted, so the limit can be exceeded
+    temporarily. `None` disables the limit.
+
+    Example:
+
+    ```python
+    router = TenantDatabaseRouter(lambda tenant: f"postgresql+asyncpg://db/{tenant}")
+
+
+    class Product(edgy.Model):
+        query: ClassVar[Manager] = TenantDatabaseManager(router=router)
+    ```
+    """
+
+    def __init__(
+        self,
+        resolver: TenantDatabaseResolver,
+        *,
+        max_pools: int | None = 100,
+        database_options: dict[str, Any] | None = None,
+    ) -> None:
+        self.resolver = resolver
+        self.max_pools = max_pools
+        self.database_options = database_options or {}
+        # ordered from least to most recently used
+        self._databases: dict[str, TenantDatabase] = {}
+        self._lock = asyncio.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> TenantDatabaseStats:
+        pools = [database for database in self._databases.values() if database._pinned]
+        return TenantDatabaseStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            pools=len(pools),
+            idle=sum(1 for database in pools if database.is_idle),
+        )
+
+    def idle_pools(self) -> dict[str, float]:
+        """
+        Returns the seconds since the last use of the connected, unused pools by tenant.
+        """
+        now = time.monotonic()
+        return {
+            tenant: now - database.last_used
+            for tenant, database in self._databases.items()
+            if database.is_idle
+        }
+
+    def get_database(self, tenant: str) -> Database | None:
+        """
+        Returns the database of `tenant` or None when the resolver has no database for it.
+
+        The pool is not opened here but on the first use of the database.
+        """
+        database = self._databases.pop(tenant, None)
+        if database is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            value = self.resolver(tenant)
+            if value is None:
+                return None
+            database = TenantDatabase(value, tenant=tenant, router=self, **self.database_options)
+        # reinsert as most recently used
+        self._databases[tenant] = database
+        return database
+
+    def _owns(self, database: TenantDatabase) -> bool:
+        if database.tenant not in self._databases:
+            # evicted databases can be reused by querysets holding them
+            self._databases[database.tenant] = database
+        return self._databases[database.tenant] is database
+
+    async def _evict(self, keep: TenantDatabase | None = None) -> None:
+        if self.max_pools is None:
+            return
+        async with self._lock:
+            pools = [database for database in self._databases.values() if database._pinned]
+            excess = len(pools) - self.max_pools
+            for database in pools:
+                if excess <= 0:
+                    break
+                if database is keep or not database.is_idle:
+                    continue
+                excess -= 1
+                self.evictions += 1
+                del self._databases[database.tenant]
+                try:
+                    await database.unpin()
+                except Exception:
+                    logger.exception(f"Failed to disconnect database of tenant {database.tenant}.")
+
+    async def disconnect_idle(self, max_idle: float = 0) -> int:
+        """
+        Disconnects the pools which are unused for at least `max_idle` seconds.
+
+        Returns:
+            The amount of disconnected pools.
+        """
+        count = 0
+        async with self._lock:
+            for tenant, idle in self.idle_pools().items():
+                if idle >= max_idle:
+                    await self._databases.pop(tenant).unpin()
+                    count += 1
+        return count
+
+    async def disconnect(self) -> None:
+        """
+        Disconnects all pools of the router.
+        """
+        async with self._lock:
+            databases = list(self._databases.values())
+            self._databases.clear()
+            await asyncio.gather(*(database.unpin() for database in databases))
+
+    async def __aenter__(self) -> TenantDatabaseRouter:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        await self.disconnect()
+
+
+class TenantDatabaseManager(Manager):
+    """
+    Manager which routes the queries to the database of the tenant set via `with_tenant`.
+
+    With a tenant database the queries use the default tables of the model instead of the
+    tenant schema. Without an active tenant, or when the router has no database for it,
+    the manager behaves like `Manager`.
+    """
+
+    def __init__(self, *, router: TenantDatabaseRouter | None = None, **kwargs: Any) -> None:
+        self.router = router
+        super().__init__(**kwargs)
+
+    def get_queryset(self) -> QuerySet:
+        assert self.owner is not None
+        tenant = get_tenant()
+        if self.instance is None and self.router is not None and tenant is not None:
+            database = self.router.get_database(tenant)
+            if database is not None:
+                # the tenant is selected by the database, not by the schema
+                return self.queryset_class(self.owner, using_schema=None, database=database)
+        return super().get_queryset()
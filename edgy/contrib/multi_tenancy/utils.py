@@ -1,6 +1,8 @@
-from edgy.core.tenancy.utils import create_schema, create_tables
+from edgy.core.tenancy.utils import clone_schema, create_schema, create_tables, provision_tenants
 
 __all__ = [
+    "clone_schema",
     "create_tables",
     "create_schema",
+    "provision_tenants",
 ]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import sys
-from collections.abc import AsyncGenerator, Hashable, Iterable
+from collections.abc import AsyncGenerator, AsyncIterator, Hashable, Iterable
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
 from pydantic import BaseModel
@@ -54,6 +56,53 @@ class Page(BasePage):
 
 
 PageType = TypeVar("PageType", bound=BasePage)
+T = TypeVar("T")
+
+
+async def prefetch_pages(pages: AsyncIterator[T], prefetch: int) -> AsyncGenerator[T, None]:
+    """
+    Reads up to `prefetch` pages of `pages` ahead in a background task.
+
+    The next pages are fetched while the consumer processes the current one.
+    The buffer is bounded, the task waits when it is full. Exceptions of the
+    task are raised in the consumer.
+
+    Args:
+        pages (AsyncIterator[T]): The pages, e.g. of `paginate`.
+        prefetch (int): The maximum amount of pages buffered.
+
+    Yields:
+        T: The pages in the order of `pages`.
+    """
+    queue: asyncio.Queue[tuple[bool, Any]] = asyncio.Queue(maxsize=max(prefetch, 1))
+
+    async def producer() -> None:
+        try:
+            async for page in pages:
+                await queue.put((True, page))
+        except Exception as exc:
+            await queue.put((False, exc))
+        else:
+            await queue.put((False, None))
+        finally:
+            # close the query when the consumer stopped early
+            aclose = getattr(pages, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    task = asyncio.create_task(producer())
+    try:
+        while True:
+            is_page, value = await queue.get()
+            if not is_page:
+                if value is not None:
+                    raise value
+                break
+            yield value
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
 
 
 class BasePaginator(Generic[PageType]):
@@ -438,9 +487,77 @@ class NumberedPaginator(BasePaginator[Page]):
     This paginator calculates and provides pages based on an explicit page number
     and a fixed page size. It returns `Page` objects, which include `current_page`,
     `next_page`, and `previous_page` numbers for easy navigation.
+
+    Args:
+        estimate_threshold (int | None): If set, `get_total` (and `get_amount_pages`) use
+            the row estimate of the database statistics instead of counting when the
+            estimate is at least this threshold. Defaults to `None` (always count).
+        count_cache_ttl (float): If set, the exact counts are cached for this amount of
+            seconds and refreshed in the background (see `edgy.core.db.querysets.counting`).
+            Defaults to 0 (no cache).
     """
 
-    async def paginate(self, start_page: int = 1) -> AsyncGenerator[Page, None]:
+    def __init__(
+        self,
+        queryset: QuerySet,
+        page_size: int,
+        next_item_attr: str = "",
+        previous_item_attr: str = "",
+        *,
+        estimate_threshold: int | None = None,
+        count_cache_ttl: float = 0,
+    ) -> None:
+        super().__init__(
+            queryset=queryset,
+            page_size=page_size,
+            next_item_attr=next_item_attr,
+            previous_item_attr=previous_item_attr,
+        )
+        self.estimate_threshold = estimate_threshold
+        self.count_cache_ttl = count_cache_ttl
+        self._total: tuple[int, bool] | None = None
+
+    def clear_caches(self) -> None:
+        super().clear_caches()
+        self._total = None
+
+    def get_reverse_paginator(self) -> Self:
+        if self._reverse_paginator is None:
+            reverse_paginator = super().get_reverse_paginator()
+            reverse_paginator.estimate_threshold = self.estimate_threshold
+            reverse_paginator.count_cache_ttl = self.count_cache_ttl
+        return super().get_reverse_paginator()
+
+    async def get_total(self) -> int:
+        """
+        Retrieves the total number of items in the queryset.
+
+        Depending on `estimate_threshold` and `count_cache_ttl` it is an estimate or a
+        cached count, `total_is_estimate` tells if it was estimated.
+
+        Returns:
+            int: The (estimated) total count of items in the queryset.
+        """
+        if self._total is None:
+            from edgy.core.db.querysets.counting import get_total
+
+            self._total = await get_total(
+                self.queryset,
+                estimate_threshold=self.estimate_threshold,
+                cache_ttl=self.count_cache_ttl,
+            )
+        return self._total[0]
+
+    @property
+    def total_is_estimate(self) -> bool:
+        """
+        True if the last retrieved total is an estimate of the database.
+        """
+        return self._total is not None and self._total[1]
+
+    async def paginate(
+        self, start_page: int = 1, *, prefetch: int = 0
+    ) -> AsyncGenerator[Page, None]:
         """
         Paginates through the queryset using offset and limit, yielding `Page` objects.
 
@@ -452,11 +569,18 @@ class NumberedPaginator(BasePaginator[Page]):
         Args:
             start_page (int): The page number from which to start pagination.
                 Must be a positive integer. Defaults to 1.
+            prefetch (int): The amount of pages fetched ahead in a background task
+                while the current page is processed (see `prefetch_pages`).
+                Defaults to 0 (no prefetching).
 
         Yields:
             AsyncGenerator[Page, None]: An asynchronous generator that yields
             `Page` objects, each representing a numbered page of results.
         """
+        if prefetch > 0:
+            async for page in prefetch_pages(self.paginate(start_page), prefetch):
+                yield page
+            return
         query = self.queryset
         # Calculate the offset if starting from a page other than 1.
         if start_page > 1:
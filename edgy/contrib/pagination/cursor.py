@@ -1,13 +1,98 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import copy
+import datetime
+import decimal
+import enum
+import json
+import sys
+import uuid
 from collections.abc import AsyncGenerator, Hashable, Iterable
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from .base import BasePage, BasePaginator
+import sqlalchemy
+
+from edgy.core.db.fields.base import BaseForeignKey
+from edgy.core.db.querysets.clauses import and_, not_, or_, parse_clause_arg
+from edgy.core.db.relationships.utils import crawl_relationship
+
+from .base import BasePage, BasePaginator, prefetch_pages
 
 if TYPE_CHECKING:
     from edgy.core.db.models.types import BaseModelType
     from edgy.core.db.querysets import QuerySet
+    from edgy.core.db.querysets.types import QuerySetType, tables_and_models_type
+
+if sys.version_info >= (3, 11):  # pragma: no cover
+    from typing import Self
+else:  # pragma: no cover
+    from typing_extensions import Self
+
+_token_types: dict[str, Any] = {
+    "dt": datetime.datetime.fromisoformat,
+    "d": datetime.date.fromisoformat,
+    "t": datetime.time.fromisoformat,
+    "td": lambda value: datetime.timedelta(seconds=float(value)),
+    "dec": decimal.Decimal,
+    "uuid": uuid.UUID,
+    "b": base64.urlsafe_b64decode,
+}
+
+
+def _encode_token_value(value: Any) -> Any:
+    # the subclasses first, datetime is a date
+    if isinstance(value, datetime.datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"d": value.isoformat()}
+    if isinstance(value, datetime.time):
+        return {"t": value.isoformat()}
+    if isinstance(value, datetime.timedelta):
+        return {"td": str(value.total_seconds())}
+    if isinstance(value, decimal.Decimal):
+        return {"dec": str(value)}
+    if isinstance(value, uuid.UUID):
+        return {"uuid": str(value)}
+    if isinstance(value, bytes):
+        return {"b": base64.urlsafe_b64encode(value).decode()}
+    if isinstance(value, enum.Enum):
+        return _encode_token_value(value.value)
+    return value
+
+
+def encode_cursor(vector: tuple[Hashable, ...]) -> str:
+    """
+    Encodes a cursor vector into an opaque, url safe token.
+
+    Besides json types datetimes, dates, times, timedeltas, decimals, uuids, bytes and the
+    values of enums are supported. The token is not signed, it is only an opaque wrapper of
+    the values of the ordering fields.
+    """
+    data = json.dumps([_encode_token_value(value) for value in vector], separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> tuple[Hashable, ...]:
+    """
+    Decodes a token of `encode_cursor` into a cursor vector.
+
+    Raises:
+        ValueError: If the token is invalid.
+    """
+    try:
+        data = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        if not isinstance(data, list):
+            raise ValueError("not a list")
+        return tuple(
+            _token_types[next(iter(value))](next(iter(value.values())))
+            if isinstance(value, dict)
+            else value
+            for value in data
+        )
+    except (ValueError, TypeError, KeyError, StopIteration, binascii.Error) as exc:
+        raise ValueError(f"Invalid cursor token: {token!r}") from exc
 
 
 class CursorPage(BasePage):
@@ -55,14 +140,28 @@ class CursorPaginator(BasePaginator[CursorPage]):
             that will be used to store a reference to the 'previous' item in the
             logical sequence across pages. This is for client-side linking.
             Defaults to an empty string.
+        cursor_tokens (bool): Use opaque string tokens (see `encode_cursor`) as
+            cursors instead of the values of the ordering fields. Defaults to False.
+        row_values (bool | None): Compare multi-column cursors as row values
+            `(a, b) > (:a, :b)`. Requires the same direction for all ordering fields,
+            otherwise the expanded OR-chain is used. Defaults to None (depending on
+            the dialect, see `row_value_dialects`).
     """
 
+    # dialects supporting row value comparisons
+    row_value_dialects: ClassVar[frozenset[str]] = frozenset(
+        {"postgresql", "sqlite", "mysql", "mariadb", "cockroachdb"}
+    )
+
     def __init__(
         self,
         queryset: QuerySet,
         page_size: int,
         next_item_attr: str = "",
         previous_item_attr: str = "",
+        *,
+        cursor_tokens: bool = False,
+        row_values: bool | None = None,
     ) -> None:
         super().__init__(
             queryset=queryset,
@@ -70,37 +169,110 @@ class CursorPaginator(BasePaginator[CursorPage]):
             next_item_attr=next_item_attr,
             previous_item_attr=previous_item_attr,
         )
+        self.cursor_tokens = cursor_tokens
+        self.row_values = row_values
         # Cache for pages fetched in reverse order.
         self._reverse_page_cache: dict[Hashable, CursorPage] = {}
+        # The last items of the fetched pages by their vectors, they precede the next pages.
+        self._trailing_items: dict[Hashable, BaseModelType] = {}
         # The search vector is computed based on the queryset's ordering,
         # used to construct cursor-based WHERE clauses.
         self.search_vector = self.calculate_search_vector()
 
     def calculate_search_vector(self) -> tuple[str, ...]:
         """
-        Calculates the search vector used for filtering based on the `order_by` criteria.
+        Calculates the strict lookups of the `order_by` criteria (e.g., "id__gt", "name__lt").
 
-        The search vector constructs a tuple of filter strings (e.g., "id__gte", "name__lt")
-        from the `order_by` fields. This is crucial for building the WHERE clause that
-        enables cursor-based pagination, determining how to fetch items strictly after
-        (or before, for reverse) a given cursor. For all but the last ordering criterion,
-        `__gte` (or `__lte` for descending) is used, and for the last criterion,
-        `__gt` (or `__lt` for descending) is used to ensure strict ordering and avoid duplicates.
+        The lookups are combined by `get_cursor_filter` into a lexicographic comparison
+        selecting the items strictly after a cursor.
 
         Returns:
-            tuple[str, ...]: A tuple of strings representing the search vector,
-            ready to be used in a `filter()` operation with corresponding cursor values.
+            tuple[str, ...]: A tuple of lookups, one per ordering criterion.
+        """
+        return tuple(
+            f"{criteria[1:]}__lt" if criteria.startswith("-") else f"{criteria}__gt"
+            for criteria in self.order_by
+        )
+
+    def use_row_values(self, queryset: QuerySetType) -> bool:
         """
-        # For all but the last ordering criteria, use >= (or <= for descending).
-        vector = [
-            f"{criteria[1:]}__lte" if criteria.startswith("-") else f"{criteria}__gte"
-            for criteria in self.order_by[:-1]
-        ]
-        # For the last ordering criterion, use > (or < for descending) for strict progression.
-        criteria = self.order_by[-1]
-        vector.append(f"{criteria[1:]}__lt" if criteria.startswith("-") else f"{criteria}__gt")
+        Returns if the cursor filter compares row values for `queryset`.
+        """
+        if len(self.order_by) < 2 or len({criteria[0] == "-" for criteria in self.order_by}) > 1:
+            return False
+        if self.row_values is not None:
+            return self.row_values
+        return queryset.database.url.dialect in self.row_value_dialects
+
+    def get_cursor_filter(self, vector: tuple[Hashable, ...]) -> Any:
+        """
+        Returns the filter selecting the items strictly after `vector` in the order of
+        the paginator.
 
-        return tuple(vector)
+        Multi-column cursors are compared lexicographically. If the dialect supports it and
+        all ordering fields have the same direction the filter is a row value comparison
+        `(a, b, c) > (:a, :b, :c)`, which uses a composite index. Otherwise it is the expanded
+        OR-chain `a >= :a AND (a > :a OR (a = :a AND b < :b) OR ...)`, supporting mixed
+        ascending and descending fields.
+
+        Args:
+            vector (tuple[Hashable, ...]): The cursor vector.
+
+        Returns:
+            Any: A clause for `QuerySet.filter`.
+        """
+        fields = [criteria.lstrip("-") for criteria in self.order_by]
+        if len(fields) == 1:
+            return and_.from_kwargs(**{self.search_vector[0]: vector[0]})
+        first_lookup = f"{fields[0]}__{'lte' if self.order_by[0][0] == '-' else 'gte'}"
+        chain_filter = and_(
+            # the bound on the first field lets the database use an index range scan
+            and_.from_kwargs(**{first_lookup: vector[0]}),
+            or_(
+                *(
+                    and_.from_kwargs(
+                        **dict(zip(fields[:i], vector[:i], strict=False)),
+                        **{self.search_vector[i]: vector[i]},
+                    )
+                    for i in range(len(fields))
+                )
+            ),
+        )
+
+        async def wrapper(
+            queryset: QuerySetType, tables_and_models: tables_and_models_type
+        ) -> Any:
+            if not self.use_row_values(queryset):
+                return await parse_clause_arg(chain_filter, queryset, tables_and_models)
+            columns: list[Any] = []
+            for field_path in fields:
+                model_class, field_name, _, related_str, _, cross_db_remainder = (
+                    crawl_relationship(queryset.model_class, field_path)
+                )
+                field = model_class.meta.fields.get(field_name)
+                table = tables_and_models[related_str][0]
+                # foreign keys and cross database fields are compared via their lookups
+                if (
+                    cross_db_remainder
+                    or field is None
+                    or isinstance(field, BaseForeignKey)
+                    or field_name not in table.columns
+                ):
+                    return await parse_clause_arg(chain_filter, queryset, tables_and_models)
+                columns.append(table.columns[field_name])
+            row = sqlalchemy.tuple_(*columns)
+            values = sqlalchemy.tuple_(
+                *(
+                    sqlalchemy.bindparam(None, value, type_=column.type)
+                    for value, column in zip(vector, columns, strict=False)
+                )
+            )
+            return row < values if self.order_by[0][0] == "-" else row > values
+
+        wrapper._edgy_force_callable_queryset_filter = True
+        if hasattr(chain_filter, "_edgy_calculate_select_related"):
+            wrapper._edgy_calculate_select_related = chain_filter._edgy_calculate_select_related
+        return wrapper
 
     def cursor_to_vector(self, cursor: Hashable) -> tuple[Hashable, ...]:
         """
@@ -122,6 +294,8 @@ class CursorPaginator(BasePaginator[CursorPage]):
             AssertionError: If `order_by` has more than one element and a
                 non-tuple `cursor` is provided, indicating an inconsistency.
         """
+        if self.cursor_tokens and isinstance(cursor, str):
+            return decode_cursor(cursor)
         if isinstance(cursor, tuple):
             return cursor
         # If order_by has multiple fields but a single cursor is provided, it's an error.
@@ -146,6 +320,8 @@ class CursorPaginator(BasePaginator[CursorPage]):
         Returns:
             Hashable: The cursor value, either a single hashable or a tuple of hashables.
         """
+        if self.cursor_tokens:
+            return encode_cursor(vector)
         if len(self.order_by) > 1:
             return vector
         return vector[0]
@@ -197,6 +373,14 @@ class CursorPaginator(BasePaginator[CursorPage]):
         """
         super().clear_caches()
         self._reverse_page_cache.clear()
+        self._trailing_items.clear()
+
+    def get_reverse_paginator(self) -> Self:
+        if self._reverse_paginator is None:
+            reverse_paginator = super().get_reverse_paginator()
+            reverse_paginator.cursor_tokens = self.cursor_tokens
+            reverse_paginator.row_values = self.row_values
+        return super().get_reverse_paginator()
 
     def convert_to_page(
         self, inp: Iterable, /, cursor: Hashable | None, is_first: bool, reverse: bool = False
@@ -264,9 +448,7 @@ class CursorPaginator(BasePaginator[CursorPage]):
         rpaginator = self.get_reverse_paginator()
         # Filter the reversed queryset using the search vector (appropriate for reverse lookup)
         # and limit to 1 to get only the immediate preceding item.
-        return await rpaginator.queryset.filter(
-            **dict(zip(rpaginator.search_vector, vector, strict=False))
-        ).limit(1)
+        return await rpaginator.queryset.filter(rpaginator.get_cursor_filter(vector)).limit(1)
 
     async def exists_extra_before(self, cursor: Hashable) -> bool:
         """
@@ -287,9 +469,32 @@ class CursorPaginator(BasePaginator[CursorPage]):
         # Get the reverse paginator instance.
         rpaginator = self.get_reverse_paginator()
         # Use `exists()` on the filtered reversed queryset for an efficient check.
-        return await rpaginator.queryset.filter(
-            **dict(zip(rpaginator.search_vector, vector, strict=False))
-        ).exists()
+        return await rpaginator.queryset.filter(rpaginator.get_cursor_filter(vector)).exists()
+
+    async def _get_item_at_cursor(self, vector: tuple[Hashable, ...]) -> list[BaseModelType]:
+        """
+        Returns the item at the cursor or, if it is gone, the item preceding it.
+
+        The trailing item of a fetched page is reused, so walking the pages doesn't
+        query it again.
+        """
+        trailing = self._trailing_items.get(vector)
+        if trailing is not None:
+            # the links are set on a copy, the item is part of the previous page
+            return [copy.copy(trailing)]
+        return await (
+            self.get_reverse_paginator()
+            .queryset.filter(not_(self.get_cursor_filter(vector)))
+            .limit(1)
+        )
+
+    async def _exists_item_at_cursor(self, vector: tuple[Hashable, ...]) -> bool:
+        """
+        Checks if an item exists at or before the cursor, reusing the trailing items.
+        """
+        if vector in self._trailing_items:
+            return True
+        return await self.queryset.filter(not_(self.get_cursor_filter(vector))).exists()
 
     async def _get_page_after(
         self,
@@ -327,18 +532,19 @@ class CursorPaginator(BasePaginator[CursorPage]):
         query = self.queryset.limit(self.page_size + 1) if self.page_size else self.queryset
         if vector is not None:
             # Apply cursor-based filtering using the calculated search vector.
-            query = query.filter(**dict(zip(self.search_vector, vector, strict=False)))
+            query = query.filter(self.get_cursor_filter(vector))
 
         # Determine if this is the logical first page.
         is_first = vector is None
 
         resultarr: list[BaseModelType]
         # If not the first page and previous_item_attr is used,
-        # fetch the item immediately before the current cursor.
+        # fetch the item at the current cursor, it precedes the page.
         if not is_first and self.previous_item_attr:
+            assert vector is not None
             # Use `injected_extra` if provided, otherwise fetch it.
             resultarr = (
-                await self.get_extra_before(self.vector_to_cursor(vector))
+                await self._get_item_at_cursor(vector)
                 if injected_extra is None
                 else injected_extra
             )
@@ -354,9 +560,11 @@ class CursorPaginator(BasePaginator[CursorPage]):
             injected_extra.extend(await query)
             resultarr = injected_extra
         else:
-            # If no cursor or no previous item logic, check for existence of extra before.
-            if not is_first and not await self.exists_extra_before(self.vector_to_cursor(vector)):
-                is_first = True
+            # If no cursor or no previous item logic, check for an item preceding the page.
+            if not is_first:
+                assert vector is not None
+                if not await self._exists_item_at_cursor(vector):
+                    is_first = True
             resultarr = await query
 
         # Convert the collected items into a CursorPage object.
@@ -367,6 +575,9 @@ class CursorPaginator(BasePaginator[CursorPage]):
             is_first=is_first,
             reverse=reverse,
         )
+        if page_obj.content and not reverse:
+            trailing = page_obj.content[-1]
+            self._trailing_items[self.obj_to_vector(trailing)] = trailing
         return page_obj, resultarr
 
     async def get_page_after(self, cursor: Hashable | None = None) -> CursorPage:
@@ -493,7 +704,11 @@ class CursorPaginator(BasePaginator[CursorPage]):
             return await self.get_page_after(cursor)
 
     async def paginate(
-        self, start_cursor: Hashable | None = None, stop_cursor: Hashable | None = None
+        self,
+        start_cursor: Hashable | None = None,
+        stop_cursor: Hashable | None = None,
+        *,
+        prefetch: int = 0,
     ) -> AsyncGenerator[CursorPage, None]:
         """
         Paginates through the queryset using cursors, yielding `CursorPage` objects.
@@ -508,11 +723,20 @@ class CursorPaginator(BasePaginator[CursorPage]):
             stop_cursor (Hashable | None): The cursor at which to cease pagination.
                 Pages will be yielded up to, but not including, the page identified
                 by this cursor. If `None`, pagination continues until the end of the dataset.
+            prefetch (int): The amount of pages fetched ahead in a background task
+                while the current page is processed (see `prefetch_pages`).
+                Defaults to 0 (no prefetching).
 
         Yields:
             AsyncGenerator[CursorPage, None]: An asynchronous generator that yields
             `CursorPage` objects, each representing a paginated chunk of data.
         """
+        if prefetch > 0:
+            async for cursor_page in prefetch_pages(
+                self.paginate(start_cursor, stop_cursor), prefetch
+            ):
+                yield cursor_page
+            return
         query = self.queryset
         prefill_container: list[Any] = []  # Used to store an extra item for linking.
         start_vector: tuple[Hashable, ...] | None = None
@@ -521,19 +745,17 @@ class CursorPaginator(BasePaginator[CursorPage]):
             # Convert the start cursor to its vector representation.
             start_vector = self.cursor_to_vector(start_cursor)
             # Apply cursor-based filtering to the queryset.
-            query = query.filter(**dict(zip(self.search_vector, start_vector, strict=False)))
-            # If `previous_item_attr` is used, try to fetch the item immediately before
-            # the `start_cursor` to correctly determine `is_first` for the initial page.
+            query = query.filter(self.get_cursor_filter(start_vector))
+            # If `previous_item_attr` is used, try to fetch the item at the `start_cursor`
+            # to link it and to correctly determine `is_first` for the initial page.
             if self.previous_item_attr:
-                prefill_container = await self.get_extra_before(start_cursor)
+                prefill_container = await self._get_item_at_cursor(start_vector)
 
         if stop_cursor is not None:
             # If a `stop_cursor` is provided, apply a reverse filter to the queryset
             # to limit results up to that point.
             stop_vector = self.cursor_to_vector(stop_cursor)
-            query = query.filter(
-                **dict(zip(self.get_reverse_paginator().search_vector, stop_vector, strict=False))
-            )
+            query = query.filter(self.get_reverse_paginator().get_cursor_filter(stop_vector))
 
         # Initialize `current_cursor` for the yielded pages.
         current_cursor: Hashable | None = (
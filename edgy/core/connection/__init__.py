@@ -1,4 +1,5 @@
 from .database import Database, DatabaseURL
+from .reflection_cache import ReflectionCache
 from .registry import Registry
 
-__all__ = ["Database", "DatabaseURL", "Registry"]
+__all__ = ["Database", "DatabaseURL", "ReflectionCache", "Registry"]
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import sqlalchemy
+
+if TYPE_CHECKING:
+    from edgy.core.connection.database import Database
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+Fingerprint = str | Callable[[sqlalchemy.Connection], str]
+"""
+A fixed fingerprint (e.g. the migration head) or a callable computing it on a connection.
+"""
+
+
+def catalog_fingerprint(connection: sqlalchemy.Connection) -> str:
+    """
+    Computes a checksum of the table definitions in the catalog of the database.
+
+    PostgreSQL computes the checksum server side, SQLite hashes the schema sql and other
+    dialects hash the columns of the information schema.
+    """
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        return str(
+            connection.exec_driver_sql(
+                "SELECT md5(coalesce(string_agg(definition, ',' ORDER BY definition), '')) FROM ("
+                " SELECT concat_ws(':', table_schema, table_name, column_name, data_type,"
+                "  is_nullable, column_default, character_maximum_length) AS definition"
+                " FROM information_schema.columns"
+                " WHERE table_schema NOT IN ('pg_catalog', 'information_schema')"
+                " UNION ALL"
+                " SELECT concat_ws(':', n.nspname, c.relname, con.conname,"
+                "  pg_get_constraintdef(con.oid)) FROM pg_constraint con"
+                " JOIN pg_class c ON c.oid = con.conrelid"
+                " JOIN pg_namespace n ON n.oid = c.relnamespace"
+                " WHERE n.nspname NOT IN ('pg_catalog', 'information_schema')"
+                " UNION ALL"
+                " SELECT concat_ws(':', schemaname, tablename, indexdef) FROM pg_indexes"
+                " WHERE schemaname NOT IN ('pg_catalog', 'information_schema')"
+                ") AS definitions"
+            ).scalar()
+        )
+    if dialect == "sqlite":
+        rows = connection.exec_driver_sql(
+            "SELECT type, name, sql FROM sqlite_master ORDER BY type, name"
+        ).all()
+    else:
+        rows = connection.exec_driver_sql(
+            "SELECT table_schema, table_name, column_name, data_type, is_nullable,"
+            " column_default FROM information_schema.columns"
+            " ORDER BY table_schema, table_name, column_name"
+        ).all()
+    return hashlib.md5(repr(rows).encode(), usedforsecurity=False).hexdigest()
+
+
+class _Entry:
+    __slots__ = ("fingerprint", "metadata", "table_names", "refresh_task")
+
+    def __init__(
+        self,
+        fingerprint: str,
+        metadata: sqlalchemy.MetaData | None = None,
+        table_names: dict[str | None, list[str]] | None = None,
+    ) -> None:
+        self.fingerprint = fingerprint
+        self.metadata = metadata if metadata is not None else sqlalchemy.MetaData()
+        # the listed table names by schema
+        self.table_names: dict[str | None, list[str]] = table_names or {}
+        self.refresh_task: asyncio.Task | None = None
+
+
+class ReflectionCache:
+    """
+    On-disk cache of reflected table definitions, shared by `ReflectModel` and
+    `AutoReflectModel` reflection of a registry.
+
+    The cache of a database is valid as long as its fingerprint matches. By default the
+    fingerprint is a checksum of the catalog (see `catalog_fingerprint`), a fixed value like
+    the migration head skips this query.
+
+    With `stale_while_revalidate` the cached tables are used without checking the
+    fingerprint first. The check and, on a mismatch, the re-reflection of the cached tables
+    run in the background and take effect on the next start.
+
+    The cache files are pickles and must only be written by trusted processes.
+
+    Example:
+
+    ```python
+    registry = edgy.Registry(
+        "postgresql+asyncpg://...",
+        reflection_cache=ReflectionCache(".edgy_reflection_cache"),
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        *,
+        fingerprint: Fingerprint = catalog_fingerprint,
+        stale_while_revalidate: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.fingerprint = fingerprint
+        self.stale_while_revalidate = stale_while_revalidate
+        self._entries: dict[str, _Entry] = {}
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    def get_path(self, database: Database) -> Path:
+        """
+        Returns the path of the cache file of `database`. The url is hashed.
+        """
+        digest = hashlib.sha256(str(database.url).encode()).hexdigest()[:32]
+        return self.directory / f"{digest}.pickle"
+
+    async def compute_fingerprint(self, database: Database) -> str:
+        if isinstance(self.fingerprint, str):
+            return self.fingerprint
+        async with database:
+            return str(await database.run_sync(self.fingerprint))
+
+    async def reflect_tables(
+        self,
+        database: Database,
+        schema: str | None,
+        table_names: Sequence[str] | Callable[[Sequence[str]], Sequence[str]],
+    ) -> list[sqlalchemy.Table]:
+        """
+        Returns the tables of `schema`, only reflecting the tables missing in the cache.
+
+        Args:
+            database: The database.
+            schema: The schema of the tables.
+            table_names: The names of the tables or a filter selecting them from the
+                listed table names of the schema. The listing is cached too.
+
+        Returns:
+            The cached tables. Copy them before adding them to another MetaData.
+        """
+        entry = await self._get_entry(database)
+        changed = False
+        if callable(table_names):
+            listed = entry.table_names.get(schema)
+            if listed is None:
+                async with database:
+                    listed = await database.run_sync(_get_table_names, schema)
+                entry.table_names[schema] = listed
+                changed = True
+            names = list(table_names(listed))
+        else:
+            names = list(table_names)
+        missing = [name for name in names if _table_key(name, schema) not in entry.metadata.tables]
+        self.hits += len(names) - len(missing)
+        if missing:
+            self.misses += len(missing)
+            async with database:
+                metadata = await database.run_sync(_reflect, schema, missing)
+            _merge_metadata(metadata, entry.metadata)
+            changed = True
+        if changed:
+            await self._save(database, entry)
+        return [entry.metadata.tables[_table_key(name, schema)] for name in names]
+
+    async def wait_for_refresh(self) -> None:
+        """
+        Waits for the pending background refreshes.
+        """
+        tasks = [entry.refresh_task for entry in self._entries.values() if entry.refresh_task]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def clear(self, database: Database | None = None) -> None:
+        """
+        Removes the cached tables of `database` or of all databases from memory and disk.
+        """
+        if database is not None:
+            self._entries.pop(str(database.url), None)
+            self.get_path(database).unlink(missing_ok=True)
+            return
+        self._entries.clear()
+        if self.directory.exists():
+            for path in self.directory.glob("*.pickle"):
+                path.unlink(missing_ok=True)
+
+    async def _get_entry(self, database: Database) -> _Entry:
+        key = str(database.url)
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        cached = await asyncio.to_thread(
+            self._load, self.get_path(database), _get_header(database)
+        )
+        if cached is not None and self.stale_while_revalidate:
+            entry = cached
+            entry.refresh_task = asyncio.create_task(self._refresh(database, entry))
+        else:
+            fingerprint = await self.compute_fingerprint(database)
+            if cached is not None and cached.fingerprint == fingerprint:
+                entry = cached
+            else:
+                entry = _Entry(fingerprint)
+        # concurrent loads of the same file are harmless, the first one wins
+        return self._entries.setdefault(key, entry)
+
+    async def _refresh(self, database: Database, entry: _Entry) -> None:
+        try:
+            fingerprint = await self.compute_fingerprint(database)
+            if fingerprint == entry.fingerprint:
+                return
+            new_entry = _Entry(fingerprint)
+            cached_names: dict[str | None, list[str]] = {}
+            for table in entry.metadata.tables.values():
+                cached_names.setdefault(table.schema, []).append(table.name)
+            async with database:
+                for schema in {*cached_names, *entry.table_names}:
+                    listed = await database.run_sync(_get_table_names, schema)
+                    if schema in entry.table_names:
+                        new_entry.table_names[schema] = listed
+                    names = [name for name in cached_names.get(schema, ()) if name in listed]
+                    if names:
+                        metadata = await database.run_sync(_reflect, schema, names)
+                        _merge_metadata(metadata, new_entry.metadata)
+            self.refreshes += 1
+            self._entries[str(database.url)] = new_entry
+            await self._save(database, new_entry)
+        except Exception:
+            logger.exception("Failed to refresh the reflection cache.")
+
+    def _load(self, path: Path, header: dict[str, Any]) -> _Entry | None:
+        if not path.exists():
+            return None
+        try:
+            with path.open("rb") as f:
+                data: dict[str, Any] = pickle.load(f)  # noqa: S301
+        except Exception:
+            logger.warning(f"Ignoring the unreadable reflection cache file {path}.", exc_info=True)
+            return None
+        # pickled tables of another SQLAlchemy version or dialect are not reusable
+        if any(data.get(key) != value for key, value in header.items()):
+            return None
+        return _Entry(data["fingerprint"], data["metadata"], data["table_names"])
+
+    async def _save(self, database: Database, entry: _Entry) -> None:
+        data = pickle.dumps(
+            {
+                **_get_header(database),
+                "fingerprint": entry.fingerprint,
+                "metadata": entry.metadata,
+                "table_names": entry.table_names,
+            }
+        )
+        await asyncio.to_thread(_write_atomic, self.get_path(database), data)
+
+
+def _get_header(database: Database) -> dict[str, Any]:
+    return {
+        "version": CACHE_FORMAT_VERSION,
+        "sqlalchemy": sqlalchemy.__version__,
+        "dialect": database.url.dialect,
+    }
+
+
+def _table_key(name: str, schema: str | None) -> str:
+    return f"{schema}.{name}" if schema else name
+
+
+def _get_table_names(connection: sqlalchemy.Connection, schema: str | None) -> list[str]:
+    return sqlalchemy.inspect(connection).get_table_names(schema=schema)
+
+
+def _reflect(
+    connection: sqlalchemy.Connection, schema: str | None, names: list[str]
+) -> sqlalchemy.MetaData:
+    # a fresh MetaData, concurrent reflections must not see half reflected tables
+    metadata = sqlalchemy.MetaData()
+    metadata.reflect(connection, schema=schema, only=names)
+    return metadata
+
+
+def _merge_metadata(source: sqlalchemy.MetaData, target: sqlalchemy.MetaData) -> None:
+    for key, table in source.tables.items():
+        if key not in target.tables:
+            table.to_metadata(target)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+        f.write(data)
+    os.replace(f.name, path)
+
+
+def copy_table(table: sqlalchemy.Table, metadata: sqlalchemy.MetaData) -> sqlalchemy.Table:
+    """
+    Copies a cached table and the tables referenced by its foreign keys into `metadata`.
+
+    Tables already in `metadata` are reused.
+    """
+    existing = metadata.tables.get(table.key)
+    if existing is not None:
+        return existing
+    copy = table.to_metadata(metadata)
+    for foreign_key in table.foreign_keys:
+        referenced = table.metadata.tables.get(foreign_key.target_fullname.rsplit(".", 1)[0])
+        if referenced is not None:
+            copy_table(referenced, metadata)
+    return copy
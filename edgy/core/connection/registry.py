@@ -2,17 +2,19 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import gc
 import logging
 import re
+import time
 import warnings
 from collections import defaultdict
-from collections.abc import Callable, Container, Generator, Iterable, Mapping, Sequence
+from collections.abc import Awaitable, Callable, Container, Generator, Iterable, Mapping, Sequence
 from contextlib import AsyncExitStack
 from copy import copy as shallow_copy
 from functools import cached_property, partial
 from itertools import chain
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, cast, overload
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, NamedTuple, cast, overload
 
 import sqlalchemy
 from monkay.asgi import ASGIApp, LifespanHook
@@ -24,6 +26,7 @@ from edgy.conf import settings
 from edgy.core.connection.database import Database, DatabaseURL
 from edgy.core.connection.schemas import Schema
 from edgy.core.db.context_vars import CURRENT_INSTANCE, FORCE_FIELDS_NULLABLE
+from edgy.core.db.schema_cache import schema_table_cache
 from edgy.core.utils.concurrency import run_concurrently
 from edgy.core.utils.sync import current_eventloop, run_sync
 from edgy.types import Undefined
@@ -31,6 +34,7 @@ from edgy.types import Undefined
 if TYPE_CHECKING:
     from edgy.conf.global_settings import EdgySettings
     from edgy.contrib.autoreflection.models import AutoReflectModel
+    from edgy.core.connection.reflection_cache import ReflectionCache
     from edgy.core.db.models.types import BaseModelType
 
 logger = logging.getLogger(__name__)
@@ -206,6 +210,33 @@ class MetaDataByUrlDict(dict):
     copy = __copy__
 
 
+class PrewarmReport(NamedTuple):
+    """
+    Summary of `Registry.prewarm`.
+
+    Attributes:
+        models: Amount of initialized models.
+        statements: Amount of compiled statements.
+        timings: The duration of the steps in seconds.
+        duration: The total duration in seconds.
+    """
+
+    models: int
+    statements: int
+    timings: dict[str, float]
+    duration: float
+
+
+def _matches_pattern_model(pattern_model: type[AutoReflectModel], table_name: str) -> bool:
+    """
+    Checks the table name against the include and exclude pattern of a pattern model.
+    """
+    meta = pattern_model.meta
+    if not meta.include_pattern.match(table_name):
+        return False
+    return not (meta.exclude_pattern and meta.exclude_pattern.match(table_name))
+
+
 class Registry:
     """
     The command center for the models of Edgy. This class manages database
@@ -233,6 +264,7 @@ class Registry:
         schema: str | None = None,
         extra: Mapping[str, Database | str] | None = None,
         automigrate_config: EdgySettings | None = None,
+        reflection_cache: ReflectionCache | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -258,11 +290,15 @@ class Registry:
                                                      If provided, migrations
                                                      will be run on connection.
                                                      Defaults to None.
+            reflection_cache (ReflectionCache | None): An on-disk cache of the
+                reflected tables of `ReflectModel` and `AutoReflectModel`
+                models. Defaults to None.
             **kwargs (Any): Additional keyword arguments passed to the Database
                             constructor if `database` is a string or DatabaseURL.
         """
         self.db_schema = schema
         self._automigrate_config = automigrate_config
+        self.reflection_cache = reflection_cache
         self._is_automigrated: bool = False
         extra = extra or {}
         self.database: Database = (
@@ -472,7 +508,11 @@ class Registry:
                 content_type = self.content_type
         # Create a new Registry instance with basic settings.
         _copy = Registry(
-            self.database, with_content_type=content_type, schema=self.db_schema, extra=self.extra
+            self.database,
+            with_content_type=content_type,
+            schema=self.db_schema,
+            extra=self.extra,
+            reflection_cache=self.reflection_cache,
         )
         # Copy models from different registry types.
         for registry_type in self.model_registry_types:
@@ -701,12 +741,56 @@ class Registry:
                 return True
         return False
 
+    def _get_dependent_models(
+        self, models: Iterable[str | type[BaseModelType]]
+    ) -> dict[type[BaseModelType], None]:
+        """
+        Returns the models sharing a table with `models` and, transitively, the models
+        referencing these tables via foreign keys. Their tables must be rebuilt together,
+        otherwise the foreign keys point to the columns of the outdated tables.
+        """
+        # keyed by (database url, tablename)
+        by_table: defaultdict[tuple[str, str], list[type[BaseModelType]]] = defaultdict(list)
+        references: defaultdict[tuple[str, str], list[type[BaseModelType]]] = defaultdict(list)
+        for model_class in chain(
+            self.models.values(), self.tenant_models.values(), self.reflected.values()
+        ):
+            by_table[(str(model_class.database.url), model_class.meta.tablename)].append(
+                model_class
+            )
+            for field_name in model_class.meta.foreign_key_fields:
+                try:
+                    target = model_class.meta.fields[field_name].target
+                except Exception:  # noqa: S112
+                    # unresolved target, not yet in any metadata
+                    continue
+                references[(str(target.database.url), target.meta.tablename)].append(model_class)
+
+        affected: dict[type[BaseModelType], None] = {}
+        pending: list[tuple[str, str]] = []
+        for model in models:
+            if isinstance(model, str):
+                model = self.get_model(model, include_content_type_attr=False)
+            affected[model] = None
+            pending.append((str(model.database.url), model.meta.tablename))
+        seen = set(pending)
+        while pending:
+            table_key = pending.pop()
+            for model_class in chain(by_table[table_key], references[table_key]):
+                affected[model_class] = None
+                dependent_key = (str(model_class.database.url), model_class.meta.tablename)
+                if dependent_key not in seen:
+                    seen.add(dependent_key)
+                    pending.append(dependent_key)
+        return affected
+
     def refresh_metadata(
         self,
         *,
         update_only: bool = False,
         multi_schema: bool | re.Pattern | str = False,
         ignore_schema_pattern: re.Pattern | str | None = "information_schema",
+        models: Iterable[str | type[BaseModelType]] | None = None,
         _schemes_tree: dict[str | None, tuple[str, sqlalchemy.MetaData, list[str]]] | None = None,
     ) -> None:
         """
@@ -724,10 +808,25 @@ class Registry:
             ignore_schema_pattern (re.Pattern | str | None): A regex pattern
                 or string to ignore certain schemas during multi-schema reflection.
                 Defaults to "information_schema".
-        """
+            models (Iterable[str | type[BaseModelType]] | None): Only refresh the
+                tables of these added or changed models and of the models referencing
+                them via foreign keys. The other tables and caches are kept.
+                Defaults to None (all models).
+        """
+        affected: dict[type[BaseModelType], None] | None = None
+        if models is not None:
+            affected = self._get_dependent_models(models)
         if not update_only:
-            for val in self.metadata_by_name.values():
-                val.clear()  # Clear existing metadata if not just updating.
+            if affected is None:
+                for val in self.metadata_by_name.values():
+                    val.clear()  # Clear existing metadata if not just updating.
+            else:
+                for model_class in affected:
+                    # remove the outdated tables, also the ones of replaced models
+                    metadata = self.metadata_by_url[str(model_class.database.url)]
+                    for table in list(metadata.tables.values()):
+                        if table.name == model_class.meta.tablename:
+                            metadata.remove(table)
 
         maindatabase_url = str(self.database.url)
         # Determine schemes to process based on multi_schema setting.
@@ -753,15 +852,19 @@ class Registry:
 
         # clear data
         if not update_only:
-            for model_class in chain(
-                self.tenant_models.values(), self.models.values(), self.reflected.values()
+            for model_class in (
+                chain(self.tenant_models.values(), self.models.values(), self.reflected.values())
+                if affected is None
+                else affected
             ):
                 model_class._table = None  # Clear cached table.
-                model_class._db_schemas = {}  # Clear cached db schemas.
+                schema_table_cache.invalidate(model_class)  # Clear cached db schemas.
         db_schema = self.db_schema or ""
         # Iterate through all registered models.
         # In case of models which double as tenant models, we check the regular case
         for model_class in self.models.values():
+            if affected is not None and model_class not in affected:
+                continue
             url = str(model_class.database.url)
             if url in schemes_tree:
                 extra_key, schemes = schemes_tree[url]
@@ -798,6 +901,8 @@ class Registry:
 
         # Iterate through all registered tenant models (not necessarily in models).
         for model_class in self.tenant_models.values():
+            if affected is not None and model_class not in affected:
+                continue
             url = str(model_class.database.url)
             if url in schemes_tree:
                 extra_key, schemes = schemes_tree[url]
@@ -824,6 +929,7 @@ class Registry:
         update_only: bool = False,
         multi_schema: bool | re.Pattern | str = False,
         ignore_schema_pattern: re.Pattern | str | None = "information_schema",
+        models: Iterable[str | type[BaseModelType]] | None = None,
     ) -> None:
         """
         Refreshes the SQLAlchemy MetaData objects associated with the models
@@ -840,6 +946,9 @@ class Registry:
             ignore_schema_pattern (re.Pattern | str | None): A regex pattern
                 or string to ignore certain schemas during multi-schema reflection.
                 Defaults to "information_schema".
+            models (Iterable[str | type[BaseModelType]] | None): Only refresh the
+                tables of these models and of the models referencing them.
+                Defaults to None (all models).
 
         Difference to refresh_metadata: if multi_schema is in use, don't use a second loop
         """
@@ -850,6 +959,7 @@ class Registry:
             update_only=update_only,
             multi_schema=multi_schema,
             ignore_schema_pattern=ignore_schema_pattern,
+            models=models,
             _schemes_tree=_schemes_tree,
         )
 
@@ -1016,6 +1126,114 @@ class Registry:
         for model_class in self.reflected.values():
             model_class.meta.invalidate(clear_class_attrs=clear_class_attrs)
 
+    def prewarm_schema_tables(
+        self, schemas: Iterable[str], models: Iterable[str] | None = None
+    ) -> None:
+        """
+        Builds the per-schema table copies of models into the `schema_table_cache`,
+        e.g. for the tenants active at startup.
+
+        Args:
+            schemas (Iterable[str]): The schemas to build the tables for.
+            models (Iterable[str] | None): The names of the models. Defaults to the
+                tenant models or when there are none to all models.
+        """
+        if models is None:
+            model_classes = list((self.tenant_models or self.models).values())
+        else:
+            model_classes = [self.get_model(name) for name in models]
+        schema_table_cache.prewarm(model_classes, schemas)
+
+    def prewarm(
+        self,
+        *,
+        schemas: Iterable[str] = (),
+        compile_statements: bool = True,
+        freeze: bool = True,
+    ) -> PrewarmReport:
+        """
+        Eagerly builds the lazy model state, e.g. before forking the workers of a server.
+
+        The fields, column mappers, tables and proxy models of all models are initialized,
+        the common statements (select, get by primary key, insert, update and delete) are
+        built and compiled and at last `gc.freeze()` moves the objects to the permanent
+        generation. The forked workers share them copy-on-write instead of building them
+        on the first requests.
+
+        Args:
+            schemas (Iterable[str]): Schemas to build the table copies for,
+                see `prewarm_schema_tables`.
+            compile_statements (bool): Build and compile the common statements.
+            freeze (bool): Call `gc.freeze()` after the warm-up.
+
+        Returns:
+            PrewarmReport: The amount of models and statements and the timings.
+        """
+        start = time.perf_counter()
+        timings: dict[str, float] = {}
+        model_classes = [*self.models.values(), *self.reflected.values()]
+
+        def measure(step: str, last: float) -> float:
+            now = time.perf_counter()
+            timings[step] = now - last
+            return now
+
+        last = start
+        self.init_models(init_class_attrs=False)
+        last = measure("init_models", last)
+        for model_class in model_classes:
+            for attr in ("table", "pknames", "pkcolumns"):
+                getattr(model_class, attr)
+        last = measure("tables", last)
+        for model_class in model_classes:
+            model_class.proxy_model  # noqa: B018
+        last = measure("proxy_models", last)
+        schemas = list(schemas)
+        if schemas:
+            self.prewarm_schema_tables(schemas)
+            last = measure("schema_tables", last)
+        statements = 0
+        if compile_statements:
+            statements = run_sync(self._prewarm_statements(model_classes))
+            last = measure("statements", last)
+        if freeze:
+            gc.collect()
+            gc.freeze()
+            last = measure("gc_freeze", last)
+        return PrewarmReport(
+            models=len(model_classes),
+            statements=statements,
+            timings=timings,
+            duration=last - start,
+        )
+
+    async def _prewarm_statements(self, model_classes: Sequence[type[BaseModelType]]) -> int:
+        dialects: dict[str, sqlalchemy.Dialect] = {}
+        count = 0
+        for model_class in model_classes:
+            url = model_class.database.url
+            dialect = dialects.get(str(url))
+            if dialect is None:
+                dialect = dialects[str(url)] = url.sqla_url.get_dialect()()
+            table = model_class.table
+            pk_clause = sqlalchemy.and_(
+                *(
+                    column == sqlalchemy.bindparam(f"pk_{column.key}")
+                    for column in table.primary_key
+                )
+            )
+            statements = [
+                await model_class.query.all().as_select(),
+                table.select().where(pk_clause),
+                table.insert(),
+                table.update().where(pk_clause),
+                table.delete().where(pk_clause),
+            ]
+            for statement in statements:
+                statement.compile(dialect=dialect)
+            count += len(statements)
+        return count
+
     def get_tablenames(self) -> set[str]:
         """
         Returns a set of all table names associated with the models registered
@@ -1066,6 +1284,75 @@ class Registry:
 
         await asyncio.to_thread(self._automigrate_update, migration_settings)
 
+    async def _reflect_pattern_tables(
+        self, name: str | None, database: Database
+    ) -> list[sqlalchemy.Table]:
+        """
+        Reflects the tables matched by the pattern models of the database `name`.
+
+        Only the table names are listed upfront, the matching tables are reflected afterwards
+        in one batch per schema. The schemas are reflected concurrently. With a
+        `reflection_cache` the listing and the tables are taken from the cache.
+
+        Args:
+            name (str | None): The name of the database (None for the default).
+            database (Database): The connected database.
+
+        Returns:
+            list[sqlalchemy.Table]: The reflected tables ordered by schema.
+        """
+        patterns_by_schema: dict[str | None, list[type[AutoReflectModel]]] = {}
+        for pattern_model in self.pattern_models.values():
+            if name not in pattern_model.meta.databases:
+                continue
+            for schema in pattern_model.meta.schemes:
+                patterns_by_schema.setdefault(schema, []).append(pattern_model)
+
+        def select_table_names(
+            table_names: Sequence[str], pattern_models: list[type[AutoReflectModel]]
+        ) -> list[str]:
+            return [
+                table_name
+                for table_name in table_names
+                if any(
+                    _matches_pattern_model(pattern_model, table_name)
+                    for pattern_model in pattern_models
+                )
+            ]
+
+        def reflect_schema(
+            connection: sqlalchemy.Connection,
+            schema: str | None,
+            pattern_models: list[type[AutoReflectModel]],
+        ) -> list[sqlalchemy.Table]:
+            table_names = select_table_names(
+                sqlalchemy.inspect(connection).get_table_names(schema=schema), pattern_models
+            )
+            if not table_names:
+                return []
+            metadata = sqlalchemy.MetaData()
+            # the dialects supporting it reflect all tables with one query per kind
+            metadata.reflect(connection, schema=schema, only=table_names)
+            return [
+                metadata.tables[f"{schema}.{table_name}" if schema else table_name]
+                for table_name in table_names
+            ]
+
+        ops: list[Awaitable[list[sqlalchemy.Table]]] = []
+        for schema, pattern_models in patterns_by_schema.items():
+            if self.reflection_cache is not None:
+                ops.append(
+                    self.reflection_cache.reflect_tables(
+                        database,
+                        schema,
+                        partial(select_table_names, pattern_models=pattern_models),
+                    )
+                )
+            else:
+                ops.append(database.run_sync(reflect_schema, schema, pattern_models))
+        results = await run_concurrently(ops, limit=settings.orm_registry_ops_limit)
+        return list(chain.from_iterable(results))
+
     async def _connect_and_init(self, name: str | None, database: Database) -> None:
         """
         Internal asynchronous method to connect to a database and initialize
@@ -1088,27 +1375,18 @@ class Registry:
         if not self.pattern_models or name in self.dbs_reflected:
             return  # No pattern models to reflect or already reflected.
 
-        schemes: set[None | str] = set()
-        for pattern_model in self.pattern_models.values():
-            if name not in pattern_model.meta.databases:
-                continue
-            schemes.update(pattern_model.meta.schemes)
-
-        tmp_metadata = sqlalchemy.MetaData()
-        for schema in schemes:
-            await database.run_sync(tmp_metadata.reflect, schema=schema)
-
         try:
-            for table in tmp_metadata.tables.values():
+            tables = await self._reflect_pattern_tables(name, database)
+            for table in tables:
                 for pattern_model in self.pattern_models.values():
-                    if name not in pattern_model.meta.databases or table.schema not in schemes:
+                    if (
+                        name not in pattern_model.meta.databases
+                        or table.schema not in pattern_model.meta.schemes
+                    ):
                         continue
                     assert pattern_model.meta.model is pattern_model
                     # table.key would contain the schema name
-                    if not pattern_model.meta.include_pattern.match(table.name) or (
-                        pattern_model.meta.exclude_pattern
-                        and pattern_model.meta.exclude_pattern.match(table.name)
-                    ):
+                    if not _matches_pattern_model(pattern_model, table.name):
                         continue
                     if pattern_model.fields_not_supported_by_table(table):
                         continue
@@ -6,6 +6,7 @@ from sqlalchemy.exc import DBAPIError, ProgrammingError
 
 from edgy.core.connection.database import Database
 from edgy.core.db.context_vars import NO_GLOBAL_FIELD_CONSTRAINTS
+from edgy.core.db.schema_cache import schema_table_cache
 from edgy.exceptions import SchemaError
 from edgy.types import Undefined
 
@@ -98,13 +99,16 @@ class Schema:
                          initialization within the schema.
         """
         tenant_tables: list[sqlalchemy.Table] = []
+        schema_tables: list[sqlalchemy.Table] = []
         # If init_models is True, iterate through all registered models and
         # update their table schema and cache.
         if init_models:
             for model_class in self.registry.models.values():
                 # only init if no schema is set. This prevents problems with e.g. reflection.
                 if model_class.__using_schema__ is Undefined:
-                    model_class.table_schema(schema=schema, update_cache=update_cache)
+                    schema_tables.append(
+                        model_class.table_schema(schema=schema, update_cache=update_cache)
+                    )
 
         # If init_tenant_models is True, handle the creation of tenant-specific model tables.
         if init_tenant_models:
@@ -144,9 +148,22 @@ class Schema:
                 )
             # If init_models is True, create all registered model tables within the schema.
             if init_models:
-                self.registry.metadata_by_name[name].create_all(
-                    connection, checkfirst=if_not_exists
+                metadata = self.registry.metadata_by_name[name]
+                metadata.create_all(connection, checkfirst=if_not_exists)
+                # the schema copies live in a shared per-schema metadata
+                schema_metadata = (
+                    schema_table_cache.get_metadata(metadata, schema, create=False)
+                    if schema
+                    else None
                 )
+                if schema_metadata is not None:
+                    schema_metadata.create_all(
+                        connection,
+                        checkfirst=if_not_exists,
+                        tables=[
+                            table for table in schema_tables if table.metadata is schema_metadata
+                        ],
+                    )
 
         # Iterate through the specified databases to perform schema creation.
         for database_name in databases:
@@ -161,8 +178,9 @@ class Schema:
             async with db as db:
                 with db.force_rollback(False):
                     # run the operation sequencially because we need the right context and
-                    # a connected database
-                    await db.run_sync(execute_create, database_name)
+                    # a connected database. All DDL is issued in one transaction.
+                    async with db.transaction():
+                        await db.run_sync(execute_create, database_name)
 
     async def drop_schema(
         self,
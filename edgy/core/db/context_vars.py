@@ -3,7 +3,7 @@ from __future__ import annotations
 from collections.abc import Generator, Iterable
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
-from typing import TYPE_CHECKING, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 from warnings import warn
 
 if TYPE_CHECKING:
@@ -76,6 +76,13 @@ MODEL_GETATTR_BEHAVIOR: ContextVar[Literal["passdown", "load", "coro"]] = Contex
     "MODEL_GETATTR_BEHAVIOR", default="load"
 )
 
+# Context variable collecting the files queued for cleanup during the model based deletion
+# of a queryset, per cleanup model. A batch of deleted models inserts its rows at once
+# (see `BaseFileCleanup.enqueue_many`). None outside of such a deletion.
+CURRENT_FILE_CLEANUPS: ContextVar[dict[Any, list[dict[str, Any]]] | None] = ContextVar(
+    "CURRENT_FILE_CLEANUPS", default=None
+)
+
 # Context variable to store the current tenant. This is used in multi-tenant
 # environments to scope database operations to a specific tenant's data.
 # Defaults to None, indicating no specific tenant is active.
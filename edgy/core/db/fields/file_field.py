@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import mimetypes
 from collections.abc import Callable, Sequence
 from functools import cached_property, partial
@@ -8,6 +9,7 @@ from typing import (
     Any,
     BinaryIO,
     Literal,
+    cast,
 )
 
 import orjson
@@ -15,7 +17,9 @@ import sqlalchemy
 from pydantic import PlainSerializer
 from pydantic.json_schema import SkipJsonSchema, WithJsonSchema
 
+from edgy.conf import settings
 from edgy.core.db.context_vars import (
+    CURRENT_FILE_CLEANUPS,
     CURRENT_MODEL_INSTANCE,
     CURRENT_PHASE,
     EXPLICIT_SPECIFIED_VALUES,
@@ -29,8 +33,10 @@ from edgy.core.files.storage import storages
 from edgy.exceptions import FieldDefinitionError
 
 if TYPE_CHECKING:
+    from edgy.core.connection.registry import Registry
     from edgy.core.db.fields.types import BaseFieldType
     from edgy.core.db.models.types import BaseModelType
+    from edgy.core.files.scan import FileScan
     from edgy.core.files.storage import Storage
 
 # List of keywords to be ignored during kwargs processing in `FileField` factory.
@@ -469,11 +475,41 @@ class ConcreteFileField(BaseCompositeField):
 
         This method triggers the `delete` operation on the `FieldFile` instance,
         which handles the immediate deletion of the associated file from storage.
+        If the `file_cleanup_model` setting is set, the file is queued in its table
+        instead and deleted later by a worker. Files of instances deleted on another
+        database than the one of the cleanup model are deleted instantly, the queued row
+        wouldn't be part of the transaction of the deletion.
 
         Args:
             value (FieldFile): The `FieldFile` instance associated with the field.
         """
-        value.delete(instant=True)
+        cleanup_model_name = settings.file_cleanup_model
+        # files of unnamed storages can't be resolved by the worker
+        if not cleanup_model_name or not value or not value.storage.name:
+            await value.adelete(instant=True)
+            return
+        registry = cast("Registry", self.owner.meta.registry)
+        cleanup_model: Any = registry.get_model(cleanup_model_name)
+        instance = CURRENT_MODEL_INSTANCE.get()
+        if instance is not None:
+            # unwrap e.g. the proxy of the search_path tenancy, it uses the same connection
+            database = getattr(instance.database, "wrapped_database", instance.database)
+            if database is not cleanup_model.database:
+                await value.adelete(instant=True)
+                return
+        value.reset()  # Reset any pending operations first.
+        if getattr(value, "file", None):
+            value.close()
+        # in the transaction of the deletion, a rollback keeps the file
+        queued_files = CURRENT_FILE_CLEANUPS.get()
+        if queued_files is None:
+            await cleanup_model.enqueue(value.storage.name, value.name)
+        else:
+            # queryset deletions insert the rows of a batch at once
+            queued_files.setdefault(cleanup_model, []).append(
+                {"storage": value.storage.name, "name": value.name}
+            )
+        value._finish_instant_delete(None)
 
 
 def json_serializer(field_file: FieldFile) -> FileStruct | None:
@@ -515,6 +551,11 @@ class FileField(FieldFactory):
 
     field_type: Any = Any  # The Pydantic type for the file field, usually Any.
     field_bases: tuple = (ConcreteFileField,)  # The base concrete field class.
+    # The amount of bytes read from the start of the file for extracting metadata.
+    scan_head_size: int = 2048
+    # Whether the metadata always needs the first bytes of the file. Otherwise the file is
+    # only read for hashing or python-magic.
+    scan_always: bool = False
 
     def __new__(
         cls,
@@ -524,6 +565,7 @@ class FileField(FieldFactory):
         with_approval: bool = False,
         extract_mime: bool | Literal["approved_only"] = True,
         mime_use_magic: bool = False,
+        hash_algorithm: str | None = None,
         field_file_class: type[FieldFile] = FieldFile,
         generate_name_fn: (
             Callable[[BaseModelType | None, File | BinaryIO, str, bool], str] | None
@@ -548,6 +590,9 @@ class FileField(FieldFactory):
                                                            `"approved_only"`. Defaults to `True`.
             mime_use_magic (bool): Whether to use `python-magic` for MIME type detection.
                                    Defaults to `False`.
+            hash_algorithm (str | None): The `hashlib` algorithm used for hashing the content
+                                         into the metadata. Hashing reads the whole file
+                                         while saving. Defaults to `None` (disabled).
             field_file_class (type[FieldFile]): Custom `FieldFile` class to use.
             generate_name_fn (Callable[[BaseModelType | None, File | BinaryIO, str, bool], str] | None):
                 Custom function for generating file names.
@@ -620,6 +665,11 @@ class FileField(FieldFactory):
                 raise FieldDefinitionError(
                     "python-magic library is missing. Cannot use mime_use_magic parameter"
                 ) from None
+        hash_algorithm = kwargs.get("hash_algorithm")
+        if hash_algorithm and hash_algorithm not in hashlib.algorithms_available:
+            raise FieldDefinitionError(
+                f'Unknown hash_algorithm "{hash_algorithm}" for FileField or ImageField.'
+            ) from None
 
     @classmethod
     def get_column_type(cls, kwargs: dict[str, Any]) -> Any:
@@ -649,12 +699,13 @@ class FileField(FieldFactory):
         cls, field_obj: BaseFieldType, field_name: str, field_file: FieldFile
     ) -> dict[str, Any]:
         """
-        Extracts metadata (like MIME type) from the file.
+        Extracts metadata (like size, hash and MIME type) from the file.
 
-        This method extracts the MIME type based on `extract_mime` and
-        `mime_use_magic` settings. If `mime_use_magic` is `True`, it uses
-        `python-magic` to detect the MIME type from the file's buffer.
-        Otherwise, it falls back to `mimetypes.guess_type`.
+        The file is read once (see `FieldFile.scan`) and the results are passed to
+        `extract_scan_metadata`. The file is only read when the metadata needs its
+        content (hashing, python-magic or `scan_always`), otherwise the scan is None.
+        When the file and its approval are unchanged, the stored metadata is reused
+        without touching the file.
 
         Args:
             field_obj (BaseFieldType): The field object itself.
@@ -664,18 +715,64 @@ class FileField(FieldFactory):
         Returns:
             dict[str, Any]: A dictionary containing extracted metadata, e.g., `{"mime": "image/jpeg"}`.
         """
+        if (
+            field_file.operation == "none"
+            and field_file.metadata
+            and (field_file.old is None or field_file.old[2] == field_file.approved)
+        ):
+            return dict(field_file.metadata)
+        hash_algorithm = getattr(field_obj, "hash_algorithm", None)
+        scan = (
+            field_file.scan(hash_algorithm=hash_algorithm, head_size=cls.scan_head_size)
+            if hash_algorithm or cls.scan_always or getattr(field_obj, "mime_use_magic", False)
+            else None
+        )
+        return cls.extract_scan_metadata(
+            field_obj, field_name=field_name, field_file=field_file, scan=scan
+        )
+
+    @classmethod
+    def extract_scan_metadata(
+        cls,
+        field_obj: BaseFieldType,
+        field_name: str,
+        field_file: FieldFile,
+        scan: FileScan | None,
+    ) -> dict[str, Any]:
+        """
+        Builds the metadata from the scan of the file.
+
+        The size and the hash (stored under the name of the algorithm) are taken from the scan.
+        The MIME type is extracted based on `extract_mime` and `mime_use_magic` settings.
+        If `mime_use_magic` is `True`, `python-magic` detects the MIME type from the first
+        bytes of the file. Otherwise, it falls back to `mimetypes.guess_type`.
+
+        Args:
+            field_obj (BaseFieldType): The field object itself.
+            field_name (str): The name of the field.
+            field_file (FieldFile): The `FieldFile` instance from which to extract metadata.
+            scan (FileScan | None): The scan of the file, None if the file wasn't read.
+
+        Returns:
+            dict[str, Any]: A dictionary containing extracted metadata, e.g.,
+                            `{"size": 10, "sha256": "...", "mime": "image/jpeg"}`.
+        """
         data: dict[str, Any] = {}
+        if scan is not None:
+            data["size"] = scan.size
+            if scan.digest is not None:
+                data[field_obj.hash_algorithm] = scan.digest
         # Check if MIME extraction is enabled and if the file is approved (if required).
         if field_obj.extract_mime and (
             field_file.approved or field_obj.extract_mime != "approved_only"
         ):
-            if getattr(field_obj, "mime_use_magic", False):
+            if getattr(field_obj, "mime_use_magic", False) and scan is not None:
                 # Use python-magic for more accurate MIME type detection.
                 from magic import Magic  # pyright: ignore[reportMissingImports]
 
                 magic = Magic(mime=True)
-                # Read a buffer from the file to detect MIME type.
-                data["mime"] = magic.from_buffer(field_file.open("rb").read(2048))
+                # Detect the MIME type from the first bytes of the file.
+                data["mime"] = magic.from_buffer(scan.head[:2048])
             else:
                 # Fallback to mimetypes.guess_type based on file name.
                 data["mime"] = mimetypes.guess_type(field_file.name)[0]
@@ -786,8 +883,6 @@ class FileField(FieldFactory):
             retdict[f"{field_name}_storage"] = value.storage.name
             if field_obj.with_approval:
                 retdict[f"{field_name}_approved"] = value.approved
-            if field_obj.with_size:
-                retdict[f"{field_name}_size"] = value.size if value else None
             if field_obj.with_metadata:
                 # Extract metadata if `with_metadata` is true.
                 metadata_result: Any = (
@@ -800,4 +895,7 @@ class FileField(FieldFactory):
                 if field.field_type is str:
                     metadata_result = orjson.dumps(metadata_result).decode("utf8")
                 retdict[f"{field_name}_metadata"] = metadata_result
+            # after the metadata, the scan of the file caches the size
+            if field_obj.with_size:
+                retdict[f"{field_name}_size"] = value.size if value else None
             return retdict
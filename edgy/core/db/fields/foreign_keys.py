@@ -703,10 +703,14 @@ class BaseForeignKeyField(BaseForeignKey):
             assert not target.__is_proxy_model__  # Ensure it's not a proxy model.
 
             prefix = ""
+            target_tables = target.meta.registry.metadata_by_url[str(target.database.url)].tables
             # Determine the correct table prefix for the foreign key reference.
             for schema in schemes:
                 prefix = f"{schema}.{target.meta.tablename}" if schema else target.meta.tablename
-                if prefix in target.meta.registry.metadata_by_url[str(target.database.url)].tables:
+                # schema copies live in the per-schema metadata of the schema table cache
+                if prefix in target_tables or (
+                    schema and schema in target.__dict__.get("_db_schemas", ())
+                ):
                     break
 
             # Add the SQLAlchemy ForeignKeyConstraint.
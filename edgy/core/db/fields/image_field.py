@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from io import BytesIO
 from typing import TYPE_CHECKING, Any
 
 from edgy.core.db.fields.file_field import FileField
@@ -9,6 +10,8 @@ from edgy.exceptions import FieldDefinitionError
 
 if TYPE_CHECKING:
     from edgy.core.db.fields.types import BaseFieldType
+    from edgy.core.files import FieldFile
+    from edgy.core.files.scan import FileScan
 
 
 class ImageField(FileField):
@@ -17,7 +20,7 @@ class ImageField(FileField):
 
     This field automatically sets `with_approval` to `True` by default,
     and integrates with the Pillow library to extract image-specific metadata
-    like height and width during the cleaning process. It also supports
+    like height and width from the image header during the cleaning process. It also supports
     different image formats before and after approval.
 
     Attributes:
@@ -32,6 +35,11 @@ class ImageField(FileField):
                                                  Defaults to `ImageFieldFile`.
     """
 
+    # Big enough for the headers of most images.
+    scan_head_size: int = 256 * 2**10
+    # The dimensions are read from the header.
+    scan_always: bool = True
+
     def __new__(
         cls,
         # Image formats allowed without explicit approval.
@@ -68,47 +76,59 @@ class ImageField(FileField):
         )
 
     @classmethod
-    def extract_metadata(
-        cls, field_obj: BaseFieldType, field_name: str, field_file: ImageFieldFile
+    def extract_scan_metadata(
+        cls,
+        field_obj: BaseFieldType,
+        field_name: str,
+        field_file: FieldFile,
+        scan: FileScan | None,
     ) -> dict[str, Any]:
         """
         Extracts metadata from an image file, including inherited file metadata.
 
-        This method extends the base `FileField.extract_metadata` by specifically
-        opening the image file using Pillow and extracting its height and width.
+        This method extends the base `FileField.extract_scan_metadata` by reading the height
+        and width from the image header in the first bytes of the file. Only when the header
+        doesn't fit in them, the image is opened with Pillow.
         It handles `UnidentifiedImageError` gracefully if the file is not a valid image.
 
         Args:
             field_obj (BaseFieldType): The field object itself.
             field_name (str): The name of the field.
-            field_file (ImageFieldFile): The `ImageFieldFile` instance from which
-                                        to extract metadata.
+            field_file (FieldFile): The `ImageFieldFile` instance from which
+                                    to extract metadata.
+            scan (FileScan | None): The scan of the file, None if the file couldn't be read.
 
         Returns:
             dict[str, Any]: A dictionary containing extracted image metadata (height, width)
                             along with any metadata extracted by the parent `FileField`.
         """
-        from PIL import UnidentifiedImageError
+        from PIL import Image, UnidentifiedImageError
 
         # Call the parent method to get base file metadata (e.g., MIME type).
-        data: dict[str, Any] = super().extract_metadata(
-            field_obj, field_name=field_name, field_file=field_file
+        data: dict[str, Any] = super().extract_scan_metadata(
+            field_obj, field_name=field_name, field_file=field_file, scan=scan
         )
         assert isinstance(field_file, ImageFieldFile)
+        if scan is None:
+            return data
 
         try:
-            # Attempt to open the image using `field_file.open_image()`,
-            # which leverages Pillow.
-            img = field_file.open_image()
-            # Extract height and width.
-            data["height"] = img.height
-            data["width"] = img.width
-            img.close()  # Close the image to release resources.
+            img = Image.open(BytesIO(scan.head), formats=field_file.get_image_formats())  # type: ignore
         except UnidentifiedImageError:
-            # If the file is not a recognizable image, gracefully pass without
-            # adding height/width metadata.
-            pass
-
+            mime = data.get("mime")
+            # The header may not fit in the first bytes (e.g. big EXIF data).
+            if not scan.truncated or (mime is not None and not mime.startswith("image/")):
+                # If the file is not a recognizable image, gracefully pass without
+                # adding height/width metadata.
+                return data
+            try:
+                img = field_file.open_image()
+            except UnidentifiedImageError:
+                return data
+        # Extract height and width.
+        data["height"] = img.height
+        data["width"] = img.width
+        img.close()  # Close the image to release resources.
         return data
 
     @classmethod
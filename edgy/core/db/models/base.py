@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import contextlib
 import copy
 import inspect
 import warnings
 from collections.abc import Collection, Sequence
 from functools import cached_property
+from itertools import chain
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from pydantic import BaseModel, ConfigDict, PrivateAttr
@@ -38,6 +40,38 @@ _excempted_attrs: set[str] = {
 }
 
 
+def _get_relation_targets(model: type[BaseModelType]) -> list[type[BaseModelType]]:
+    targets: list[type[BaseModelType]] = []
+    for name in chain(model.meta.foreign_key_fields, model.meta.many_to_many_fields):
+        # unresolved targets are not in the annotations yet
+        with contextlib.suppress(Exception):
+            targets.append(model.meta.fields[name].target)
+    return targets
+
+
+def _get_deferred_build_order(model: type[BaseModelType]) -> list[type[BaseModelType]]:
+    """
+    Returns the unbuilt models the relations of a model depend on, targets before the
+    models referencing them. Iterative, so long chains of relations don't hit the
+    recursion limit. Cycles are cut where they are found, pydantic handles them.
+    """
+    order: list[type[BaseModelType]] = []
+    seen = {model}
+    stack = [(model, iter(_get_relation_targets(model)))]
+    while stack:
+        current, targets = stack[-1]
+        for target in targets:
+            if target not in seen and not target.__pydantic_complete__:
+                seen.add(target)
+                stack.append((target, iter(_get_relation_targets(target))))
+                break
+        else:
+            stack.pop()
+            if current is not model:
+                order.append(current)
+    return order
+
+
 class EdgyBaseModel(BaseModel, BaseModelType):
     model_config = ConfigDict(
         extra="allow",
@@ -190,6 +224,27 @@ class EdgyBaseModel(BaseModel, BaseModelType):
         )
         return self._db_loaded_or_deleted
 
+    @classmethod
+    def model_rebuild(
+        cls,
+        *,
+        force: bool = False,
+        raise_errors: bool = True,
+        _parent_namespace_depth: int = 2,
+        _types_namespace: Any = None,
+    ) -> bool | None:
+        if cls.model_config.get("defer_build", False):
+            # Build the unbuilt targets of the relations first, deepest first, so every build
+            # reuses the schemas of the targets instead of recursing through the chain.
+            for model in _get_deferred_build_order(cls):
+                super(EdgyBaseModel, model).model_rebuild(raise_errors=False)
+        return super().model_rebuild(
+            force=force,
+            raise_errors=raise_errors,
+            _parent_namespace_depth=_parent_namespace_depth + 1,
+            _types_namespace=_types_namespace,
+        )
+
     @classmethod
     def transform_input(
         cls,
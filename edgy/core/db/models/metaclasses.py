@@ -4,15 +4,17 @@ import contextlib
 import copy
 import inspect
 import warnings
+import weakref
 from abc import ABCMeta
 from collections import UserDict, deque
-from collections.abc import Sequence
+from collections.abc import Hashable, Sequence
 from contextvars import ContextVar
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypeVar, cast
 
 import sqlalchemy
 from pydantic._internal._model_construction import ModelMetaclass
 
+from edgy.conf import settings
 from edgy.core import signals as signals_module
 from edgy.core.connection.registry import Registry
 from edgy.core.db import fields as edgy_fields
@@ -24,6 +26,7 @@ from edgy.core.db.fields.ref_foreign_key import BaseRefForeignKey
 from edgy.core.db.fields.types import BaseFieldType
 from edgy.core.db.models.managers import BaseManager
 from edgy.core.db.models.utils import build_pkcolumns, build_pknames
+from edgy.core.db.schema_cache import schema_table_cache
 from edgy.core.utils.functional import extract_field_annotations_and_defaults
 from edgy.exceptions import ImproperlyConfigured, TableBuildError
 
@@ -32,6 +35,7 @@ if TYPE_CHECKING:
 
     from edgy.core.connection import Database
     from edgy.core.db.models import Model
+    from edgy.core.db.models.mixins.dump import DumpPlan
     from edgy.core.db.models.types import BaseModelType
 
 _empty_dict: dict[str, Any] = {}
@@ -470,6 +474,7 @@ class MetaInfo:
         "many_to_many_fields",
         "ref_foreign_key_fields",
         "_needs_special_serialization",
+        "_dump_plans",
         "_fields_are_initialized",
         "_field_stats_are_initialized",
     )
@@ -481,6 +486,7 @@ class MetaInfo:
                     "field_to_columns",
                     "field_to_column_names",
                     "columns_to_field",
+                    "_dump_plans",
                     "_fields_are_initialized",
                     "_field_stats_are_initialized",
                 }
@@ -514,6 +520,10 @@ class MetaInfo:
     _fields_are_initialized: bool
     _field_stats_are_initialized: bool
     _needs_special_serialization: bool | None
+    _dump_plans: tuple[int, dict[Hashable, DumpPlan]]
+    # bumped by every invalidation. Caches depending on other models (e.g. the dump plans
+    # following foreign keys) compare against it to detect stale entries cheaply.
+    _invalidation_generation: ClassVar[int] = 0
     input_modifying_fields: set[str]
     pre_save_fields: set[str]
     post_save_fields: set[str]
@@ -709,7 +719,7 @@ class MetaInfo:
         self.columns_to_field = ColumnsToField(self)
         self.columns_remapping = ColumnsRemapping(self)
         if self.model is not None:
-            self.model.model_rebuild(force=True)
+            rebuild_model(self.model)
         self._fields_are_initialized = True
 
     def init_field_stats(self) -> None:
@@ -763,6 +773,7 @@ class MetaInfo:
         if invalidate_fields or invalidate_stats:
             with contextlib.suppress(AttributeError):
                 delattr(self, "_needs_special_serialization")
+            MetaInfo._invalidation_generation += 1
         if self.model is None:
             return
         if clear_class_attrs:
@@ -770,7 +781,7 @@ class MetaInfo:
                 with contextlib.suppress(AttributeError):
                     delattr(self.model, attr)
             # needs an extra invalidation
-            self.model._db_schemas = {}
+            schema_table_cache.invalidate(self.model)
 
     def full_init(self, init_column_mappers: bool = True, init_class_attrs: bool = True) -> None:
         """
@@ -863,6 +874,57 @@ def get_model_registry(
 
 _occluded_sentinel = object()
 
+# the field, manager and model members of mixins, inspect.getmembers is expensive
+_mixin_members: weakref.WeakKeyDictionary[type, tuple[tuple[str, Any], ...]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_mixin_members(base: type) -> tuple[tuple[str, Any], ...]:
+    members = _mixin_members.get(base)
+    if members is None:
+        members = tuple(
+            (key, value)
+            for key, value in inspect.getmembers(base)
+            if isinstance(value, (BaseFieldType, BaseManager, BaseModelMeta))
+        )
+        _mixin_members[base] = members
+    return members
+
+
+def _resolve_defer_build(
+    bases: tuple[type, ...], model_config: Any, *, use_settings: bool
+) -> bool:
+    from edgy import monkay
+
+    if "defer_build" in model_config:
+        return bool(model_config["defer_build"])
+    # the settings can import models (e.g. of edgy.contrib) and must stay lazy, so only use
+    # them for registered models and when they are already evaluated (e.g. by the cli)
+    defer_build = (
+        bool(settings.model_defer_build) if use_settings and monkay.settings_evaluated else False
+    )
+    # like pydantic, later bases take precedence
+    for base in bases:
+        base_config = getattr(base, "model_config", None)
+        if base_config and "defer_build" in base_config:
+            defer_build = bool(base_config["defer_build"])
+    return defer_build
+
+
+def rebuild_model(model_class: type[Any]) -> None:
+    """
+    Rebuilds the pydantic schema of a model after its fields changed.
+
+    Models with `defer_build` (see the setting `model_defer_build`) which weren't built yet
+    stay unbuilt, pydantic builds them on the first validation or serialization.
+    """
+    if model_class.model_config.get("defer_build", False):
+        model_class.__edgy_build_deferred__ = True
+        if not model_class.__pydantic_complete__:
+            return
+    model_class.model_rebuild(force=True)
+
 
 def _is_sqlalchemy_compatibility_enabled(model_class: type) -> bool:
     """
@@ -893,7 +955,7 @@ def _extract_fields_and_managers(base: type, attrs: dict[str, Any]) -> None:
         # Mixins and other classes
         # Note: from mixins BaseFields and BaseManagers are imported despite inherit=False until
         # a model in the hierarchy uses them. Here is _occluded_sentinel not overwritten.
-        for key, value in inspect.getmembers(base):
+        for key, value in _get_mixin_members(base):
             if key not in attrs:
                 if isinstance(value, BaseFieldType):
                     attrs[key] = value
@@ -1168,8 +1230,19 @@ class BaseModelMeta(ModelMetaclass, ABCMeta):
         # so just update
         # see in models/mixins/db.py the the other part of the workaround
         old_class_vars = attrs.pop("__class_vars__", None) or _empty_set
+        if has_parents:
+            # the schema is built once after the registration, see rebuild_model
+            model_config = attrs.get("model_config") or {}
+            attrs["model_config"] = {**model_config, "defer_build": True}
         new_class = cast(type["Model"], super().__new__(cls, name, bases, attrs, **kwargs))
         new_class.__class_vars__.update(old_class_vars)
+        if has_parents:
+            if _resolve_defer_build(
+                bases, model_config, use_settings=not meta.abstract and bool(meta.registry)
+            ):
+                new_class.model_config["defer_build"] = True
+            else:
+                new_class.model_config.pop("defer_build", None)
 
         for k, _ in meta.managers.items():
             # reuse the var of pydantic
@@ -1261,7 +1334,7 @@ class BaseModelMeta(ModelMetaclass, ABCMeta):
         # don't add automatically to registry. Useful for subclasses which modify the registry itself.
         # `skip_registry="allow_search"` is trueish so it works.
         if not meta.registry or skip_registry:
-            new_class.model_rebuild(force=True)
+            rebuild_model(new_class)
             return new_class
 
         new_class.add_to_registry(meta.registry, database=database, on_conflict=on_conflict)
@@ -1351,7 +1424,10 @@ class BaseModelMeta(ModelMetaclass, ABCMeta):
             meta is not None
             and meta.model is cls
             and not meta.abstract
-            and cls.__dict__.get("__pydantic_complete__", False)
+            and (
+                cls.__dict__.get("__pydantic_complete__", False)
+                or cls.__dict__.get("__edgy_build_deferred__", False)
+            )
             and _is_sqlalchemy_compatibility_enabled(cls)
         ):
             try:
@@ -1424,11 +1500,12 @@ class BaseModelMeta(ModelMetaclass, ABCMeta):
     ) -> sqlalchemy.Table:
         """
         Retrieves or builds the SQLAlchemy table for a specific schema.
-        Uses a primitive LRU cache for schema-specific tables.
+        Schema copies are held by the global, size bounded `schema_table_cache`.
 
         Args:
             schema: The database schema name. If None, uses the default schema.
-            metadata: An optional SQLAlchemy MetaData object.
+            metadata: An optional SQLAlchemy MetaData object. By default copies of the
+                same schema share a MetaData.
             update_cache: If True, forces an update of the cache for the given schema.
 
         Returns:
@@ -1444,17 +1521,12 @@ class BaseModelMeta(ModelMetaclass, ABCMeta):
             if update_cache or table is None or table.name.lower() != cls.meta.tablename:
                 cls._build_table(metadata=metadata)
             return cls.table
-        # remove cache element so the key is reordered
-        schema_obj = cls._db_schemas.pop(schema, None)
-        if schema_obj is None or update_cache:
-            schema_obj = cls.build(schema=schema, metadata=metadata)
-        # set element to last
-        cls._db_schemas[schema] = schema_obj
-        # remove oldest element, when bigger 100
-        while len(cls._db_schemas) > 100:
-            cls._db_schemas.pop(next(iter(cls._db_schemas)), None)
-
-        return cast("sqlalchemy.Table", schema_obj)
+        return schema_table_cache.get_table(
+            cast("type[BaseModelType]", cls),
+            schema,
+            metadata=metadata,
+            update_cache=update_cache,
+        )
 
     @property
     def proxy_model(cls: type[Model]) -> type[Model]:
@@ -1467,7 +1539,7 @@ class BaseModelMeta(ModelMetaclass, ABCMeta):
         if getattr(cls, "__proxy_model__", None) is None:
             proxy_model = cls.generate_proxy_model()
             proxy_model.__parent__ = cls
-            proxy_model.model_rebuild(force=True)
+            rebuild_model(proxy_model)
             cls.__proxy_model__ = proxy_model
         return cls.__proxy_model__
 
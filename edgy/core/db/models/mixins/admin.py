@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, ClassVar
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any, ClassVar, cast
+from weakref import WeakKeyDictionary
 
 from pydantic import ConfigDict
 
@@ -11,6 +13,36 @@ if TYPE_CHECKING:
     from edgy.core.db.models import Model
 
 
+# admin marshall classes by model: (invalidation generation, marshall classes by arguments)
+_admin_marshall_classes: WeakKeyDictionary[
+    type, tuple[int, dict[Hashable, type[marshalls.Marshall]]]
+] = WeakKeyDictionary()
+
+
+def _freeze_config(value: Any) -> Hashable:
+    """
+    Converts a marshall config into a hashable cache key.
+
+    Raises:
+        TypeError: If the value (or a nested value) is not hashable.
+    """
+    if isinstance(value, dict):
+        return ("d", frozenset((key, _freeze_config(val)) for key, val in value.items()))
+    if isinstance(value, list | tuple):
+        return ("l", tuple(_freeze_config(val) for val in value))
+    if isinstance(value, set | frozenset):
+        return ("s", frozenset(value))
+    hash(value)
+    return cast(Hashable, value)
+
+
+def clear_admin_marshall_classes() -> None:
+    """
+    Clears the cached admin marshall classes.
+    """
+    _admin_marshall_classes.clear()
+
+
 class AdminMixin:
     """
     A mixin class providing administrative functionalities and configurations
@@ -58,6 +90,27 @@ class AdminMixin:
             "exclude_autoincrement": phase == "create",
         }
 
+    @classmethod
+    def get_admin_search_config(cls: type[Model]) -> dict[str, Any]:
+        """
+        Returns the configuration of the search of the admin model list.
+
+        By default (an empty dict) the string fields are searched with `ILIKE`, which can't use
+        indexes. To use a full-text index, return one of:
+
+        - `"tsvector"`: the name of a tsvector column or a list of the text fields combined by
+          `to_tsvector(<tsvector_config>, coalesce(field1, '') || ' ' || ...)`, matching an
+          expression index (PostgreSQL). `"tsvector_config"` is the text search config,
+          "simple" by default.
+        - `"fts5_table"`: the name of an FTS5 table whose rowid is the primary key (SQLite).
+
+        On other dialects the search falls back to `ILIKE`.
+
+        Returns:
+            A dictionary with the search configuration.
+        """
+        return {}
+
     @classmethod
     def get_admin_marshall_class(
         cls: type[Model], *, phase: str, for_schema: bool = False
@@ -68,6 +121,9 @@ class AdminMixin:
         This allows for custom marshalling behavior based on the current
         administrative operation phase and whether it's for schema generation.
 
+        The classes are cached per model, `for_schema` and the config returned by
+        `get_admin_marshall_config`, so a config depending on the request still works.
+
         Args:
             cls: The Edgy Model class for which the admin marshall class is
                 being generated.
@@ -84,6 +140,21 @@ class AdminMixin:
             admin interface.
         """
 
+        config = cls.get_admin_marshall_config(phase=phase, for_schema=for_schema)
+        # The config can depend on the request (e.g. the user), so it is part of the key.
+        try:
+            key: Hashable = (for_schema, _freeze_config(config))
+        except TypeError:
+            key = None
+        # the cached classes are dropped when model fields are invalidated
+        generation = cls.meta._invalidation_generation
+        cached_generation, marshall_classes = _admin_marshall_classes.get(cls, (-1, {}))
+        if cached_generation != generation:
+            marshall_classes = {}
+            _admin_marshall_classes[cls] = (generation, marshall_classes)
+        if key is not None and key in marshall_classes:
+            return marshall_classes[key]
+
         class AdminMarshall(marshalls.Marshall):
             # Configure Pydantic model behavior.
             # 'title' is set to the model's name for clarity in schemas.
@@ -97,9 +168,11 @@ class AdminMixin:
             # the admin-specific configuration.
             marshall_config = marshalls.ConfigMarshall(
                 model=cls,
-                **cls.get_admin_marshall_config(phase=phase, for_schema=for_schema),  # type: ignore
+                **config,  # type: ignore
             )
 
+        if key is not None:
+            marshall_classes[key] = AdminMarshall
         return AdminMarshall
 
     @classmethod
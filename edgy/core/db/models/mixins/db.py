@@ -26,7 +26,7 @@ from edgy.core.db.context_vars import (
 from edgy.core.db.datastructures import Index, UniqueConstraint
 from edgy.core.db.fields.base import BaseForeignKey
 from edgy.core.db.fields.many_to_many import BaseManyToManyForeignKeyField
-from edgy.core.db.models.metaclasses import MetaInfo
+from edgy.core.db.models.metaclasses import MetaInfo, rebuild_model
 from edgy.core.db.models.types import BaseModelType
 from edgy.core.db.models.utils import build_pkcolumns
 from edgy.core.db.relationships.related_field import RelatedField
@@ -402,7 +402,7 @@ class DatabaseMixin:
                 registry.execute_model_callbacks(cls)
 
         # finalize
-        cls.model_rebuild(force=True)
+        rebuild_model(cls)
         return cls
 
     @classmethod
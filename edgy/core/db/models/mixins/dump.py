@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import copy
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, cast
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, NamedTuple, cast
 
 import orjson
 from pydantic import BaseModel
@@ -14,6 +15,198 @@ if TYPE_CHECKING:
     from edgy.core.db.models.metaclasses import MetaInfo
 
 _empty = cast(set[str], frozenset())
+# upper bound of cached dump plans per model, protects against unbounded growth when
+# include/exclude are generated dynamically
+DUMP_PLAN_CACHE_SIZE: int = 128
+
+
+class DumpPlan(NamedTuple):
+    """
+    The precompiled, instance independent part of a `model_dump` call.
+
+    Attributes:
+        exclude: The exclude argument for the first (pydantic) pass.
+        second_pass: Tuples of `(field_name, alias, sub_include, sub_exclude,
+            unsafe_json_serialization)` for fields which are evaluated via getattr
+            after the first pass.
+    """
+
+    exclude: dict[str, Any]
+    second_pass: tuple[tuple[str, str, Any, Any, bool], ...]
+
+
+def _freeze_filter(value: Any) -> Any:
+    """
+    Converts an include/exclude argument into a hashable cache key.
+
+    Raises:
+        TypeError: If the value (or a nested value) cannot be converted.
+    """
+    if value is None or value is True or value is False or value is Ellipsis:
+        return value
+    if isinstance(value, dict):
+        return ("d", frozenset((key, _freeze_filter(val)) for key, val in value.items()))
+    if isinstance(value, set | frozenset | list | tuple):
+        return ("s", frozenset(value))
+    raise TypeError(f"Cannot use {value!r} as dump plan key.")
+
+
+def build_dump_plan(
+    instance: BaseModel,
+    *,
+    include: set[str] | dict[str, Any] | None,
+    exclude: set[str] | dict[str, Any] | None,
+    show_pk: bool,
+) -> DumpPlan:
+    """
+    Compiles the exclude/include arithmetic of `DumpMixin.model_dump`.
+
+    The result only depends on the class of `instance`, not on the instance values.
+
+    Args:
+        instance: The instance (model or marshall) to dump.
+        include: The include argument passed to `model_dump`.
+        exclude: The exclude argument passed to `model_dump`.
+        show_pk: Whether the primary key fields should be shown.
+
+    Returns:
+        The compiled `DumpPlan`.
+    """
+    meta: MetaInfo = instance.meta
+    # Initialize variables for managing field exclusions.
+    # `initial_full_field_exclude` will contain names of fields to be fully excluded.
+    # `exclude_passed` is a dictionary used for the first pass of `super().model_dump`.
+    # `exclude_second_pass` is used for fields processed in the second pass (e.g., getters).
+    if exclude is None:
+        initial_full_field_exclude: set[str] = _empty
+        # Must be a writable dictionary to allow modifications.
+        exclude_passed: dict[str, Any] = {}
+        exclude_second_pass: dict[str, Any] = {}
+    elif isinstance(exclude, dict):
+        # If `exclude` is a dictionary, extract fields marked for full exclusion (value is True).
+        initial_full_field_exclude = {k for k, v in exclude.items() if v is True}
+        # Create a copy for `exclude_passed` to avoid modifying the original `exclude`.
+        exclude_passed = copy.copy(exclude)
+        exclude_second_pass = exclude
+    else:
+        # If `exclude` is a set or list, convert it to a set for consistency.
+        initial_full_field_exclude = set(exclude)
+        # Create dictionaries where all initially excluded fields are marked `True`.
+        exclude_passed = dict.fromkeys(initial_full_field_exclude, True)
+        exclude_second_pass = exclude_passed.copy()
+
+    # `need_second_pass` will store field names that require a second processing pass.
+    # These are typically fields with custom getters or foreign keys to models
+    # that need special serialization.
+    # A dict is used as ordered set.
+    need_second_pass: dict[str, None] = {}
+
+    # Process fields that have special getter methods defined.
+    for field_name in meta.special_getter_fields:
+        # Temporarily exclude these fields from the initial `model_dump` pass.
+        exclude_passed[field_name] = True
+        # If a special getter field was not explicitly excluded and is not marked
+        # for exclusion in its `MetaInfo`, add it to `need_second_pass`.
+        if field_name not in initial_full_field_exclude and not meta.fields[field_name].exclude:
+            need_second_pass[field_name] = None
+
+    # Process foreign key fields.
+    for field_name in meta.foreign_key_fields:
+        field = meta.fields[field_name]
+        # If the foreign key field is already fully excluded, skip further processing.
+        if field_name in initial_full_field_exclude or field.exclude:
+            continue
+        # If the target model of the foreign key needs special serialization,
+        # temporarily exclude it from the first pass and add to `need_second_pass`.
+        if field.target.meta.needs_special_serialization:
+            exclude_passed[field_name] = True
+            need_second_pass[field_name] = None
+
+    second_pass: list[tuple[str, str, Any, Any, bool]] = []
+    for field_name in need_second_pass:
+        # Skip the field if it's not a primary key (and `show_pk` is true)
+        # or if it's not explicitly included (and `include` is not None).
+        if not (
+            (show_pk and field_name in instance.pknames)
+            or include is None
+            or field_name in include
+        ):
+            continue
+        field = meta.fields[field_name]
+
+        sub_include = None
+        # If `include` is a dictionary, extract specific inclusion rules for the sub-field.
+        if isinstance(include, dict):
+            sub_include = include.get(field_name, None)
+            # If the sub-field is explicitly included with `True`, treat it as no specific
+            # sub-inclusion (i.e., include all sub-fields by default).
+            if sub_include is True:
+                sub_include = None
+
+        # Get specific exclusion rules for the sub-field.
+        sub_exclude = exclude_second_pass.get(field_name, None)
+        # Ensure that a field marked for full exclusion in the first pass is not
+        # unexpectedly processed in the second pass.
+        assert sub_exclude is not True, "field should have been excluded"
+
+        # Determine the alias for the field in the dumped dictionary.
+        # Prioritize `serialization_alias`, then `alias`, otherwise use the field name.
+        alias: str = field_name
+        if getattr(field, "serialization_alias", None):
+            alias = cast(str, field.serialization_alias)
+        elif getattr(field, "alias", None):
+            alias = field.alias
+        second_pass.append(
+            (
+                field_name,
+                alias,
+                sub_include,
+                sub_exclude,
+                bool(getattr(field, "unsafe_json_serialization", False)),
+            )
+        )
+    return DumpPlan(exclude=exclude_passed, second_pass=tuple(second_pass))
+
+
+def get_dump_plan(
+    instance: BaseModel,
+    *,
+    include: set[str] | dict[str, Any] | None,
+    exclude: set[str] | dict[str, Any] | None,
+    show_pk: bool,
+) -> DumpPlan:
+    """
+    Returns the cached `DumpPlan` for the class of `instance`, building it on a miss.
+
+    Plans are stored on the `MetaInfo` and dropped whenever any `MetaInfo` is invalidated.
+    Unhashable include/exclude arguments bypass the cache.
+    """
+    meta: MetaInfo = instance.meta
+    try:
+        # marshalls share the meta of their model, so the class is part of the key
+        key: Hashable = (type(instance), _freeze_filter(include), _freeze_filter(exclude), show_pk)
+    except TypeError:
+        return build_dump_plan(instance, include=include, exclude=exclude, show_pk=show_pk)
+    generation = meta._invalidation_generation
+    plans: dict[Hashable, DumpPlan] | None
+    cache_generation, plans = getattr(meta, "_dump_plans", None) or (-1, None)
+    if plans is None or cache_generation != generation:
+        plans = {}
+        meta._dump_plans = (generation, plans)
+    plan = plans.get(key)
+    if plan is None:
+        # the plan keeps references to sub filters, so decouple them from the arguments
+        plan = build_dump_plan(
+            instance,
+            include=copy.deepcopy(include) if isinstance(include, dict) else include,
+            exclude=copy.deepcopy(exclude) if isinstance(exclude, dict) else exclude,
+            show_pk=show_pk,
+        )
+        # remove oldest element when the cache is full
+        if len(plans) >= DUMP_PLAN_CACHE_SIZE:
+            plans.pop(next(iter(plans)), None)
+        plans[key] = plan
+    return plan
 
 
 class DumpMixin:
@@ -44,6 +237,9 @@ class DumpMixin:
         -   Applying custom logic for fields that retrieve their values via getters
             or require special serialization (e.g., related models, composite fields).
 
+        The include/exclude arithmetic is compiled once into a `DumpPlan` per model and
+        `(include, exclude, show_pk)` combination and reused by subsequent calls.
+
         Args:
             self: The instance of the Pydantic `BaseModel` on which `model_dump` is called.
             show_pk: An optional boolean flag. If `True`, the primary key field(s) will
@@ -58,63 +254,10 @@ class DumpMixin:
             A `dict` representing the serialized model data, with applied
             inclusions, exclusions, and special field handling.
         """
-        meta = self.meta
         # Retrieve the 'exclude' argument, defaulting to None if not provided.
         # This argument can be a set of field names, a dictionary mapping field
         # names to boolean exclusion flags, or None.
-        _exclude: set[str] | dict[str, Any] | None = kwargs.pop("exclude", None)
-
-        # Initialize variables for managing field exclusions.
-        # `initial_full_field_exclude` will contain names of fields to be fully excluded.
-        # `exclude_passed` is a dictionary used for the first pass of `super().model_dump`.
-        # `exclude_second_pass` is used for fields processed in the second pass (e.g., getters).
-        if _exclude is None:
-            initial_full_field_exclude: set[str] = _empty
-            # Must be a writable dictionary to allow modifications.
-            exclude_passed: dict[str, Any] = {}
-            exclude_second_pass: dict[str, Any] = {}
-        elif isinstance(_exclude, dict):
-            # If `_exclude` is a dictionary, extract fields marked for full exclusion (value is True).
-            initial_full_field_exclude = {k for k, v in _exclude.items() if v is True}
-            # Create a copy for `exclude_passed` to avoid modifying the original `_exclude`.
-            exclude_passed = copy.copy(_exclude)
-            exclude_second_pass = _exclude
-        else:
-            # If `_exclude` is a set or list, convert it to a set for consistency.
-            initial_full_field_exclude = set(_exclude)
-            # Create dictionaries where all initially excluded fields are marked `True`.
-            exclude_passed = dict.fromkeys(initial_full_field_exclude, True)
-            exclude_second_pass = exclude_passed.copy()
-
-        # `need_second_pass` will store field names that require a second processing pass.
-        # These are typically fields with custom getters or foreign keys to models
-        # that need special serialization.
-        need_second_pass: set[str] = set()
-
-        # Process fields that have special getter methods defined.
-        for field_name in meta.special_getter_fields:
-            # Temporarily exclude these fields from the initial `model_dump` pass.
-            exclude_passed[field_name] = True
-            # If a special getter field was not explicitly excluded and is not marked
-            # for exclusion in its `MetaInfo`, add it to `need_second_pass`.
-            if (
-                field_name not in initial_full_field_exclude
-                and not meta.fields[field_name].exclude
-            ):
-                need_second_pass.add(field_name)
-
-        # Process foreign key fields.
-        for field_name in meta.foreign_key_fields:
-            field = meta.fields[field_name]
-            # If the foreign key field is already fully excluded, skip further processing.
-            if field_name in initial_full_field_exclude or field.exclude:
-                continue
-            # If the target model of the foreign key needs special serialization,
-            # temporarily exclude it from the first pass and add to `need_second_pass`.
-            if field.target.meta.needs_special_serialization:
-                exclude_passed[field_name] = True
-                need_second_pass.add(field_name)
-
+        exclude: set[str] | dict[str, Any] | None = kwargs.pop("exclude", None)
         # Retrieve the 'include' argument, defaulting to None.
         include: set[str] | dict[str, Any] | None = kwargs.pop("include", None)
         # Determine the serialization mode ('json' or 'python').
@@ -124,29 +267,22 @@ class DumpMixin:
         # argument over the model's internal `__show_pk__` attribute.
         should_show_pk = self.__show_pk__ if show_pk is None else show_pk
 
+        plan = get_dump_plan(self, include=include, exclude=exclude, show_pk=should_show_pk)
+
         # Perform the initial `model_dump` using Pydantic's default implementation.
         # This will handle most fields and apply the initial exclusion rules.
-
         result_dict: dict[str, Any] = super().model_dump(
-            exclude=exclude_passed, include=include, mode=mode, **kwargs
+            exclude=plan.exclude, include=include, mode=mode, **kwargs
         )
+        if not plan.second_pass:
+            return result_dict
 
         # Set a context variable to control the behavior of `getattr` during the
         # second pass, often used to prevent recursive database queries.
         token = MODEL_GETATTR_BEHAVIOR.set("passdown")
         try:
-            # Process fields identified in `need_second_pass`.
-            for field_name in need_second_pass:
-                # Skip the field if it's not a primary key (and `show_pk` is true)
-                # or if it's not explicitly included (and `include` is not None).
-                if not (
-                    (should_show_pk and field_name in self.pknames)
-                    or include is None
-                    or field_name in include
-                ):
-                    continue
-
-                field = meta.fields[field_name]
+            # Process fields identified as requiring a second pass.
+            for field_name, alias, sub_include, sub_exclude, unsafe_json in plan.second_pass:
                 try:
                     # Attempt to get the value of the field, which might trigger a getter.
                     retval = getattr(self, field_name)
@@ -154,21 +290,6 @@ class DumpMixin:
                     # If the attribute doesn't exist (e.g., not loaded), skip it.
                     continue
 
-                sub_include = None
-                # If `include` is a dictionary, extract specific inclusion rules for the sub-field.
-                if isinstance(include, dict):
-                    sub_include = include.get(field_name, None)
-                    # If the sub-field is explicitly included with `True`, treat it as no specific
-                    # sub-inclusion (i.e., include all sub-fields by default).
-                    if sub_include is True:
-                        sub_include = None
-
-                # Get specific exclusion rules for the sub-field.
-                sub_exclude = exclude_second_pass.get(field_name, None)
-                # Ensure that a field marked for full exclusion in the first pass is not
-                # unexpectedly processed in the second pass.
-                assert sub_exclude is not True, "field should have been excluded"
-
                 # If the retrieved value is another `BaseModel` (e.g., a related object),
                 # recursively call `model_dump` on it.
                 if isinstance(retval, BaseModel):
@@ -182,19 +303,10 @@ class DumpMixin:
                     assert sub_exclude is None, "sub exclude filters for no pydantic model"
                     # If the mode is 'json' and the field is not marked for unsafe JSON serialization,
                     # skip it. This prevents non-serializable types from breaking JSON output.
-                    if mode == "json" and not getattr(field, "unsafe_json_serialization", False):
-                        # skip field if it isn't a BaseModel and the mode is json and
-                        # unsafe_json_serialization is not set
-                        # Currently, `unsafe_json_serialization` exists only on `CompositeFields`.
+                    # Currently, `unsafe_json_serialization` exists only on `CompositeFields`.
+                    if mode == "json" and not unsafe_json:
                         continue
 
-                # Determine the alias for the field in the dumped dictionary.
-                # Prioritize `serialization_alias`, then `alias`, otherwise use the field name.
-                alias: str = field_name
-                if getattr(field, "serialization_alias", None):
-                    alias = cast(str, field.serialization_alias)
-                elif getattr(field, "alias", None):
-                    alias = field.alias
                 # Add the processed field and its value to the `result_dict`.
                 result_dict[alias] = retval
         finally:
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 import sqlalchemy
 
+from edgy.core.connection.reflection_cache import copy_table
 from edgy.core.utils.sync import run_sync
 from edgy.exceptions import ImproperlyConfigured
 
@@ -204,13 +205,20 @@ class ReflectedModelMixin:
         # If `registry` is a `Registry` object, extract its `database` attribute.
         if hasattr(registry, "database"):
             registry = registry.database
+        reflection_cache = getattr(cls.meta.registry, "reflection_cache", None)
 
         try:
-            # Establish an asynchronous database connection.
-            async with registry as database:
-                # Execute the synchronous reflection helper function within the
-                # asynchronous context using `database.run_sync`.
-                table: sqlalchemy.Table = await database.run_sync(execute_reflection)
+            if reflection_cache is not None:
+                (cached_table,) = await reflection_cache.reflect_tables(
+                    registry, schema, [tablename]
+                )
+                table: sqlalchemy.Table = copy_table(cached_table, metadata)
+            else:
+                # Establish an asynchronous database connection.
+                async with registry as database:
+                    # Execute the synchronous reflection helper function within the
+                    # asynchronous context using `database.run_sync`.
+                    table = await database.run_sync(execute_reflection)
         except Exception as e:
             # Catch any exceptions during the database connection or reflection
             # and re-raise as an `ImproperlyConfigured` error.
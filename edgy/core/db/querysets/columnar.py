@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import enum
+import uuid
+from collections.abc import AsyncIterator, Sequence
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast
+
+import orjson
+import sqlalchemy
+
+from edgy.core.utils.db import check_db_connection
+from edgy.exceptions import QuerySetError
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy
+    import pyarrow
+
+    from edgy.core.db.models.types import BaseModelType
+    from edgy.core.db.querysets.base import BaseQuerySet
+
+ColumnKind = Literal[
+    "bool",
+    "int",
+    "float",
+    "decimal",
+    "datetime",
+    "date",
+    "time",
+    "timedelta",
+    "str",
+    "bytes",
+    "uuid",
+    "enum",
+    "json",
+    "object",
+]
+
+# order matters: bool is a subclass of int and datetime is a subclass of date
+_python_type_kinds: tuple[tuple[type, ColumnKind], ...] = (
+    (bool, "bool"),
+    (int, "int"),
+    (float, "float"),
+    (decimal.Decimal, "decimal"),
+    (datetime.datetime, "datetime"),
+    (datetime.date, "date"),
+    (datetime.time, "time"),
+    (datetime.timedelta, "timedelta"),
+    (enum.Enum, "enum"),
+    (str, "str"),
+    (bytes, "bytes"),
+    (uuid.UUID, "uuid"),
+)
+
+# kinds with a native numpy dtype. All other kinds are stored in object arrays.
+_numpy_dtypes: dict[str, str] = {
+    "bool": "bool",
+    "int": "int64",
+    "float": "float64",
+    "datetime": "datetime64[us]",
+    "date": "datetime64[D]",
+    "timedelta": "timedelta64[us]",
+}
+# placeholders for masked NULL values in numpy buffers without NaN/NaT support
+_numpy_null_fill: dict[str, Any] = {"bool": False, "int": 0}
+
+
+class ColumnSpec(NamedTuple):
+    """
+    Describes a column of a columnar fetch.
+
+    Attributes:
+        key: The key of the column in the result. Equals the field name for single column fields.
+        column: The selected SQLAlchemy column.
+        kind: The kind of the values, derived from the Edgy field type.
+        nullable: Whether the column can contain NULL values.
+    """
+
+    key: str
+    column: sqlalchemy.Column
+    kind: ColumnKind
+    nullable: bool
+
+
+def _kind_from_python_type(python_type: Any) -> ColumnKind | None:
+    for check_type, kind in _python_type_kinds:
+        try:
+            if issubclass(python_type, check_type):
+                return kind
+        except TypeError:
+            # not a class, e.g. Any or an annotated type
+            return None
+    return None
+
+
+def get_column_kind(model_class: type[BaseModelType], column: sqlalchemy.Column) -> ColumnKind:
+    """
+    Derives the column kind for a column of `model_class`.
+
+    The `field_type` of the owning Edgy field is preferred. For fields spanning multiple
+    columns (e.g. foreign keys) or without an usable `field_type` the python type of the
+    SQLAlchemy column type is used.
+    """
+    if isinstance(column.type, sqlalchemy.JSON):
+        return "json"
+    if isinstance(column.type, sqlalchemy.Enum) and column.type.enum_class is not None:
+        return "enum"
+    field_name = model_class.meta.columns_to_field.get(column.key)
+    field = model_class.meta.fields.get(field_name) if field_name else None
+    if field is not None and len(field.get_column_names(field_name)) == 1:
+        kind = _kind_from_python_type(field.field_type)
+        if kind is not None:
+            return kind
+    try:
+        kind = _kind_from_python_type(column.type.python_type)
+    except NotImplementedError:
+        kind = None
+    return kind or "object"
+
+
+async def get_column_specs(queryset: BaseQuerySet) -> tuple[Any, list[ColumnSpec]]:
+    """
+    Compiles the select of `queryset` and describes the selected columns of the main table.
+
+    Joined (select_related) columns and extra selects are ignored, only/defer and
+    exclude_secrets are honored by the compiled select.
+
+    Returns:
+        The select expression and the column specs.
+    """
+    expression, tables_and_models = await queryset.as_select_with_tables()
+    table, model_class = tables_and_models[""]
+    specs = [
+        ColumnSpec(
+            key=column.key,
+            column=column,
+            kind=get_column_kind(model_class, column),
+            nullable=bool(column.nullable),
+        )
+        for column in expression.selected_columns
+        if getattr(column, "table", None) is table
+    ]
+    if not specs:
+        raise QuerySetError(detail="No columns of the model are selected.")
+    return expression, specs
+
+
+async def iterate_column_batches(
+    queryset: BaseQuerySet, expression: Any, specs: list[ColumnSpec], chunk_size: int
+) -> AsyncIterator[list[list[Any]]]:
+    """
+    Fetches the raw rows of `expression` in batches, bypassing the model creation.
+
+    Yields:
+        The values of a batch, column by column in the order of `specs`.
+    """
+    database = queryset.database
+    check_db_connection(database, stacklevel=4)
+    async with database as database:
+        async for batch in cast(
+            AsyncIterator[Sequence[sqlalchemy.Row]],
+            database.batched_iterate(expression, batch_size=chunk_size),
+        ):
+            yield [[row._mapping[spec.column] for row in batch] for spec in specs]
+
+
+def _to_numpy_array(spec: ColumnSpec, values: list[Any]) -> numpy.ndarray:
+    import numpy
+
+    dtype = _numpy_dtypes.get(spec.kind)
+    if dtype is None:
+        # assign element-wise, so lists (e.g. json) are not interpreted as dimensions
+        array = numpy.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+    if spec.kind == "datetime":
+        # numpy has no timezone support, normalize to naive utc
+        values = [
+            value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            if value is not None and value.tzinfo is not None
+            else value
+            for value in values
+        ]
+    elif spec.kind == "float":
+        values = [numpy.nan if value is None else value for value in values]
+    elif spec.kind in _numpy_null_fill:
+        fill = _numpy_null_fill[spec.kind]
+        values = [fill if value is None else value for value in values]
+    return numpy.array(values, dtype=dtype)
+
+
+async def fetch_numpy_columns(queryset: BaseQuerySet, chunk_size: int) -> dict[str, numpy.ndarray]:
+    """
+    Fetches the columns of the main table of `queryset` into NumPy arrays.
+
+    Nullable columns are returned as `numpy.ma.MaskedArray` with NULL values masked.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('"numpy" is required for columnar fetches.') from None
+
+    if chunk_size < 1:
+        raise QuerySetError(detail="chunk_size must be at least 1.")
+    expression, specs = await get_column_specs(queryset)
+    buffers: list[list[numpy.ndarray]] = [[] for _ in specs]
+    masks: list[list[numpy.ndarray]] = [[] for _ in specs]
+    async for columns in iterate_column_batches(queryset, expression, specs, chunk_size):
+        for index, spec in enumerate(specs):
+            values = columns[index]
+            buffers[index].append(_to_numpy_array(spec, values))
+            if spec.nullable:
+                masks[index].append(numpy.fromiter((v is None for v in values), dtype=bool))
+
+    result: dict[str, numpy.ndarray] = {}
+    for index, spec in enumerate(specs):
+        dtype = _numpy_dtypes.get(spec.kind, object)
+        array = (
+            numpy.concatenate(buffers[index]) if buffers[index] else numpy.empty(0, dtype=dtype)
+        )
+        if spec.nullable:
+            mask = numpy.concatenate(masks[index]) if masks[index] else numpy.empty(0, dtype=bool)
+            array = numpy.ma.MaskedArray(array, mask=mask)
+        result[spec.key] = array
+    return result
+
+
+def _get_decimal_precision(spec: ColumnSpec) -> tuple[int, int] | None:
+    precision = getattr(spec.column.type, "precision", None)
+    scale = getattr(spec.column.type, "scale", None) or 0
+    # arrow decimals are limited to 76 digits
+    if precision is None or precision > 76 or scale > precision:
+        return None
+    return precision, scale
+
+
+def get_arrow_type(spec: ColumnSpec) -> pyarrow.DataType:
+    """
+    Returns the arrow type for a column spec.
+
+    The type is derived from the column type only, so all batches share it. Decimals
+    without a precision, enum values and unknown values are stored as strings.
+    """
+    import pyarrow
+
+    kind = spec.kind
+    if kind == "datetime":
+        timezone = getattr(spec.column.type, "timezone", False)
+        return pyarrow.timestamp("us", tz="UTC" if timezone else None)
+    if kind == "decimal":
+        precision_and_scale = _get_decimal_precision(spec)
+        if precision_and_scale is None:
+            return pyarrow.string()
+        precision, scale = precision_and_scale
+        if precision > 38:
+            return pyarrow.decimal256(precision, scale)
+        return pyarrow.decimal128(precision, scale)
+    simple_types: dict[str, Any] = {
+        "bool": pyarrow.bool_,
+        "int": pyarrow.int64,
+        "float": pyarrow.float64,
+        "date": pyarrow.date32,
+        "time": lambda: pyarrow.time64("us"),
+        "timedelta": lambda: pyarrow.duration("us"),
+        "str": pyarrow.string,
+        "bytes": pyarrow.binary,
+        "uuid": pyarrow.string,
+        "enum": pyarrow.string,
+        "json": pyarrow.string,
+    }
+    if kind in simple_types:
+        return cast("pyarrow.DataType", simple_types[kind]())
+    return pyarrow.string()
+
+
+def get_arrow_schema(specs: Sequence[ColumnSpec]) -> pyarrow.Schema:
+    """
+    Returns the arrow schema for the column specs, see `get_arrow_type`.
+    """
+    import pyarrow
+
+    return pyarrow.schema(
+        [pyarrow.field(spec.key, get_arrow_type(spec), nullable=spec.nullable) for spec in specs]
+    )
+
+
+def to_arrow_values(spec: ColumnSpec, values: list[Any]) -> list[Any]:
+    """
+    Converts the python values of a column into values of its arrow type.
+    """
+    if spec.kind == "uuid":
+        return [None if value is None else str(value) for value in values]
+    if spec.kind == "enum":
+        return [None if value is None else str(value.value) for value in values]
+    if spec.kind == "json":
+        return [None if value is None else orjson.dumps(value).decode() for value in values]
+    if spec.kind == "object" or (spec.kind == "decimal" and _get_decimal_precision(spec) is None):
+        return [None if value is None else str(value) for value in values]
+    return values
+
+
+async def fetch_arrow_table(queryset: BaseQuerySet, chunk_size: int) -> pyarrow.Table:
+    """
+    Fetches the columns of the main table of `queryset` into an Arrow table.
+
+    Every fetched batch becomes a record batch of the table. The schema is derived from
+    the column types (see `get_arrow_type`), JSON, UUID and unknown values are stored as
+    strings, enums as their stringified values.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError('"pyarrow" is required for arrow fetches.') from None
+
+    if chunk_size < 1:
+        raise QuerySetError(detail="chunk_size must be at least 1.")
+    expression, specs = await get_column_specs(queryset)
+    schema = get_arrow_schema(specs)
+    record_batches: list[pyarrow.RecordBatch] = []
+    async for columns in iterate_column_batches(queryset, expression, specs, chunk_size):
+        arrays = [
+            pyarrow.array(to_arrow_values(spec, columns[index]), type=schema.field(index).type)
+            for index, spec in enumerate(specs)
+        ]
+        record_batches.append(pyarrow.RecordBatch.from_arrays(arrays, schema=schema))
+    return pyarrow.Table.from_batches(record_batches, schema=schema)
@@ -50,7 +50,7 @@ class QueryCompiler:
         self.queryset = queryset
         self.model_class = queryset.model_class
         self.database = queryset.database
-        self.active_schema = queryset.active_schema
+        self.active_schema = queryset.table_schema_name
 
     def join_graph_data(self) -> tuple[Any, tables_and_models_type]:
         """
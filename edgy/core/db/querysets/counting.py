@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any
+
+import orjson
+import sqlalchemy
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+from edgy.core.db.querysets.combined import CombinedQuerySet
+from edgy.core.utils.db import check_db_connection
+
+if TYPE_CHECKING:  # pragma: no cover
+    from edgy.core.db.querysets.queryset import QuerySet
+
+
+class _Explain(Executable, ClauseElement):
+    """
+    `EXPLAIN` of a select, the plan is returned as JSON (PostgreSQL) or as rows (MySQL).
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: sqlalchemy.Select) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain_postgresql(element: _Explain, compiler: Any, **kwargs: Any) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kwargs)}"
+
+
+@compiles(_Explain, "mysql")
+def _compile_explain_mysql(element: _Explain, compiler: Any, **kwargs: Any) -> str:
+    return f"EXPLAIN {compiler.process(element.statement, **kwargs)}"
+
+
+def is_unfiltered(queryset: QuerySet) -> bool:
+    """
+    Checks if the queryset selects all rows of its table, so the table statistics apply.
+    """
+    return not (
+        isinstance(queryset, CombinedQuerySet)
+        or queryset.filter_clauses
+        or queryset.or_clauses
+        or queryset._select_related
+        or queryset._group_by
+        or queryset.distinct_on is not None
+        or queryset.limit_count is not None
+        or queryset._offset is not None
+        or queryset.embed_parent_filters
+    )
+
+
+async def _estimate_postgresql(queryset: QuerySet, database: Any) -> int | None:
+    table = queryset.table
+    if is_unfiltered(queryset):
+        name = ".".join(f'"{part}"' for part in (table.schema, table.name) if part)
+        reltuples = await database.fetch_val(
+            sqlalchemy.text(
+                "SELECT reltuples FROM pg_class WHERE oid = to_regclass(:name)"
+            ).bindparams(name=name)
+        )
+        # -1: never vacuumed or analyzed, the planner estimates are guesses
+        if reltuples is None or reltuples < 0:
+            return None
+        if reltuples > 0:
+            return int(reltuples)
+    plan = await database.fetch_val(_Explain(await queryset.as_select()))
+    if isinstance(plan, (str, bytes)):
+        plan = orjson.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def _estimate_sqlite(queryset: QuerySet, database: Any) -> int | None:
+    if not is_unfiltered(queryset):
+        return None
+    try:
+        # the first number of the statistics is the amount of rows of the table
+        stat = await database.fetch_val(
+            sqlalchemy.text("SELECT stat FROM sqlite_stat1 WHERE tbl = :tbl LIMIT 1").bindparams(
+                tbl=queryset.table.name
+            )
+        )
+    except Exception:
+        # `ANALYZE` never ran, so there is no sqlite_stat1 table
+        return None
+    if not stat:
+        return None
+    return int(stat.split(" ", 1)[0])
+
+
+async def _estimate_mysql(queryset: QuerySet, database: Any) -> int | None:
+    table = queryset.table
+    if is_unfiltered(queryset):
+        schema = (
+            sqlalchemy.literal(table.schema)
+            if table.schema is not None
+            else sqlalchemy.func.database()
+        )
+        query: sqlalchemy.Select = sqlalchemy.select(sqlalchemy.column("table_rows")).select_from(
+            sqlalchemy.table("tables", schema="information_schema")
+        )
+        rows = await database.fetch_val(
+            query.where(
+                sqlalchemy.column("table_schema") == schema,
+                sqlalchemy.column("table_name") == table.name,
+            )
+        )
+        return None if rows is None else int(rows)
+    rows = await database.fetch_all(_Explain(await queryset.as_select()))
+    if not rows:
+        return None
+    return int(rows[0]._mapping["rows"] or 0)
+
+
+_estimators = {
+    "postgresql": _estimate_postgresql,
+    "sqlite": _estimate_sqlite,
+    "mysql": _estimate_mysql,
+    "mariadb": _estimate_mysql,
+}
+
+
+async def estimate_count(queryset: QuerySet) -> int | None:
+    """
+    Estimates the amount of rows of the queryset from the statistics of the database.
+
+    Returns `None` when the dialect or the statistics provide no estimate.
+    """
+    estimator = _estimators.get(queryset.database.url.dialect)
+    if estimator is None:
+        return None
+    check_db_connection(queryset.database)
+    async with queryset.database as database:
+        return await estimator(queryset, database)
+
+
+class CountCache:
+    """
+    A TTL cache for the exact counts of querysets.
+
+    The counts are keyed by the compiled count statement and the database. Stale counts
+    are returned while they are refreshed in the background.
+
+    Args:
+        maxsize (int): The maximum amount of cached counts. The least recently used ones are
+            evicted first.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._counts: OrderedDict[Hashable, tuple[float, int]] = OrderedDict()
+        self._refreshing: dict[Hashable, asyncio.Task] = {}
+
+    async def get_key(self, queryset: QuerySet) -> Hashable:
+        compiled = (await queryset._get_count_expression()).compile()
+        return (
+            str(queryset.database.url),
+            str(compiled),
+            repr(sorted(compiled.params.items())),
+        )
+
+    async def _refresh(self, key: Hashable, queryset: QuerySet) -> int:
+        # a fresh queryset, the cached count of the queryset could be outdated
+        count = await queryset.all(clear_cache=True).count()
+        self._counts[key] = (time.monotonic(), count)
+        self._counts.move_to_end(key)
+        while len(self._counts) > self.maxsize:
+            self._counts.popitem(last=False)
+        return count
+
+    async def _background_refresh(self, key: Hashable, queryset: QuerySet) -> None:
+        try:
+            await self._refresh(key, queryset)
+        except Exception:
+            # keep the stale count, the next access retries
+            pass
+        finally:
+            self._refreshing.pop(key, None)
+
+    async def count(self, queryset: QuerySet, ttl: float) -> int:
+        """
+        Returns the cached exact count of the queryset.
+
+        Counts older than `ttl` seconds are returned once more while a background task
+        refreshes them.
+
+        Args:
+            queryset (QuerySet): The queryset to count.
+            ttl (float): The time in seconds a count is fresh.
+
+        Returns:
+            int: The (possibly stale) count.
+        """
+        key = await self.get_key(queryset)
+        entry = self._counts.get(key)
+        if entry is None:
+            return await self._refresh(key, queryset)
+        self._counts.move_to_end(key)
+        if time.monotonic() - entry[0] > ttl and key not in self._refreshing:
+            self._refreshing[key] = asyncio.create_task(self._background_refresh(key, queryset))
+        return entry[1]
+
+    def clear(self) -> None:
+        """
+        Clears the cached counts.
+        """
+        self._counts.clear()
+
+
+count_cache = CountCache()
+
+
+async def get_total(
+    queryset: QuerySet,
+    *,
+    estimate_threshold: int | None = None,
+    cache_ttl: float = 0,
+) -> tuple[int, bool]:
+    """
+    Returns the amount of rows of the queryset and whether it is an estimate.
+
+    With an `estimate_threshold` the estimate of the database statistics is used when it
+    is at least the threshold, so large tables aren't scanned. Otherwise the exact count is
+    used, cached for `cache_ttl` seconds (in `count_cache`) if set.
+
+    Args:
+        queryset (QuerySet): The queryset to count.
+        estimate_threshold (int | None): The minimum estimate returned instead of the exact
+            count. `None` disables estimates.
+        cache_ttl (float): The time in seconds an exact count is cached. 0 disables the cache.
+
+    Returns:
+        tuple[int, bool]: The amount of rows and `True` if it is an estimate.
+    """
+    if queryset._cache_count is not None:
+        return queryset._cache_count, False
+    if estimate_threshold is not None:
+        estimate = await estimate_count(queryset)
+        if estimate is not None and estimate >= estimate_threshold:
+            return estimate, True
+    if cache_ttl > 0:
+        return await count_cache.count(queryset, cache_ttl), False
+    return await queryset.count(), False
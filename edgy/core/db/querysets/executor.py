@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any, Generic, cast
 
 import sqlalchemy
 
-from edgy.core.db.context_vars import CURRENT_INSTANCE
+from edgy.core.db.context_vars import CURRENT_FILE_CLEANUPS, CURRENT_INSTANCE
 from edgy.core.db.datastructures import QueryModelResultCache
 from edgy.core.db.querysets.clauses import and_, or_
 from edgy.core.db.querysets.parser import ResultParser
@@ -378,24 +378,33 @@ class QueryExecutor(Generic[EdgyModel, EdgyEmbedTarget]):
         row_count = 0
 
         executor: QueryExecutor[EdgyModel, EdgyEmbedTarget] = QueryExecutor(queryset)
+        # files queued by the post delete callbacks of the file fields, inserted per batch
+        queued_files: dict[Any, list[dict[str, Any]]] = {}
         token = CURRENT_INSTANCE.set(self.queryset)
+        token_files = CURRENT_FILE_CLEANUPS.set(queued_files)
         try:
             # Use the new executor's iterate method
             models = [tup[0] async for tup in executor.iterate(fetch_all_at_once=True)]
             while models:
                 exclusion_filters = []
-                for model in models:
-                    try:
-                        _row_count = await model.raw_delete(
-                            skip_post_delete_hooks=False,
-                            remove_referenced_call=remove_referenced_call,
-                        )
-                    except SkipOperation:
-                        # raised from raw_delete
-                        exclusion_filters.append(and_(*model.identifying_clauses()))
-                        continue
-                    if _row_count != 0:
-                        row_count += 1
+                try:
+                    for model in models:
+                        try:
+                            _row_count = await model.raw_delete(
+                                skip_post_delete_hooks=False,
+                                remove_referenced_call=remove_referenced_call,
+                            )
+                        except SkipOperation:
+                            # raised from raw_delete
+                            exclusion_filters.append(and_(*model.identifying_clauses()))
+                            continue
+                        if _row_count != 0:
+                            row_count += 1
+                finally:
+                    # also the files of the models deleted before an error
+                    for cleanup_model, files in queued_files.items():
+                        await cleanup_model.enqueue_many(files)
+                    queued_files.clear()
 
                 # we fetched all
                 if self.queryset._batch_size is None:
@@ -408,5 +417,6 @@ class QueryExecutor(Generic[EdgyModel, EdgyEmbedTarget]):
                 executor.queryset._clear_cache(keep_cached_selected=True)
                 models = [tup[0] async for tup in executor.iterate(fetch_all_at_once=True)]
         finally:
+            CURRENT_FILE_CLEANUPS.reset(token_files)
             CURRENT_INSTANCE.reset(token)
         return row_count
@@ -3,6 +3,9 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, cast
 
+from edgy.conf import settings
+from edgy.core.tenancy.search_path import SearchPathDatabase, supports_search_path
+
 if TYPE_CHECKING:
     import sqlalchemy
 
@@ -35,14 +38,24 @@ class QuerySetPropsMixin:
         linked to this queryset. This ensures that every queryset operates within a
         defined database context.
 
+        In the `search_path` tenancy mode the database is wrapped, so entering it binds
+        the active schema to the connection.
+
         Returns:
             Database: The database instance that the queryset will use for its
                       operations.
         """
-        if self._database is None:
+        database = self._database
+        if database is None:
             # Cast to Database is necessary as model_class.database is not directly typed.
-            return cast("Database", self.model_class.database)
-        return self._database
+            database = cast("Database", self.model_class.database)
+        schema = self._get_search_path_schema(database)
+        if schema is not None:
+            return cast(
+                "Database",
+                SearchPathDatabase(database, schema, tablename=self.model_class.meta.tablename),
+            )
+        return database
 
     @database.setter
     def database(self, value: Database) -> None:
@@ -57,7 +70,8 @@ class QuerySetPropsMixin:
         Args:
             value (Database): The new database instance to associate with the queryset.
         """
-        self._database = value
+        # unwrap the database of the search_path tenancy mode
+        self._database = getattr(value, "wrapped_database", value)
         # Clear the cache to ensure table is reloaded based on the new database.
         self._clear_cache()
 
@@ -77,7 +91,7 @@ class QuerySetPropsMixin:
         """
         if self._table is None:
             # Cast to sqlalchemy.Table is necessary as table_schema return type is Any.
-            return cast("sqlalchemy.Table", self.model_class.table_schema(self.active_schema))
+            return cast("sqlalchemy.Table", self.model_class.table_schema(self.table_schema_name))
         return self._table
 
     @table.setter
@@ -97,6 +111,36 @@ class QuerySetPropsMixin:
         # Clear the cache to ensure any dependent components are refreshed.
         self._clear_cache()
 
+    @property
+    def search_path_schema(self) -> str | None:
+        """
+        Returns the schema bound via `search_path` or None when the queryset uses
+        schema-qualified tables.
+
+        The `search_path` tenancy mode applies to PostgreSQL databases and models
+        without an explicit schema.
+        """
+        database = self._database
+        if database is None:
+            database = cast("Database", self.model_class.database)
+        return self._get_search_path_schema(database)
+
+    @property
+    def table_schema_name(self) -> str | None:
+        """
+        Returns the schema used for building the tables of the query.
+        """
+        if self.search_path_schema is not None:
+            return None
+        return cast("str | None", self.active_schema)
+
+    def _get_search_path_schema(self, database: Database) -> str | None:
+        if settings.tenancy_mode != "search_path" or not self.active_schema:
+            return None
+        if self.model_class.get_db_schema() or not supports_search_path(database):
+            return None
+        return cast(str, self.active_schema)
+
     @property
     def pknames(self) -> Sequence[str]:
         """
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any, Generic, Literal, cast
 from edgy.core.connection.database import Database
 from edgy.core.db.context_vars import set_schema
 from edgy.core.db.querysets.types import EdgyEmbedTarget, EdgyModel
+from edgy.core.tenancy.search_path import SearchPathDatabase
 from edgy.types import Undefined
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -86,8 +87,11 @@ class TenancyMixin(Generic[EdgyModel, EdgyEmbedTarget]):
         # Process the 'database' argument.
         if database is not Undefined:
             registry = cast("Registry", queryset.model_class.meta.registry)
-            if isinstance(database, Database):
-                connection: Database = database
+            if isinstance(database, SearchPathDatabase):
+                # the schema is bound by the queryset
+                connection: Database = database.wrapped_database
+            elif isinstance(database, Database):
+                connection = database
             elif database is None:
                 # Use the default database from the model's registry.
                 connection = registry.database
@@ -13,6 +13,7 @@ from collections.abc import (
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, Generic, Literal, cast, overload
 
+import orjson
 import sqlalchemy
 
 from edgy.core.db.context_vars import CURRENT_INSTANCE
@@ -35,9 +36,12 @@ from .types import (
 )
 
 if TYPE_CHECKING:  # pragma: no cover
+    import numpy
+    import pyarrow
     from databasez.core.transaction import Transaction
 
     from edgy.core.db.querysets.combined import CombinedQuerySet
+    from edgy.core.marshalls.base import BaseMarshall
 
 
 class QuerySet(BaseQuerySet[EdgyModel, EdgyEmbedTarget], Generic[EdgyModel, EdgyEmbedTarget]):
@@ -741,6 +745,115 @@ class QuerySet(BaseQuerySet[EdgyModel, EdgyEmbedTarget], Generic[EdgyModel, Edgy
         else:
             return [row.model_dump(exclude=exclude, exclude_none=exclude_none) for row in rows]
 
+    async def iter_json(
+        self,
+        chunk_size: int = 100,
+        *,
+        ndjson: bool = False,
+        marshall_class: type[BaseMarshall] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[bytes]:
+        """
+        Streams the results of the QuerySet as JSON encoded byte chunks.
+
+        Rows are fetched via the batched iterator with `chunk_size` as batch size, so at
+        most one chunk of models is held in memory. This makes it suitable for streaming
+        responses. `only()`, `defer()` and `exclude_secrets()` are honored because only
+        loaded fields are dumped.
+
+        Args:
+            chunk_size: The amount of rows fetched and serialized per chunk.
+            ndjson: If `True`, emits newline delimited JSON (one object per line) instead of
+                    a single JSON array.
+            marshall_class: An optional marshall class. When provided, every model is wrapped
+                            in it and the field selection of the marshall is used.
+            **kwargs: Extra keyword arguments passed to `model_dump`, e.g. `exclude`.
+
+        Yields:
+            JSON encoded chunks. Concatenated they form a valid JSON array or NDJSON document.
+
+        Raises:
+            QuerySetError: If `chunk_size` is smaller than 1.
+        """
+        if chunk_size < 1:
+            raise QuerySetError(detail="chunk_size must be at least 1.")
+        kwargs["mode"] = "json"
+        separator = b"\n" if ndjson else b","
+        queryset: QuerySet = self.batch_size(chunk_size)
+        chunk: list[bytes] = []
+        # whether a chunk was already emitted (for the array brackets/separators)
+        started = False
+        async for result in queryset:
+            obj: Any = result if marshall_class is None else marshall_class(instance=result)
+            chunk.append(orjson.dumps(obj.model_dump(**kwargs)))
+            if len(chunk) >= chunk_size:
+                yield self._join_json_chunk(chunk, separator, ndjson=ndjson, started=started)
+                started = True
+                chunk = []
+        if chunk:
+            yield self._join_json_chunk(chunk, separator, ndjson=ndjson, started=started)
+            started = True
+        if not ndjson:
+            yield b"]" if started else b"[]"
+
+    @staticmethod
+    def _join_json_chunk(
+        chunk: list[bytes], separator: bytes, *, ndjson: bool, started: bool
+    ) -> bytes:
+        """
+        Joins serialized rows to a chunk of `iter_json`.
+        """
+        joined = separator.join(chunk)
+        if ndjson:
+            return joined + separator
+        # the first chunk opens the array, the following continue it
+        return (b"," if started else b"[") + joined
+
+    async def to_numpy_columns(self, chunk_size: int = 1000) -> dict[str, numpy.ndarray]:
+        """
+        Fetches the results column-wise into NumPy arrays, bypassing the model creation.
+
+        The compiled select is fetched in batches of `chunk_size` rows. Only the columns of the
+        queryset model are returned (`only()`, `defer()` and `exclude_secrets()` are honored).
+        The dtypes are derived from the field types, types without NumPy equivalent are stored
+        in object arrays. Nullable columns are returned as `numpy.ma.MaskedArray`.
+
+        Args:
+            chunk_size: The amount of rows fetched per database round-trip.
+
+        Returns:
+            A dictionary mapping the column keys (the field names for single column fields)
+            to arrays.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            QuerySetError: If `chunk_size` is smaller than 1.
+        """
+        from edgy.core.db.querysets.columnar import fetch_numpy_columns
+
+        return await fetch_numpy_columns(self, chunk_size)
+
+    async def to_arrow(self, chunk_size: int = 1000) -> pyarrow.Table:
+        """
+        Fetches the results column-wise into an Arrow table, bypassing the model creation.
+
+        Like `to_numpy_columns()` but every fetched batch becomes a record batch of the table.
+        JSON, UUID and unknown values are stored as strings and enums as their values.
+
+        Args:
+            chunk_size: The amount of rows fetched per database round-trip.
+
+        Returns:
+            A `pyarrow.Table` with a column per selected model column.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            QuerySetError: If `chunk_size` is smaller than 1.
+        """
+        from edgy.core.db.querysets.columnar import fetch_arrow_table
+
+        return await fetch_arrow_table(self, chunk_size)
+
     async def values_list(
         self,
         fields: Sequence[str] | str | None = None,
@@ -822,6 +935,37 @@ class QuerySet(BaseQuerySet[EdgyModel, EdgyEmbedTarget], Generic[EdgyModel, Edgy
         if self._cache_count is not None:
             return self._cache_count
 
+        count_query = await self._get_count_expression()
+        check_db_connection(self.database)
+        async with self.database as database:
+            self._cache_count = count = cast(int, await database.fetch_val(count_query))
+        return count
+
+    total = count
+
+    async def estimate_count(self) -> int:
+        """
+        Returns an estimate of the amount of records matching the query, taken from the
+        statistics of the database instead of counting the rows.
+
+        PostgreSQL uses `reltuples` of the table for unfiltered querysets and the row estimate
+        of `EXPLAIN` otherwise, MySQL/MariaDB `information_schema.tables` and `EXPLAIN` and
+        SQLite the `sqlite_stat1` table (filled by `ANALYZE`) for unfiltered querysets.
+        Falls back to `count()` when no estimate is available.
+        """
+        if self._cache_count is not None:
+            return self._cache_count
+        from edgy.core.db.querysets.counting import estimate_count
+
+        estimate = await estimate_count(self)
+        if estimate is None:
+            return await self.count()
+        return estimate
+
+    async def _get_count_expression(self) -> sqlalchemy.Select:
+        """
+        Returns the SELECT COUNT statement of `count`.
+        """
         queryset: QuerySet = self
 
         needs_distinct = (
@@ -846,13 +990,7 @@ class QuerySet(BaseQuerySet[EdgyModel, EdgyEmbedTarget], Generic[EdgyModel, Edgy
         else:
             # Simple COUNT(*) over the subquery
             count_query = sqlalchemy.select(sqlalchemy.func.count()).select_from(subquery)
-
-        check_db_connection(queryset.database)
-        async with queryset.database as database:
-            self._cache_count = count = cast(int, await database.fetch_val(count_query))
-        return count
-
-    total = count
+        return count_query
 
     async def get_or_none(self, **kwargs: Any) -> EdgyEmbedTarget | None:
         """
@@ -15,11 +15,14 @@ from typing import TYPE_CHECKING, Any, Generic, Literal, ParamSpec, TypeAlias, U
 from edgy.types import Undefined
 
 if TYPE_CHECKING:
+    import numpy
+    import pyarrow
     import sqlalchemy
     from databasez.core.transaction import Transaction
 
     from edgy.core.connection import Database
     from edgy.core.db.models.types import BaseModelType
+    from edgy.core.marshalls.base import BaseMarshall
 
 if sys.version_info >= (3, 13):  # pragma: no cover
     from typing import TypeVar
@@ -453,6 +456,17 @@ class QuerySetType(ABC, Generic[EdgyModel, EdgyEmbedTarget]):
         """
         ...
 
+    @abstractmethod
+    async def estimate_count(self) -> int:
+        """
+        Abstract method to get an estimate of the number of objects matching the QuerySet
+        criteria from the statistics of the database.
+
+        Returns:
+            int: The estimated count of matching objects.
+        """
+        ...
+
     @abstractmethod
     async def get_or_none(self, **kwargs: Any) -> EdgyEmbedTarget | None:
         """
@@ -838,6 +852,55 @@ class QuerySetType(ABC, Generic[EdgyModel, EdgyEmbedTarget]):
         """
         ...
 
+    @abstractmethod
+    def iter_json(
+        self,
+        chunk_size: int = 100,
+        *,
+        ndjson: bool = False,
+        marshall_class: type[BaseMarshall] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[bytes]:
+        """
+        Abstract method to stream the results as JSON encoded byte chunks.
+
+        Args:
+            chunk_size (int): Amount of rows fetched and serialized per chunk.
+            ndjson (bool): If True, newline delimited JSON is emitted instead of a JSON array.
+            marshall_class (type[BaseMarshall] | None): An optional marshall used for serializing.
+            **kwargs: Extra arguments passed to `model_dump`.
+
+        Returns:
+            AsyncIterator[bytes]: The JSON encoded chunks.
+        """
+        ...
+
+    @abstractmethod
+    async def to_numpy_columns(self, chunk_size: int = 1000) -> dict[str, numpy.ndarray]:
+        """
+        Abstract method to fetch the results column-wise into NumPy arrays.
+
+        Args:
+            chunk_size (int): Amount of rows fetched per database round-trip.
+
+        Returns:
+            dict[str, numpy.ndarray]: The arrays by column key.
+        """
+        ...
+
+    @abstractmethod
+    async def to_arrow(self, chunk_size: int = 1000) -> pyarrow.Table:
+        """
+        Abstract method to fetch the results column-wise into an Arrow table.
+
+        Args:
+            chunk_size (int): Amount of rows fetched per database round-trip.
+
+        Returns:
+            pyarrow.Table: The table with a column per selected model column.
+        """
+        ...
+
     @abstractmethod
     async def values_list(
         self,
@@ -50,6 +50,12 @@ class RelatedField(RelationshipField):
         """
         self.foreign_key_name = foreign_key_name
         self.related_from = related_from
+        annotation: Any = list[related_from]  # type: ignore
+        if related_from.model_config.get("defer_build", False):
+            # The field isn't validated. Don't inline the schema of the unbuilt related_from
+            # model, the first build of a model would recurse through the whole chain of
+            # related models otherwise.
+            annotation = list[Any]
 
         super().__init__(
             # Do not inherit properties from parent fields.
@@ -58,8 +64,8 @@ class RelatedField(RelationshipField):
             exclude=True,
             # The field type is a list of instances of the related_from model.
             field_type=list[related_from],  # type: ignore
-            # The annotation also reflects a list of related_from model instances.
-            annotation=list[related_from],  # type: ignore
+            # The annotation reflects a list of related_from model instances.
+            annotation=annotation,
             # This field does not correspond directly to a database column type.
             column_type=None,
             # This field can be null, as related objects might not always exist.
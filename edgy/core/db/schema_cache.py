@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast, overload
+
+import sqlalchemy
+
+from edgy.conf import settings
+from edgy.types import Undefined
+
+if TYPE_CHECKING:
+    from edgy.core.db.models.types import BaseModelType
+
+# Rough per-object costs of a table copy, measured with tracemalloc.
+# Used for the memory budget, the real size depends on the column types.
+TABLE_BASE_MEMORY = 4096
+TABLE_ITEM_MEMORY = 2048
+
+
+def estimate_table_memory(table: sqlalchemy.Table) -> int:
+    """
+    Estimates the memory usage of a table in bytes from its columns, constraints and indexes.
+    """
+    return TABLE_BASE_MEMORY + TABLE_ITEM_MEMORY * (
+        len(table.columns) + len(table.constraints) + len(table.indexes)
+    )
+
+
+class SchemaTableCacheStats(NamedTuple):
+    """
+    Metrics of a `SchemaTableCache`.
+
+    Attributes:
+        hits: Lookups served from the cache.
+        misses: Lookups which built a new table.
+        evictions: Tables removed because the budget was exceeded.
+        size: Amount of cached tables.
+        memory: Estimated memory usage of the cached tables in bytes.
+        schemas: Amount of shared per-schema MetaData objects.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    memory: int
+    schemas: int
+
+
+class _CacheEntry(NamedTuple):
+    table: sqlalchemy.Table
+    memory: int
+    # key of the shared MetaData, None when the caller provided the metadata
+    metadata_key: tuple[sqlalchemy.MetaData, str] | None
+
+
+class SchemaTableCache:
+    """
+    Global LRU cache for the per-schema table copies of models.
+
+    The budget is shared by all models and bounded by the amount of tables (`max_size`)
+    and/or by their estimated memory usage (`max_memory`). By default the limits are taken from
+    the settings `schema_table_cache_size` and `schema_table_cache_memory`. `None` disables a limit.
+
+    Copies of the same schema share one MetaData per registry metadata, so they can reference
+    each other. The cached tables of a model are exposed via `model._db_schemas`.
+    """
+
+    def __init__(
+        self, max_size: int | None | Any = Undefined, max_memory: int | None | Any = Undefined
+    ) -> None:
+        self._max_size = max_size
+        self._max_memory = max_memory
+        # ordered from least to most recently used
+        self._entries: dict[tuple[type[BaseModelType], str], _CacheEntry] = {}
+        # the cached schemas of a model, for invalidating a model without a full scan
+        self._schemas_by_model: dict[type[BaseModelType], set[str]] = {}
+        self._metadatas: dict[tuple[sqlalchemy.MetaData, str], sqlalchemy.MetaData] = {}
+        self._metadata_refs: dict[tuple[sqlalchemy.MetaData, str], int] = {}
+        self._memory = 0
+        self._lock = threading.RLock()
+        self.reset_stats()
+
+    @property
+    def max_size(self) -> int | None:
+        if self._max_size is Undefined:
+            return settings.schema_table_cache_size
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int | None) -> None:
+        self._max_size = value
+        self._evict()
+
+    @property
+    def max_memory(self) -> int | None:
+        if self._max_memory is Undefined:
+            return settings.schema_table_cache_memory
+        return self._max_memory
+
+    @max_memory.setter
+    def max_memory(self, value: int | None) -> None:
+        self._max_memory = value
+        self._evict()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> SchemaTableCacheStats:
+        return SchemaTableCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._entries),
+            memory=self._memory,
+            schemas=len(self._metadatas),
+        )
+
+    @overload
+    def get_metadata(
+        self, source: sqlalchemy.MetaData, schema: str, *, create: Literal[True] = True
+    ) -> sqlalchemy.MetaData: ...
+
+    @overload
+    def get_metadata(
+        self, source: sqlalchemy.MetaData, schema: str, *, create: bool
+    ) -> sqlalchemy.MetaData | None: ...
+
+    def get_metadata(
+        self, source: sqlalchemy.MetaData, schema: str, *, create: bool = True
+    ) -> sqlalchemy.MetaData | None:
+        """
+        Returns the shared MetaData of `schema` for copies of tables from `source`.
+
+        Args:
+            source: The metadata of the original tables.
+            schema: The schema of the copies.
+            create: Create the MetaData when missing. Otherwise None is returned.
+        """
+        with self._lock:
+            key = (source, schema)
+            metadata = self._metadatas.get(key)
+            if metadata is None and create:
+                metadata = self._metadatas[key] = sqlalchemy.MetaData()
+                self._metadata_refs[key] = 0
+            return metadata
+
+    def get_table(
+        self,
+        model_class: type[BaseModelType],
+        schema: str,
+        *,
+        metadata: sqlalchemy.MetaData | None = None,
+        update_cache: bool = False,
+    ) -> sqlalchemy.Table:
+        """
+        Returns the cached table copy of `model_class` for `schema` or builds it.
+        """
+        key = (model_class, schema)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            db_schemas = model_class._db_schemas
+            # the model cache may have been cleared in the meantime
+            if entry is not None and not update_cache and db_schemas.get(schema) is entry.table:
+                self.hits += 1
+                # reinsert as most recently used
+                self._entries[key] = entry
+                return cast(sqlalchemy.Table, entry.table)
+            if entry is not None:
+                self._release(entry)
+            self.misses += 1
+            entry = self._build(model_class, schema, metadata)
+            db_schemas[schema] = entry.table
+            self._entries[key] = entry
+            self._schemas_by_model.setdefault(model_class, set()).add(schema)
+            self._memory += entry.memory
+            self._evict()
+            return entry.table
+
+    def _build(
+        self,
+        model_class: type[BaseModelType],
+        schema: str,
+        metadata: sqlalchemy.MetaData | None,
+    ) -> _CacheEntry:
+        metadata_key: tuple[sqlalchemy.MetaData, str] | None = None
+        source: sqlalchemy.MetaData | None = None
+        if metadata is None:
+            registry = model_class.meta.registry
+            assert registry, "registry is not set"
+            source = registry.metadata_by_url[str(model_class.database.url)]
+            metadata = self.get_metadata(source, schema)
+            metadata_key = (source, schema)
+            # ensure the tables referenced outside of the schema exist
+            for field_name in model_class.meta.foreign_key_fields:
+                target = model_class.meta.fields[field_name].target
+                if target.meta.registry is registry and not target.__is_proxy_model__:
+                    target.table  # noqa: B018
+        table = model_class.build(schema=schema, metadata=metadata)
+        if source is not None and metadata_key is not None:
+            self._metadata_refs[metadata_key] += 1
+            # referenced tables outside of the schema must be resolvable in the shared metadata
+            for constraint in table.foreign_key_constraints:
+                for element in constraint.elements:
+                    target_key = element.target_fullname.rsplit(".", 1)[0]
+                    if target_key not in metadata.tables and target_key in source.tables:
+                        source.tables[target_key].to_metadata(metadata)
+        return _CacheEntry(
+            table=table, memory=estimate_table_memory(table), metadata_key=metadata_key
+        )
+
+    def _release(self, entry: _CacheEntry) -> None:
+        self._memory -= entry.memory
+        if entry.metadata_key is None:
+            return
+        metadata = self._metadatas.get(entry.metadata_key)
+        if metadata is None:
+            return
+        if entry.table.key in metadata.tables and metadata.tables[entry.table.key] is entry.table:
+            metadata.remove(entry.table)
+        self._metadata_refs[entry.metadata_key] -= 1
+        if self._metadata_refs[entry.metadata_key] <= 0:
+            del self._metadatas[entry.metadata_key]
+            del self._metadata_refs[entry.metadata_key]
+
+    def _remove(self, key: tuple[type[BaseModelType], str]) -> None:
+        entry = self._entries.pop(key)
+        model_class, schema = key
+        schemas = self._schemas_by_model.get(model_class)
+        if schemas is not None:
+            schemas.discard(schema)
+            if not schemas:
+                del self._schemas_by_model[model_class]
+        db_schemas = model_class.__dict__.get("_db_schemas")
+        if db_schemas is not None and db_schemas.get(schema) is entry.table:
+            del db_schemas[schema]
+        self._release(entry)
+
+    def _evict(self) -> None:
+        with self._lock:
+            max_size = self.max_size
+            max_memory = self.max_memory
+            while self._entries and (
+                (max_size is not None and len(self._entries) > max_size)
+                or (max_memory is not None and self._memory > max_memory)
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, model_class: type[BaseModelType] | None = None) -> None:
+        """
+        Removes the cached tables of `model_class` or of all models.
+        """
+        with self._lock:
+            if model_class is None:
+                for key in list(self._entries):
+                    self._remove(key)
+                return
+            for schema in self._schemas_by_model.pop(model_class, ()):
+                if (model_class, schema) in self._entries:
+                    self._remove((model_class, schema))
+            model_class._db_schemas = {}
+
+    def prewarm(
+        self, model_classes: Iterable[type[BaseModelType]], schemas: Iterable[str]
+    ) -> None:
+        """
+        Builds the table copies of `model_classes` for `schemas`, e.g. for the tenants
+        active at startup.
+
+        The stats are not affected.
+        """
+        schemas = list(schemas)
+        hits, misses = self.hits, self.misses
+        for model_class in model_classes:
+            for schema in schemas:
+                model_class.table_schema(schema)
+        self.hits, self.misses = hits, misses
+
+
+schema_table_cache = SchemaTableCache()
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import asyncio
 import contextlib
 import os
 from collections.abc import Callable, Generator, Sequence
 from copy import copy
+from dataclasses import replace
 from functools import cached_property
 from io import BytesIO
 from typing import (
@@ -19,6 +19,7 @@ from typing import (
 
 from pydantic import Base64Bytes, BaseModel, ConfigDict, Field
 
+from edgy.core.files.scan import FileScan, scan_file
 from edgy.exceptions import FileOperationError, SuspiciousFileOperation
 
 if TYPE_CHECKING:
@@ -461,6 +462,8 @@ class FieldFile(File):
     instance: BaseModelType | None = None  # The model instance this file field belongs to.
     approved: bool  # Indicates if the file operation (e.g., save, delete) is approved.
     metadata: dict[str, Any]  # Stores additional metadata about the file.
+    # The scan of the staged content by the storage, reused by `scan`.
+    _content_scan: FileScan | None = None
 
     def __init__(
         self,
@@ -523,7 +526,7 @@ class FieldFile(File):
     def _execute_operation(self, nodelete_old: bool) -> None:
         """
         Synchronously executes the pending file operation (`save`, `delete`).
-        This method is designed to be called in a separate thread for async operations.
+        The async counterpart is `execute_operation`.
 
         Args:
             nodelete_old (bool): If True, prevents deletion of the old file during a 'save_delete' operation.
@@ -561,14 +564,42 @@ class FieldFile(File):
 
     async def execute_operation(self, nodelete_old: bool = False) -> None:
         """
-        Asynchronously executes the pending file operation.
-        It wraps the synchronous `_execute_operation` in `asyncio.to_thread`
-        to prevent blocking the event loop.
+        Asynchronously executes the pending file operation (`save`, `delete`).
+        It uses the async methods of the storages (`asave`, `adelete`), which run
+        the blocking file operations in a bounded thread pool by default.
 
         Args:
             nodelete_old (bool): If True, prevents deletion of the old file during a 'save_delete' operation.
         """
-        await asyncio.to_thread(self._execute_operation, nodelete_old=nodelete_old)
+        operation = self.operation
+        self.operation = "none"  # Reset operation to prevent re-execution.
+
+        if operation == "save" or operation == "save_delete":
+            if self.file is None or not self.name:
+                raise ValueError(
+                    f"The '{self.field.name}' attribute has no file associated with it."
+                )
+            try:
+                await self.storage.asave(self.file, self.name)
+            finally:
+                # Ensure the name is unreserved even if save fails.
+                self.storage.unreserve_name(self.name)
+
+            if (
+                not nodelete_old
+                and operation == "save_delete"
+                and self.old is not None  # Check if there's old file info
+                and self.old[1]  # Check if old name is not empty
+                and self.old[1] != self.name  # Only delete if name has changed
+            ):
+                await self.old[0].adelete(self.old[1])  # Delete the old file from its storage.
+        elif operation == "delete":
+            if getattr(self, "file", None):
+                self.close()  # Close the associated file object.
+            # Delete the old file if it exists and deletion is not suppressed.
+            if not nodelete_old and self.old is not None and self.old[1]:
+                await self.old[0].adelete(self.old[1])
+        self.old = None  # Clear old file information after operation.
 
     def save(
         self,
@@ -635,13 +666,29 @@ class FieldFile(File):
         if self.generate_name_fn is not None:
             name = self.generate_name_fn(name, content, direct_name)
 
-        if not name:
-            raise ValueError("No name found for the file.")
-
         # Determine the storage to use for this save operation.
         if storage is None:
             storage = self.storage
 
+        # Content addressed storages derive the name from the content. The scan is kept for
+        # the metadata, so the content is read once.
+        content_scan = storage.scan_content(
+            content, head_size=getattr(self.field, "scan_head_size", 2048)
+        )
+        name = storage.get_content_name(content, name, scan=content_scan)
+        if not name:
+            raise ValueError("No name found for the file.")
+        if (
+            storage.content_addressed
+            and storage is self.storage
+            and name == self.name
+            and self.operation == "none"
+        ):
+            # The same content is stored already.
+            if approved is not None:
+                self.approved = approved
+            return
+
         # Get an available name from the storage, handling conflicts and max_length.
         name = storage.get_available_name(
             name,
@@ -656,6 +703,7 @@ class FieldFile(File):
 
         # Update the FieldFile's state to reflect the new file.
         self.file = content
+        self._content_scan = content_scan
         self.old = (
             self.storage,
             self.name,
@@ -671,6 +719,50 @@ class FieldFile(File):
         elif self.change_removes_approval:
             self.approved = False  # Change removes approval if configured.
 
+    def scan(
+        self, *, hash_algorithm: str | None = "sha256", head_size: int = 2048
+    ) -> FileScan | None:
+        """
+        Reads the content once and returns its size, hash and first bytes (see `scan_file`).
+        This is the staged content if a save is pending, otherwise the stored file.
+        The found size is cached.
+
+        Args:
+            hash_algorithm (str | None): A `hashlib` algorithm. None to skip hashing.
+            head_size (int): The amount of bytes kept from the start.
+
+        Returns:
+            FileScan | None: The scan or None if the content cannot be read twice
+                             (not seekable) or there is no content.
+        """
+        content_scan = self._content_scan
+        if (
+            content_scan is not None
+            and self.operation in {"save", "save_delete"}
+            and (hash_algorithm is None or content_scan.hash_algorithm == hash_algorithm)
+            and (not content_scan.truncated or len(content_scan.head) >= head_size)
+        ):
+            # The storage read the staged content already.
+            self.size = content_scan.size
+            if hash_algorithm is None:
+                return replace(content_scan, digest=None, hash_algorithm=None)
+            return content_scan
+        was_closed = self.closed
+        try:
+            self.open("rb")
+        except FileOperationError:
+            return None
+        try:
+            if not self.seekable():
+                return None
+            assert self.file is not None  # Type checker hint
+            result = scan_file(self.file, hash_algorithm=hash_algorithm, head_size=head_size)
+        finally:
+            if was_closed:
+                self.close(keep_size=True)
+        self.size = result.size
+        return result
+
     def set_approved(self, approved: bool) -> None:
         """
         Sets the approval status of the file and stores the old state.
@@ -694,6 +786,7 @@ class FieldFile(File):
             if getattr(self, "file", None):
                 self.close()
             self.storage.unreserve_name(self.name)
+            self._content_scan = None
         if self.old is not None:
             # Restore previous state if an 'old' state was stored.
             self.storage, self.name, self.approved = self.old
@@ -729,14 +822,7 @@ class FieldFile(File):
             if getattr(self, "file", None):
                 self.close()  # Close the associated file object.
             self.storage.delete(self.name)  # Delete from storage.
-            # If the field allows null, clear the name.
-            if self.field.null:
-                self.name = ""
-            # Update approval status.
-            if approved is not None:
-                self.approved = approved
-            elif self.change_removes_approval:
-                self.approved = False
+            self._finish_instant_delete(approved)
             return
 
         # Stage for deferred deletion:
@@ -749,6 +835,45 @@ class FieldFile(File):
         elif self.change_removes_approval:
             self.approved = False
 
+    async def adelete(self, *, approved: bool | None = None, instant: bool = False) -> None:
+        """
+        Like `delete`, but instant deletions use `adelete` of the storage, so they don't
+        block the event loop.
+
+        Args:
+            approved (bool | None): Overrides the file's approval status for this deletion.
+            instant (bool): If True, the file is deleted immediately from storage.
+                            If False, the deletion is staged to occur when the model is saved.
+
+        Raises:
+            FileOperationError: If the field is not nullable and `instant` is False (cannot delete without replacing).
+        """
+        if not instant or not self:
+            # Staging doesn't touch the storage.
+            self.delete(approved=approved, instant=instant)
+            return
+        self.reset()  # Reset any pending operations first.
+        if getattr(self, "file", None):
+            self.close()  # Close the associated file object.
+        await self.storage.adelete(self.name)  # Delete from storage.
+        self._finish_instant_delete(approved)
+
+    def _finish_instant_delete(self, approved: bool | None) -> None:
+        """
+        Updates the name and the approval status after an instant deletion.
+
+        Args:
+            approved (bool | None): Overrides the file's approval status.
+        """
+        # If the field allows null, clear the name.
+        if self.field.null:
+            self.name = ""
+        # Update approval status.
+        if approved is not None:
+            self.approved = approved
+        elif self.change_removes_approval:
+            self.approved = False
+
     def close(self, keep_size: bool = False) -> None:
         if self.operation == "none":
             super().close(keep_size=keep_size)
@@ -776,6 +901,16 @@ class ImageFieldFile(FieldFile):
         """
         from PIL import Image  # pyright: ignore[reportMissingImports]
 
+        # Open the underlying binary file stream and pass it to Pillow's Image.open.
+        return Image.open(self.open("rb"), formats=self.get_image_formats())  # type: ignore
+
+    def get_image_formats(self) -> Sequence[str] | None:
+        """
+        Returns the image formats Pillow may open, depending on the approval.
+
+        Returns:
+            Sequence[str] | None: The allowed formats, None for all formats.
+        """
         allowed_formats: Sequence[str] | None = getattr(self.field, "image_formats", ())
         if self.approved and allowed_formats is not None:
             # If approved, consider both general allowed formats and approved-specific formats.
@@ -788,6 +923,4 @@ class ImageFieldFile(FieldFile):
             else:
                 # Combine general and approved-specific formats.
                 allowed_formats = (*allowed_formats, *approved_image_formats)
-
-        # Open the underlying binary file stream and pass it to Pillow's Image.open.
-        return Image.open(self.open("rb"), formats=allowed_formats)  # type: ignore
+        return allowed_formats
@@ -1,12 +1,128 @@
 from __future__ import annotations
 
 import contextlib
+import errno
 import os
+import sys
 from shutil import copymode, copystat
+from typing import Any, cast
 
 from edgy.core.files import locks
 
-__all__ = ["file_move_safe"]
+__all__ = ["copy_file_descriptor", "file_move_safe"]
+
+# ioctl request of Linux for cloning a file (reflink), see ioctl_ficlone(2).
+FICLONE = 0x40049409
+# errors meaning the kernel can't copy between the descriptors, the next method is tried
+_UNSUPPORTED_ERRNOS = frozenset(
+    code
+    for code in (
+        getattr(errno, name, None)
+        for name in ("EXDEV", "EINVAL", "ENOSYS", "EOPNOTSUPP", "ENOTSUP", "EBADF", "ETXTBSY")
+    )
+    if code is not None
+)
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    """
+    Clones the source into the empty destination (copy-on-write, e.g. btrfs, XFS).
+
+    Returns:
+        bool: True if the file was cloned.
+    """
+    if sys.platform != "linux":
+        return False
+    import fcntl
+
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+    except OSError as exc:
+        if exc.errno in _UNSUPPORTED_ERRNOS or exc.errno == errno.ENOTTY:
+            return False
+        raise
+    # the clone doesn't move the file position, writes must continue at the end
+    os.lseek(dst_fd, 0, os.SEEK_END)
+    return True
+
+
+def copy_file_descriptor(
+    src_fd: int, dst_fd: int, *, offset: int = 0, chunk_size: int = 1024 * 64
+) -> int:
+    """
+    Copies the regular file `src_fd` from `offset` to the current position of `dst_fd`.
+
+    The data is copied in the kernel where possible: by cloning the file (reflink) when
+    the whole file is copied into an empty file, else by `os.copy_file_range` or
+    `os.sendfile`. A chunked `os.pread`/`os.write` loop is the fallback. The position of
+    `src_fd` is not changed.
+
+    Args:
+        src_fd (int): The file descriptor to read from.
+        dst_fd (int): The file descriptor to write to.
+        offset (int, optional): The offset in the source. Defaults to 0.
+        chunk_size (int, optional): The chunk size of the fallback. Defaults to 64 KB.
+
+    Returns:
+        int: The amount of copied bytes.
+    """
+    size = os.fstat(src_fd).st_size
+    copied = 0
+    if (
+        size > 0
+        and offset == 0
+        and os.fstat(dst_fd).st_size == 0
+        and os.lseek(dst_fd, 0, os.SEEK_CUR) == 0
+        and _reflink(src_fd, dst_fd)
+    ):
+        return size
+
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None and size > 0:
+        try:
+            while offset + copied < size:
+                written = copy_file_range(src_fd, dst_fd, size - offset - copied, offset + copied)
+                if written == 0:
+                    break
+                copied += written
+        except OSError as exc:
+            if exc.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+
+    sendfile = getattr(os, "sendfile", None)
+    if sendfile is not None and size > 0 and offset + copied < size:
+        try:
+            while offset + copied < size:
+                written = sendfile(dst_fd, src_fd, offset + copied, size - offset - copied)
+                if written == 0:
+                    break
+                copied += written
+        except OSError as exc:
+            if exc.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+
+    # fallback, also for data beyond the size when the file grew
+    pread = getattr(os, "pread", None)
+    position = None if pread is not None else os.lseek(src_fd, 0, os.SEEK_CUR)
+    try:
+        while True:
+            if pread is not None:
+                chunk = pread(src_fd, chunk_size, offset + copied)
+            else:
+                # no pread on Windows, the position is restored afterwards
+                os.lseek(src_fd, offset + copied, os.SEEK_SET)
+                chunk = os.read(src_fd, chunk_size)
+            if not chunk:
+                break
+            view = memoryview(chunk)
+            while view:
+                written = os.write(dst_fd, view)
+                view = view[written:]
+            copied += len(chunk)
+    finally:
+        if position is not None:
+            os.lseek(src_fd, position, os.SEEK_SET)
+    return copied
 
 
 def _samefile(src: str, dst: str) -> bool:
@@ -86,9 +202,8 @@ def file_move_safe(
     # Open the old file for reading in binary mode.
     # Open the new file for writing, creating it exclusively (if not allowing overwrite)
     # and in binary mode.
-    with (
-        open(old_file_name, "rb") as old_file,
-        os.open(
+    with open(old_file_name, "rb") as old_file:
+        fd = os.open(
             new_file_name,
             (
                 os.O_WRONLY  # Write-only
@@ -96,21 +211,17 @@ def file_move_safe(
                 | getattr(os, "O_BINARY", 0)  # Binary mode (Windows specific)
                 | (os.O_EXCL if not allow_overwrite else 0)  # Exclusive creation (if no overwrite)
             ),
-        ) as fd,
-    ):
-        # Acquire an exclusive lock on the new file descriptor to prevent other processes
-        # from writing to it concurrently during the copy operation.
-        locks.lock(fd, locks.LOCK_EX)
-        while True:
-            # Read data in chunks from the old file.
-            current_chunk = old_file.read(chunk_size)
-            if not current_chunk:
-                # Break loop if end of file is reached.
-                break
-            # Write the chunk to the new file using the file descriptor.
-            os.write(fd, current_chunk)
-        # Release the lock after writing is complete.
-        locks.unlock(fd)
+        )
+        try:
+            # Acquire an exclusive lock on the new file descriptor to prevent other processes
+            # from writing to it concurrently during the copy operation.
+            locks.lock(cast(Any, fd), locks.LOCK_EX)
+            # Copy in the kernel where possible, in chunks otherwise.
+            copy_file_descriptor(old_file.fileno(), fd, chunk_size=chunk_size)
+            # Release the lock after writing is complete.
+            locks.unlock(cast(Any, fd))
+        finally:
+            os.close(fd)
 
     try:
         # Attempt to copy file metadata (permissions, timestamps) from old to new.
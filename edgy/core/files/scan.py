@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+from dataclasses import dataclass
+from typing import BinaryIO
+
+__all__ = ["FileScan", "scan_file"]
+
+
+@dataclass(frozen=True, kw_only=True)
+class FileScan:
+    """
+    The result of reading a file once with `scan_file`.
+
+    Attributes:
+        size (int): The size of the content in bytes.
+        digest (str | None): The hex digest of the content, None if no hash was calculated.
+        head (bytes): The first bytes of the content, used for sniffing the MIME type or
+            the image header.
+        hash_algorithm (str | None): The `hashlib` algorithm of the digest.
+    """
+
+    size: int
+    digest: str | None
+    head: bytes
+    hash_algorithm: str | None = None
+
+    @property
+    def truncated(self) -> bool:
+        """Whether `head` contains only a part of the content."""
+        return len(self.head) < self.size
+
+
+def scan_file(
+    file: BinaryIO,
+    *,
+    hash_algorithm: str | None = "sha256",
+    head_size: int = 2048,
+    chunk_size: int = 64 * 2**10,
+) -> FileScan:
+    """
+    Reads a file from the start in one pass and calculates its size, a hash of the content and
+    keeps the first bytes.
+
+    The position of the file is restored afterwards.
+
+    Args:
+        file (BinaryIO): A seekable binary file.
+        hash_algorithm (str | None): A `hashlib` algorithm. None to skip hashing.
+        head_size (int): The amount of bytes kept from the start.
+        chunk_size (int): The size of the chunks read.
+
+    Returns:
+        FileScan: The size, the digest and the head of the content.
+    """
+    hasher = hashlib.new(hash_algorithm) if hash_algorithm else None
+    head = bytearray()
+    size = 0
+    position = file.tell()
+    file.seek(0)
+    try:
+        while chunk := file.read(chunk_size):
+            size += len(chunk)
+            if hasher is not None:
+                hasher.update(chunk)
+            if len(head) < head_size:
+                head += chunk[: head_size - len(head)]
+            elif hasher is None:
+                # only the size is missing
+                size = max(size, file.seek(0, 2))
+                break
+    finally:
+        with contextlib.suppress(OSError):
+            file.seek(position)
+    return FileScan(
+        size=size,
+        digest=hasher.hexdigest() if hasher is not None else None,
+        head=bytes(head),
+        hash_algorithm=hash_algorithm if hasher is not None else None,
+    )
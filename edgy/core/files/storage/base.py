@@ -1,10 +1,20 @@
+import asyncio
+import inspect
 import os
 import pathlib
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from datetime import datetime
-from typing import Any, TypeVar
+from functools import partial
+from tempfile import SpooledTemporaryFile
+from threading import Lock
+from typing import Any, BinaryIO, ParamSpec, TypeVar, cast
 
+from edgy.conf import settings
 from edgy.core.files.base import ContentFile, File
+from edgy.core.files.scan import FileScan
 from edgy.exceptions import SuspiciousFileOperation
 from edgy.utils.path import get_random_string, get_valid_filename, validate_file_name
 
@@ -12,6 +22,65 @@ from edgy.utils.path import get_random_string, get_valid_filename, validate_file
 _arg_val = TypeVar("_arg_val")
 # Type variable for a generic setting value.
 _arg_setting = TypeVar("_arg_setting")
+_T = TypeVar("_T")
+_P = ParamSpec("_P")
+
+# the thread pool of the async storage methods and the pid it was created in
+_executor: tuple[int, ThreadPoolExecutor] | None = None
+_executor_lock = Lock()
+
+
+def get_storage_executor() -> ThreadPoolExecutor:
+    """
+    Returns the thread pool used by the async storage methods.
+
+    The pool is bounded by `settings.file_storage_threads` and recreated in forked processes.
+
+    Returns:
+        ThreadPoolExecutor: The thread pool.
+    """
+    global _executor
+    executor = _executor
+    pid = os.getpid()
+    if executor is None or executor[0] != pid:
+        with _executor_lock:
+            executor = _executor
+            if executor is None or executor[0] != pid:
+                # the threads of the parent process don't exist in a forked child
+                executor = (
+                    pid,
+                    ThreadPoolExecutor(
+                        max_workers=settings.file_storage_threads,
+                        thread_name_prefix="edgy-storage",
+                    ),
+                )
+                _executor = executor
+    return executor[1]
+
+
+async def run_in_storage_thread(fn: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs) -> _T:
+    """
+    Runs a blocking function in the thread pool of the storages, with the current context.
+
+    Args:
+        fn (Callable): The blocking function.
+        *args: The positional arguments of the function.
+        **kwargs: The keyword arguments of the function.
+
+    Returns:
+        The result of the function.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_storage_executor(), partial(copy_context().run, fn, *args, **kwargs)
+    )
+
+
+def is_async_readable(content: Any) -> bool:
+    """
+    Checks if the content is an async stream, e.g. an upload with an async `read` method.
+    """
+    return inspect.iscoroutinefunction(getattr(content, "read", None))
 
 
 class Storage(ABC):
@@ -29,6 +98,8 @@ class Storage(ABC):
 
     # automatically set by handler
     name: str = ""
+    # names are derived from the content, saving the same content results in the same name
+    content_addressed: bool = False
 
     # private helper
     @staticmethod
@@ -120,6 +191,49 @@ class Storage(ABC):
 
         self._save(content, name)
 
+    async def aopen(self, name: str, mode: str | None = None) -> Any:
+        """
+        Opens a file from the storage system without blocking the event loop.
+
+        By default `open` runs in the thread pool of the storages.
+
+        Args:
+            name (str): The name (path) of the file to open.
+            mode (str | None): The mode in which to open the file. Defaults to 'rb'.
+
+        Returns:
+            Any: A file-like object specific to the storage backend.
+        """
+        return await run_in_storage_thread(self.open, name, mode)
+
+    async def asave(self, content: Any, name: str = "") -> None:
+        """
+        Saves new content to the file specified by `name` without blocking the event loop.
+
+        Additionally to the content types of `save`, async streams (objects with an async
+        `read` method, e.g. uploads) are accepted. By default they are spooled into a
+        temporary file and `save` runs in the thread pool of the storages.
+
+        Args:
+            content (Any): The content to be saved.
+            name (str): The desired name (path) for the saved file. If empty,
+                        the `name` (or `filename`) attribute of the `content` object is used.
+        """
+        if not is_async_readable(content):
+            await run_in_storage_thread(self.save, content, name)
+            return
+        if not name:
+            name = getattr(content, "filename", None) or content.name
+        spooled = SpooledTemporaryFile(
+            max_size=File.DEFAULT_CHUNK_SIZE * 16, dir=settings.file_upload_temp_dir
+        )
+        try:
+            while chunk := await content.read(File.DEFAULT_CHUNK_SIZE):
+                await run_in_storage_thread(spooled.write, chunk)
+            await run_in_storage_thread(self.save, File(cast(BinaryIO, spooled), name), name)
+        finally:
+            spooled.close()
+
     @abstractmethod
     def reserve_name(self, name: str) -> bool:
         """
@@ -166,6 +280,37 @@ class Storage(ABC):
         # Further sanitize the name to be valid for the filesystem.
         return get_valid_filename(name)
 
+    def scan_content(self, content: BinaryIO, *, head_size: int = 2048) -> FileScan | None:
+        """
+        Reads the content for `get_content_name`. By default the content isn't read,
+        content addressed storages hash it. `FieldFile` keeps the scan, so the metadata
+        of the file doesn't read the content again.
+
+        Args:
+            content (BinaryIO): The content to be saved.
+            head_size (int): The amount of bytes kept from the start.
+
+        Returns:
+            FileScan | None: The scan or None if the name doesn't depend on the content.
+        """
+        return None
+
+    def get_content_name(self, content: BinaryIO, name: str, scan: FileScan | None = None) -> str:
+        """
+        Returns the name under which new content is stored, before an available name
+        is determined. By default this is the provided name. Content addressed storages
+        derive the name from the content instead.
+
+        Args:
+            content (BinaryIO): The content to be saved.
+            name (str): The provided or generated name.
+            scan (FileScan | None): The result of `scan_content`, if available.
+
+        Returns:
+            str: The name for the content.
+        """
+        return name
+
     def get_alternative_name(self, file_root: str, file_ext: str) -> str:
         """
         Generates an alternative filename by appending an underscore and a random
@@ -304,6 +449,17 @@ class Storage(ABC):
         """
         ...
 
+    async def adelete(self, name: str) -> None:
+        """
+        Deletes the specified file without blocking the event loop.
+
+        By default `delete` runs in the thread pool of the storages.
+
+        Args:
+            name (str): The name (path) of the file to delete.
+        """
+        await run_in_storage_thread(self.delete, name)
+
     @abstractmethod
     def exists(self, name: str) -> bool:
         """
@@ -318,6 +474,20 @@ class Storage(ABC):
         """
         ...
 
+    async def aexists(self, name: str) -> bool:
+        """
+        Checks if a file exists without blocking the event loop.
+
+        By default `exists` runs in the thread pool of the storages.
+
+        Args:
+            name (str): The name (path) of the file to check.
+
+        Returns:
+            bool: True if the file exists, False otherwise.
+        """
+        return await run_in_storage_thread(self.exists, name)
+
     @abstractmethod
     def listdir(self, path: str) -> tuple[list[str], list[str]]:
         """
@@ -346,6 +516,20 @@ class Storage(ABC):
         """
         ...
 
+    async def asize(self, name: str) -> int:
+        """
+        Returns the size of the file in bytes without blocking the event loop.
+
+        By default `size` runs in the thread pool of the storages.
+
+        Args:
+            name (str): The name (path) of the file.
+
+        Returns:
+            int: The size of the file in bytes.
+        """
+        return await run_in_storage_thread(self.size, name)
+
     def url(self, name: str) -> str:
         """
         Returns an absolute URL where the file's contents can be accessed
@@ -1,17 +1,19 @@
 import contextlib
 import os
+import stat
 from datetime import datetime, timezone
 from functools import cached_property
+from tempfile import SpooledTemporaryFile
 from threading import Lock
 from typing import Any, BinaryIO, cast
 from urllib.parse import urljoin
 
 from edgy.conf import settings
 from edgy.core.files.base import File
-from edgy.core.files.move import file_move_safe
+from edgy.core.files.move import copy_file_descriptor, file_move_safe
 from edgy.utils.path import filepath_to_uri, safe_join
 
-from .base import Storage
+from .base import Storage, is_async_readable, run_in_storage_thread
 
 
 class FileSystemStorage(Storage):
@@ -184,6 +186,34 @@ class FileSystemStorage(Storage):
         full_path = self._save_content(full_path, name, content)
         self._set_permissions(full_path)
 
+    async def asave(self, content: Any, name: str = "") -> None:
+        """
+        Saves new content without blocking the event loop.
+
+        Async streams (e.g. uploads) are written chunk by chunk into the target file, only
+        the blocking writes run in the thread pool of the storages. Other content is saved by
+        `save` in the thread pool.
+
+        Args:
+            content (Any): The content to be saved.
+            name (str): The desired name (path) for the saved file. If empty,
+                        the `name` (or `filename`) attribute of the `content` object is used.
+        """
+        if not is_async_readable(content):
+            await super().asave(content, name)
+            return
+        if not name:
+            name = getattr(content, "filename", None) or content.name
+        full_path = self._get_full_path(self.sanitize_name(name))
+        await run_in_storage_thread(self._create_directory, full_path)
+        file = await run_in_storage_thread(open, full_path, "wb")
+        try:
+            while chunk := await content.read(File.DEFAULT_CHUNK_SIZE):
+                await run_in_storage_thread(file.write, chunk)
+        finally:
+            await run_in_storage_thread(file.close)
+        await run_in_storage_thread(self._set_permissions, full_path)
+
     def _get_full_path(self, name: str) -> str:
         """
         Constructs the absolute filesystem path for a given file name.
@@ -228,10 +258,16 @@ class FileSystemStorage(Storage):
                 if hasattr(content, "temporary_file_path"):
                     file_move_safe(content.temporary_file_path(), full_path)
                 else:
-                    # Otherwise, write content in chunks.
                     with open(full_path, "wb") as f:
-                        for chunk in content.chunks():
-                            f.write(chunk)
+                        src_fd = self._get_content_fd(content)
+                        if src_fd is not None:
+                            # File-backed content is copied in the kernel (reflink,
+                            # copy_file_range, sendfile).
+                            copy_file_descriptor(src_fd, f.fileno())
+                        else:
+                            # Otherwise, write content in chunks.
+                            for chunk in content.chunks():
+                                f.write(chunk)
             except FileExistsError:
                 # If a file with the same name already exists, generate a new available name
                 # and update the full_path for the next attempt.
@@ -242,6 +278,36 @@ class FileSystemStorage(Storage):
                 break
         return full_path
 
+    @staticmethod
+    def _get_content_fd(content: Any) -> int | None:
+        """
+        Returns the file descriptor of file-backed content for copying it in the kernel.
+
+        Args:
+            content (Any): The content to be saved.
+
+        Returns:
+            int | None: The descriptor of a readable regular file or None.
+        """
+        file = getattr(content, "file", content)
+        if isinstance(file, SpooledTemporaryFile) and not getattr(file, "_rolled", True):
+            # `fileno` would write the in-memory data to disk first.
+            return None
+        try:
+            fd = file.fileno()
+            if hasattr(file, "flush"):
+                # pending writes of the python buffer must be visible to the kernel
+                file.flush()
+            if not stat.S_ISREG(os.fstat(fd).st_mode):
+                return None
+            # the kernel copies need a readable descriptor
+            if hasattr(file, "readable") and not file.readable():
+                return None
+        except (AttributeError, OSError, ValueError):
+            # in-memory streams (UnsupportedOperation), closed files
+            return None
+        return cast(int, fd)
+
     def _set_permissions(self, full_path: str) -> None:
         """
         Sets the file permissions for the newly saved file if `file_permissions_mode` is configured.
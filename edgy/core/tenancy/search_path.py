@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import contextlib
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+import sqlalchemy
+
+from edgy.exceptions import SchemaError
+
+if TYPE_CHECKING:
+    from databasez.core.connection import Connection
+
+    from edgy.core.connection.database import Database
+
+# attributes stored on the databasez connection of the task. The current value is stored
+# together with the transaction it was set in when it is transaction local.
+_CURRENT_ATTR = "_edgy_search_path"
+_STACK_ATTR = "_edgy_search_path_stack"
+
+
+def supports_search_path(database: Database) -> bool:
+    """
+    Checks if the dialect of the database can bind schemas via `search_path`.
+    """
+    return database.url.dialect == "postgresql"
+
+
+def build_search_path(database: Database, schema: str) -> str:
+    """
+    Returns the `search_path` value for `schema`. Shared tables stay reachable via `public`.
+
+    Warning: an unqualified table missing in `schema` silently resolves to the table of the
+    same name in `public`. `search_path` and the querysets check the main table of a query
+    (see `check_table_in_schema`), the tables of joins are not checked.
+    """
+    assert database.engine is not None, "database is not connected"
+    value = database.engine.dialect.identifier_preparer.quote(schema)
+    if schema == "public":
+        return value
+    return f"{value}, public"
+
+
+# marks a search_path which isn't known anymore, e.g. after a failed restore
+_UNKNOWN: Any = object()
+# (database url, schema, table) of the tables found by check_table_in_schema
+_found_tables: set[tuple[str, str, str]] = set()
+
+
+async def check_table_in_schema(
+    connection: Connection, database: Database, schema: str, tablename: str
+) -> None:
+    """
+    Checks that `schema` has the table `tablename`, instead of falling back to the table
+    of `public` via the `search_path`. Found tables are remembered for the process, so
+    this costs one query per table and schema.
+
+    Raises:
+        SchemaError: If the table doesn't exist in the schema.
+    """
+    key = (str(database.url), schema, tablename)
+    if schema == "public" or key in _found_tables:
+        return
+    assert database.engine is not None, "database is not connected"
+    preparer = database.engine.dialect.identifier_preparer
+    qualified_name = f"{preparer.quote(schema)}.{preparer.quote(tablename)}"
+    found = await connection.fetch_val(
+        sqlalchemy.text("SELECT to_regclass(:name) IS NOT NULL").bindparams(name=qualified_name)
+    )
+    if not found:
+        raise SchemaError(
+            detail=f'The schema "{schema}" has no table "{tablename}". Via the search_path '
+            'the table of the schema "public" would be used instead.'
+        )
+    _found_tables.add(key)
+
+
+def _innermost_transaction(connection: Connection) -> Any:
+    # databasez keeps the open transactions (including the force_rollback one) on a stack
+    stack = connection._transaction_stack
+    return stack[-1] if stack else None
+
+
+def _get_current(connection: Connection) -> Any:
+    value, transaction = connection.__dict__.get(_CURRENT_ATTR, (None, None))
+    if transaction is not None and all(
+        bound is not transaction for bound in connection._transaction_stack
+    ):
+        # transaction local values are gone with their transaction
+        return _UNKNOWN
+    return value
+
+
+async def _set(connection: Connection, value: str | None) -> None:
+    transaction = _innermost_transaction(connection)
+    # invalidate first, a failing statement must not leave a stale value behind
+    connection.__dict__[_CURRENT_ATTR] = (_UNKNOWN, None)
+    if transaction is None:
+        if value is None:
+            await connection.execute(sqlalchemy.text("RESET search_path"))
+        else:
+            await connection.execute(sqlalchemy.text(f"SET search_path TO {value}"))
+    elif value is None:
+        await connection.execute(sqlalchemy.text("SET LOCAL search_path TO DEFAULT"))
+    else:
+        # transaction local, so a rollback restores the previous value on the server too
+        await connection.execute(
+            sqlalchemy.text("SELECT set_config('search_path', :value, true)").bindparams(
+                value=value
+            )
+        )
+    connection.__dict__[_CURRENT_ATTR] = (value, transaction)
+
+
+async def _push(connection: Connection, value: str) -> None:
+    current = _get_current(connection)
+    stack: list[Any] = connection.__dict__.setdefault(_STACK_ATTR, [])
+    stack.append(current)
+    if current != value:
+        await _set(connection, value)
+
+
+async def _pop(connection: Connection) -> None:
+    stack: list[Any] = connection.__dict__[_STACK_ATTR]
+    previous = stack.pop()
+    if previous is _UNKNOWN:
+        # nothing better is known, fall back to the default of the connection
+        previous = None
+    current = _get_current(connection)
+    if current is _UNKNOWN or current != previous:
+        await _set(connection, previous)
+
+
+@asynccontextmanager
+async def search_path(
+    database: Database, schema: str, *, tablename: str | None = None
+) -> AsyncGenerator[Database, None]:
+    """
+    Binds `schema` to the connection of the current task by setting `search_path`.
+
+    Nested scopes with the same schema don't issue statements, so wrapping a whole request
+    costs one `SET` and one `RESET`. The previous `search_path` is restored on exit, before
+    the connection is returned to the pool.
+
+    `public` stays in the `search_path` for the shared tables, so a table missing in `schema`
+    resolves to the one in `public`. With `tablename` the scope checks that `schema` has the
+    table first (see `check_table_in_schema`); querysets pass the table of their model.
+
+    Example:
+
+    ```python
+    async with search_path(registry.database, "tenant_a"):
+        users = await User.query.all()
+    ```
+    """
+    async with database:
+        connection = database.connection()
+        async with connection:
+            if tablename is not None:
+                await check_table_in_schema(connection, database, schema, tablename)
+            await _push(connection, build_search_path(database, schema))
+            try:
+                yield database
+            except BaseException:
+                # a failed statement aborts the transaction, so restoring would fail too and
+                # hide the original error. The value is invalidated in this case anyway.
+                with contextlib.suppress(Exception):
+                    await _pop(connection)
+                raise
+            await _pop(connection)
+
+
+class SearchPathDatabase:
+    """
+    Proxy of a `Database` used by querysets in the `search_path` tenancy mode.
+
+    Entering the proxy binds the schema like `search_path`. Everything else is delegated
+    to the wrapped database, so the proxy can be used like the database itself.
+    """
+
+    __slots__ = ("_database", "_schema", "_scope", "_tablename")
+
+    def __init__(self, database: Database, schema: str, tablename: str | None = None) -> None:
+        self._database = database
+        self._schema = schema
+        self._tablename = tablename
+        self._scope: list[Any] = []
+
+    @property
+    def wrapped_database(self) -> Database:
+        return self._database
+
+    @property
+    def schema(self) -> str:
+        return self._schema
+
+    async def __aenter__(self) -> SearchPathDatabase:
+        scope = search_path(self._database, self._schema, tablename=self._tablename)
+        await scope.__aenter__()
+        self._scope.append(scope)
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self._scope.pop().__aexit__(*args)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._database, name)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._database!r}, schema={self._schema!r})"
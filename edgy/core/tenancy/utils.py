@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import logging
 import warnings
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 import sqlalchemy
 
+from edgy.conf import settings
 from edgy.core.terminal import Terminal
+from edgy.core.utils.concurrency import run_concurrently
 from edgy.exceptions import ModelSchemaError
 
 logger = logging.getLogger(__name__)
@@ -27,24 +30,30 @@ def table_schema(model_class: type[Model], schema: str) -> sqlalchemy.Table:
 
 
 async def create_tables(
-    registry: Registry, models: dict[str, type[BaseModelType]], schema: str
+    registry: Registry,
+    models: dict[str, type[BaseModelType]],
+    schema: str,
+    if_not_exists: bool = False,
 ) -> None:
     """
     Creates the table models for a specific schema just generated.
 
-    Iterates through the tenant models and creates them in the schema.
+    All tables are created in the order of their dependencies in one transaction
+    on one connection.
     """
+    tables = [model.table_schema(schema) for model in models.values()]
 
-    for model in models.values():
-        table = model.table_schema(schema)
+    def execute_create(connection: sqlalchemy.Connection) -> None:
+        for table in sqlalchemy.schema.sort_tables(tables):
+            logger.info(f"Creating table '{table.name}' for schema: '{schema}'")
+            table.create(connection, checkfirst=if_not_exists)
 
-        logger.info(f"Creating table '{model.meta.tablename}' for schema: '{schema}'")
-        try:
-            async with registry.database as database:
-                await database.run_sync(table.create)
-        except Exception as e:
-            logger.error("Failed creating table", exc_info=e)
-            ...
+    try:
+        async with registry.database as database, database.transaction():
+            await database.run_sync(execute_create)
+    except Exception as e:
+        logger.error("Failed creating tables", exc_info=e)
+        raise
 
 
 async def create_schema(
@@ -59,7 +68,7 @@ async def create_schema(
 
     This function creates a new schema for a tenant in the provided registry.
     It optionally checks if the schema already exists and creates tables within
-    the schema if specified.
+    the schema if specified. The schema and its tables are created in one transaction.
 
     Parameters:
         registry (Registry): The registry object where the schema will be created.
@@ -74,17 +83,175 @@ async def create_schema(
     Raises:
         ModelSchemaError: If the schema name is the same as the default schema name.
     """
+    check_schema_name(registry, schema_name)
+
+    async with registry.database as database, database.transaction():
+        # Create the new schema, optionally checking if it already exists
+        await registry.schema.create_schema(schema_name, if_not_exists=if_not_exists)
+
+        # Optionally create tables within the new schema
+        if should_create_tables:
+            terminal.write_info(f"Creating the tables in schema: {schema_name}")
+            schema_models = models or registry.models
+            await create_tables(registry, schema_models, schema_name, if_not_exists=if_not_exists)
+
+
+def check_schema_name(registry: Registry, schema_name: str) -> None:
     default_schema_name = registry.schema.get_default_schema() or "public"
     if schema_name.lower() == default_schema_name.lower():
         raise ModelSchemaError(
             f"Cannot create a schema with the same name as the default: '{schema_name}'."
         )
 
-    # Create the new schema, optionally checking if it already exists
-    await registry.schema.create_schema(schema_name, if_not_exists=if_not_exists)
 
-    # Optionally create tables within the new schema
-    if should_create_tables:
-        terminal.write_info(f"Creating the tables in schema: {schema_name}")
-        schema_models = models or registry.models
-        await create_tables(registry, schema_models, schema_name)
+def _literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+async def clone_schema(
+    registry: Registry, template: str, schema_name: str, if_not_exists: bool = False
+) -> None:
+    """
+    Creates a schema by cloning the tables of a pre-built template schema (PostgreSQL only).
+
+    The tables are copied with `CREATE TABLE ... (LIKE ... INCLUDING ALL)`. Serial sequences
+    and foreign keys are recreated, references to tables of the template point to the clone.
+    Views, functions and data are not copied. Everything runs in one transaction.
+
+    Parameters:
+        registry (Registry): The registry object where the schema will be created.
+        template (str): The name of the template schema.
+        schema_name (str): The name of the schema to be created.
+        if_not_exists (bool, optional): Skip the clone if the schema exists already.
+
+    Raises:
+        ModelSchemaError: If the schema name is the same as the default schema name or
+                          the database is not PostgreSQL.
+    """
+    check_schema_name(registry, schema_name)
+    if registry.database.url.dialect != "postgresql":
+        raise ModelSchemaError("Cloning schemas requires PostgreSQL.")
+
+    def execute_clone(connection: sqlalchemy.Connection) -> None:
+        quote = connection.dialect.identifier_preparer.quote
+        target = quote(schema_name)
+        source = quote(template)
+        if if_not_exists and connection.dialect.has_schema(connection, schema_name):
+            return
+        connection.execute(sqlalchemy.schema.CreateSchema(schema_name))
+        table_names = connection.execute(
+            sqlalchemy.text(
+                "SELECT c.relname FROM pg_class c "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE n.nspname = :schema AND c.relkind IN ('r', 'p') ORDER BY c.relname"
+            ),
+            {"schema": template},
+        ).scalars()
+        for table_name in table_names:
+            connection.execute(
+                sqlalchemy.text(
+                    f"CREATE TABLE {target}.{quote(table_name)} "
+                    f"(LIKE {source}.{quote(table_name)} INCLUDING ALL)"
+                )
+            )
+        # the defaults of serial columns still use the sequences of the template
+        sequences = connection.execute(
+            sqlalchemy.text(
+                "SELECT c.relname, a.attname, s.relname FROM pg_depend d "
+                "JOIN pg_class s ON s.oid = d.objid AND s.relkind = 'S' "
+                "JOIN pg_namespace n ON n.oid = s.relnamespace "
+                "JOIN pg_class c ON c.oid = d.refobjid "
+                "JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum = d.refobjsubid "
+                "WHERE n.nspname = :schema AND d.deptype = 'a'"
+            ),
+            {"schema": template},
+        ).all()
+        for table_name, column_name, sequence_name in sequences:
+            table = f"{target}.{quote(table_name)}"
+            sequence = f"{target}.{quote(sequence_name)}"
+            connection.execute(
+                sqlalchemy.text(
+                    f"CREATE SEQUENCE {sequence} OWNED BY {table}.{quote(column_name)}"
+                )
+            )
+            connection.execute(
+                sqlalchemy.text(
+                    f"ALTER TABLE {table} ALTER COLUMN {quote(column_name)} "
+                    f"SET DEFAULT nextval({_literal(sequence)}::regclass)"
+                )
+            )
+        # with the template as search_path its tables are printed unqualified in the
+        # constraint definitions and resolve to the clone when added with the clone as search_path
+        previous_path = connection.execute(sqlalchemy.text("SHOW search_path")).scalar_one()
+        set_path = sqlalchemy.text("SELECT set_config('search_path', :path, true)")
+        connection.execute(set_path, {"path": source})
+        foreign_keys = connection.execute(
+            sqlalchemy.text(
+                "SELECT c.relname, con.conname, pg_get_constraintdef(con.oid) "
+                "FROM pg_constraint con "
+                "JOIN pg_class c ON c.oid = con.conrelid "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE n.nspname = :schema AND con.contype = 'f' ORDER BY con.conname"
+            ),
+            {"schema": template},
+        ).all()
+        connection.execute(set_path, {"path": target})
+        try:
+            for table_name, constraint_name, definition in foreign_keys:
+                connection.execute(
+                    sqlalchemy.text(
+                        f"ALTER TABLE {target}.{quote(table_name)} "
+                        f"ADD CONSTRAINT {quote(constraint_name)} {definition}"
+                    )
+                )
+        finally:
+            connection.execute(set_path, {"path": previous_path})
+
+    async with registry.database as database, database.transaction():
+        await database.run_sync(execute_clone)
+
+
+async def provision_tenants(
+    registry: Registry,
+    schema_names: Sequence[str],
+    models: dict[str, type[BaseModelType]] | None = None,
+    template: str | None = None,
+    if_not_exists: bool = False,
+    limit: int | None = None,
+) -> None:
+    """
+    Creates the schemas and tables of many tenants concurrently.
+
+    Every tenant is created in its own transaction via `create_schema` or, when a
+    `template` schema is provided, via `clone_schema`.
+
+    Parameters:
+        registry (Registry): The registry object where the schemas will be created.
+        schema_names (Sequence[str]): The names of the schemas to be created.
+        models (dict[str, Model], optional): The models created in the schemas.
+                                             Defaults to `registry.tenant_models` or
+                                             `registry.models` when there are no tenant models.
+        template (str, optional): Clone the tables of this schema instead (PostgreSQL only).
+        if_not_exists (bool, optional): Skip existing schemas and tables.
+        limit (int, optional): The maximal amount of tenants created concurrently.
+                               Defaults to the setting `orm_registry_ops_limit`.
+    """
+    schema_models = models or registry.tenant_models or registry.models
+
+    async def provision(schema_name: str) -> None:
+        if template is not None:
+            await clone_schema(registry, template, schema_name, if_not_exists=if_not_exists)
+        else:
+            await create_schema(
+                registry,
+                schema_name,
+                models=schema_models,
+                if_not_exists=if_not_exists,
+                should_create_tables=True,
+            )
+
+    async with registry.database:
+        await run_concurrently(
+            [provision(schema_name) for schema_name in schema_names],
+            limit=settings.orm_registry_ops_limit if limit is None else limit,
+        )
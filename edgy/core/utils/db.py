@@ -36,7 +36,8 @@ def check_db_connection(db: Database, stacklevel: int = 3) -> None:
         DatabaseNotConnectedWarning: If the database is not connected and warnings
                                      are not silenced via `CHECK_DB_CONNECTION_SILENCED`.
     """
-    if not db.is_connected:
+    # databases opening their pool lazily on the first use (e.g. tenant databases) are fine
+    if not db.is_connected and not getattr(db, "connects_lazily", False):
         # If force_rollback is enabled, a disconnected database is critical.
         if db.force_rollback:
             raise RuntimeError("db is not connected.")
@@ -0,0 +1,440 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import csv
+import datetime
+import decimal
+import enum
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, TextIO
+
+import orjson
+
+from edgy.core.db.querysets.columnar import (
+    ColumnSpec,
+    get_arrow_schema,
+    get_column_specs,
+    iterate_column_batches,
+    to_arrow_values,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from edgy.core.connection.registry import Registry
+    from edgy.core.db.models.types import BaseModelType
+
+TransferFormat = Literal["csv", "ndjson", "parquet"]
+TRANSFER_FORMATS: tuple[TransferFormat, ...] = ("csv", "ndjson", "parquet")
+# Called with the model name and the amount of rows transferred so far.
+ProgressCallback = Callable[[str, int], None]
+
+
+def get_transfer_path(directory: str | Path, model_name: str, format: TransferFormat) -> Path:
+    """
+    Returns the path of the file holding the rows of `model_name`.
+    """
+    return Path(directory) / f"{model_name}.{format}"
+
+
+def _encode_value(spec: ColumnSpec, value: Any) -> Any:
+    """
+    Encodes a column value into a JSON compatible value.
+    """
+    if value is None:
+        return None
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode()
+    if spec.kind == "object" and not isinstance(value, (str, int, float, bool, list, dict)):
+        return str(value)
+    return value
+
+
+def _encode_csv_value(spec: ColumnSpec, value: Any) -> Any:
+    value = _encode_value(spec, value)
+    if value is None:
+        return ""
+    if spec.kind == "json":
+        return orjson.dumps(value).decode()
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+
+def _decode_bool(value: str) -> bool:
+    return value.lower() in ("true", "1")
+
+
+def _decode_timedelta(value: str | float) -> datetime.timedelta:
+    return datetime.timedelta(seconds=float(value))
+
+
+# decoders for values stored as text, the models validate strictly
+_text_decoders: dict[str, Callable[[str], Any]] = {
+    "bool": _decode_bool,
+    "int": int,
+    "float": float,
+    "decimal": decimal.Decimal,
+    "datetime": datetime.datetime.fromisoformat,
+    "date": datetime.date.fromisoformat,
+    "time": datetime.time.fromisoformat,
+    "timedelta": _decode_timedelta,
+    "uuid": uuid.UUID,
+    "bytes": base64.b64decode,
+}
+
+
+def _decode_enum(spec: ColumnSpec, value: Any) -> Any:
+    enum_class = getattr(spec.column.type, "enum_class", None)
+    if enum_class is None or isinstance(value, enum_class):
+        return value
+    for member in enum_class:
+        # text formats lose the type of the value
+        if member.value == value or str(member.value) == value:
+            return member
+    return value
+
+
+def _decode_value(spec: ColumnSpec, value: Any, *, format: TransferFormat) -> Any:
+    """
+    Decodes an imported value into the type expected by the model field.
+    """
+    if format == "csv" and value == "" and spec.nullable and spec.kind != "str":
+        return None
+    if value is None:
+        return None
+    kind = spec.kind
+    if kind == "json":
+        # only NDJSON can hold JSON values natively
+        return value if format == "ndjson" else orjson.loads(value)
+    if kind == "enum":
+        return _decode_enum(spec, value)
+    if isinstance(value, str) and kind in _text_decoders:
+        return _text_decoders[kind](value)
+    if kind == "timedelta" and isinstance(value, (int, float)):
+        return _decode_timedelta(value)
+    return value
+
+
+class _Writer(ABC):
+    def __init__(self, path: Path, specs: list[ColumnSpec]) -> None:
+        self.path = path
+        self.specs = specs
+
+    @abstractmethod
+    def write(self, columns: list[list[Any]]) -> None: ...
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+
+class _CSVWriter(_Writer):
+    def __init__(self, path: Path, specs: list[ColumnSpec]) -> None:
+        super().__init__(path, specs)
+        self.file: TextIO = path.open("w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([spec.key for spec in specs])
+
+    def write(self, columns: list[list[Any]]) -> None:
+        encoded = [
+            [_encode_csv_value(spec, value) for value in columns[index]]
+            for index, spec in enumerate(self.specs)
+        ]
+        self.writer.writerows(zip(*encoded, strict=True))
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _NDJSONWriter(_Writer):
+    def __init__(self, path: Path, specs: list[ColumnSpec]) -> None:
+        super().__init__(path, specs)
+        self.file = path.open("wb")
+
+    def write(self, columns: list[list[Any]]) -> None:
+        keys = [spec.key for spec in self.specs]
+        encoded = [
+            [_encode_value(spec, value) for value in columns[index]]
+            for index, spec in enumerate(self.specs)
+        ]
+        self.file.write(
+            b"".join(
+                orjson.dumps(dict(zip(keys, row, strict=True))) + b"\n"
+                for row in zip(*encoded, strict=True)
+            )
+        )
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _ParquetWriter(_Writer):
+    def __init__(self, path: Path, specs: list[ColumnSpec]) -> None:
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError('"pyarrow" is required for parquet transfers.') from None
+        super().__init__(path, specs)
+        # derived from the column types, so batches starting with NULLs share it
+        self.schema = get_arrow_schema(specs)
+        self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+
+    def write(self, columns: list[list[Any]]) -> None:
+        import pyarrow
+
+        arrays = [
+            pyarrow.array(
+                to_arrow_values(spec, columns[index]), type=self.schema.field(index).type
+            )
+            for index, spec in enumerate(self.specs)
+        ]
+        self.writer.write_batch(pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema))
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+_writers: dict[str, type[_Writer]] = {
+    "csv": _CSVWriter,
+    "ndjson": _NDJSONWriter,
+    "parquet": _ParquetWriter,
+}
+
+
+def _read_csv(path: Path, chunk_size: int) -> Iterator[list[dict[str, Any]]]:
+    with path.open(newline="", encoding="utf-8") as file:
+        chunk: list[dict[str, Any]] = []
+        for row in csv.DictReader(file):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _read_ndjson(path: Path, chunk_size: int) -> Iterator[list[dict[str, Any]]]:
+    with path.open("rb") as file:
+        chunk: list[dict[str, Any]] = []
+        for line in file:
+            if not line.strip():
+                continue
+            chunk.append(orjson.loads(line))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _read_parquet(path: Path, chunk_size: int) -> Iterator[list[dict[str, Any]]]:
+    try:
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError('"pyarrow" is required for parquet transfers.') from None
+    parquet_file = pyarrow.parquet.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=chunk_size):
+        yield batch.to_pylist()
+
+
+_readers: dict[str, Callable[[Path, int], Iterator[list[dict[str, Any]]]]] = {
+    "csv": _read_csv,
+    "ndjson": _read_ndjson,
+    "parquet": _read_parquet,
+}
+
+
+def _check_arguments(format: str, chunk_size: int, workers: int = 1) -> None:
+    if format not in TRANSFER_FORMATS:
+        raise ValueError(
+            f"Invalid format: {format!r}. Choose from: {', '.join(TRANSFER_FORMATS)}."
+        )
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+
+
+async def export_model(
+    model_class: type[BaseModelType],
+    path: str | Path,
+    *,
+    format: TransferFormat = "ndjson",
+    chunk_size: int = 1000,
+    progress: ProgressCallback | None = None,
+) -> int:
+    """
+    Streams the rows of `model_class` into a file.
+
+    Only the columns of the model table are exported, the column keys become the
+    CSV headers or the NDJSON/Parquet keys. At most `chunk_size` rows are held in memory.
+
+    Returns:
+        The amount of exported rows.
+    """
+    _check_arguments(format, chunk_size)
+    path = Path(path)
+    queryset = model_class.query.all()
+    expression, specs = await get_column_specs(queryset)
+    writer = _writers[format](path, specs)
+    count = 0
+    try:
+        async for columns in iterate_column_batches(queryset, expression, specs, chunk_size):
+            writer.write(columns)
+            count += len(columns[0])
+            if progress is not None:
+                progress(model_class.__name__, count)
+    finally:
+        writer.close()
+    return count
+
+
+async def import_model(
+    model_class: type[BaseModelType],
+    path: str | Path,
+    *,
+    format: TransferFormat = "ndjson",
+    chunk_size: int = 1000,
+    workers: int = 1,
+    ignore_conflicts: bool = False,
+    progress: ProgressCallback | None = None,
+) -> int:
+    """
+    Streams the rows of a file into the table of `model_class`.
+
+    The rows are validated by the model fields and inserted via `bulk_create` in chunks
+    of `chunk_size`. With `workers > 1` multiple chunks are inserted concurrently.
+    At most `workers + 1` chunks are held in memory.
+
+    Returns:
+        The amount of imported rows.
+    """
+    _check_arguments(format, chunk_size, workers)
+    path = Path(path)
+    queryset = model_class.query.all()
+    _, specs = await get_column_specs(queryset)
+    specs_by_key = {spec.key: spec for spec in specs}
+
+    def decode(row: dict[str, Any]) -> dict[str, Any]:
+        return {
+            key: _decode_value(specs_by_key[key], value, format=format)
+            if key in specs_by_key
+            else value
+            for key, value in row.items()
+        }
+
+    semaphore = asyncio.Semaphore(workers)
+    pending: set[asyncio.Task] = set()
+    count = 0
+
+    async def insert(chunk: list[dict[str, Any]]) -> None:
+        nonlocal count
+        try:
+            await model_class.query.bulk_create(
+                [decode(row) for row in chunk], ignore_conflicts=ignore_conflicts
+            )
+        finally:
+            semaphore.release()
+        count += len(chunk)
+        if progress is not None:
+            progress(model_class.__name__, count)
+
+    async with model_class.database:
+        try:
+            for chunk in _readers[format](path, chunk_size):
+                # bounds the chunks in flight, failed workers release their slot
+                await semaphore.acquire()
+                for task in [task for task in pending if task.done()]:
+                    pending.discard(task)
+                    task.result()
+                pending.add(asyncio.create_task(insert(chunk)))
+            await asyncio.gather(*pending)
+        finally:
+            for task in pending:
+                task.cancel()
+    return count
+
+
+async def export_models(
+    registry: Registry,
+    model_names: list[str],
+    directory: str | Path,
+    *,
+    format: TransferFormat = "ndjson",
+    chunk_size: int = 1000,
+    progress: ProgressCallback | None = None,
+) -> dict[str, int]:
+    """
+    Exports the models `model_names` of `registry` into `directory`.
+
+    When `model_names` is empty all models of the registry are exported.
+
+    Returns:
+        The amount of exported rows per model.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    if not model_names:
+        model_names = list(registry.models)
+    model_classes = [registry.get_model(name) for name in model_names]
+    result: dict[str, int] = {}
+    async with registry:
+        for name, model_class in zip(model_names, model_classes, strict=True):
+            result[name] = await export_model(
+                model_class,
+                get_transfer_path(directory, name, format),
+                format=format,
+                chunk_size=chunk_size,
+                progress=progress,
+            )
+    return result
+
+
+async def import_models(
+    registry: Registry,
+    model_names: list[str],
+    directory: str | Path,
+    *,
+    format: TransferFormat = "ndjson",
+    chunk_size: int = 1000,
+    workers: int = 1,
+    ignore_conflicts: bool = False,
+    progress: ProgressCallback | None = None,
+) -> dict[str, int]:
+    """
+    Imports the models `model_names` of `registry` from `directory`.
+
+    When `model_names` is empty all models with an existing file are imported. The models
+    are imported one after another in the given order, so referenced models must come first.
+
+    Returns:
+        The amount of imported rows per model.
+    """
+    if not model_names:
+        model_names = [
+            name for name in registry.models if get_transfer_path(directory, name, format).exists()
+        ]
+    model_classes = [registry.get_model(name) for name in model_names]
+    result: dict[str, int] = {}
+    async with registry:
+        for name, model_class in zip(model_names, model_classes, strict=True):
+            result[name] = await import_model(
+                model_class,
+                get_transfer_path(directory, name, format),
+                format=format,
+                chunk_size=chunk_size,
+                workers=workers,
+                ignore_conflicts=ignore_conflicts,
+                progress=progress,
+            )
+    return result
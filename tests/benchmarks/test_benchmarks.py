@@ -1,6 +1,8 @@
 """Performance benchmarks for edgy ORM core operations."""
 
+import contextlib
 import datetime
+import os
 import uuid
 from enum import Enum
 
@@ -146,3 +148,137 @@ def test_complex_model_dump_json():
     )
     for _ in range(100):
         instance.model_dump_json()
+
+
+class RelatedModel(edgy.StrictModel):
+    id = fields.IntegerField(primary_key=True, autoincrement=True)
+    complex = fields.ForeignKey(ComplexModel, on_delete=edgy.CASCADE)
+    user = fields.ForeignKey(UserModel, null=True, on_delete=edgy.SET_NULL)
+    name = fields.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+@pytest.mark.benchmark
+def test_related_model_dump_with_filters():
+    """Benchmark serialization of a model with foreign keys and include/exclude filters."""
+    instance = RelatedModel(
+        id=1,
+        name="related",
+        complex=ComplexModel(id=1, description="A benchmark test product"),
+        user=UserModel(name="Benchmark"),
+    )
+    for _ in range(100):
+        instance.model_dump(exclude={"user": {"url"}}, include={"name", "complex", "user"})
+
+
+# -- Model definition benchmarks --
+
+
+@pytest.mark.benchmark
+def test_define_models_eager():
+    from tests.test_lazy_model_build import define_models
+
+    define_models()
+
+
+@pytest.mark.benchmark
+def test_define_models_deferred():
+    from tests.test_lazy_model_build import define_deferred_models
+
+    define_deferred_models()
+
+
+# -- Pagination benchmarks --
+
+PAGE_SIZE = 2
+DEEP_PAGE = 10_000
+pagination_database = edgy.Database("sqlite:///benchmarks_pagination.db")
+pagination_models = edgy.Registry(database=pagination_database)
+
+
+class Entry(edgy.StrictModel):
+    category = fields.IntegerField()
+    score = fields.IntegerField()
+
+    class Meta:
+        registry = pagination_models
+        indexes = [edgy.Index(fields=["category", "score", "id"])]
+
+
+@pytest.fixture(scope="module")
+def deep_page_cursor():
+    from edgy.contrib.pagination import CursorPaginator
+
+    async def prepare():
+        async with pagination_models:
+            await pagination_models.create_all()
+            amount = PAGE_SIZE * (DEEP_PAGE + 1)
+            await Entry.query.bulk_create(
+                [{"category": i // 1000, "score": i % 1000} for i in range(amount)]
+            )
+            paginator = CursorPaginator(Entry.query.order_by("category", "score", "id"), PAGE_SIZE)
+            # the last item of the page before the deep page
+            (previous,) = (
+                await Entry.query.order_by("category", "score", "id")
+                .offset(PAGE_SIZE * DEEP_PAGE - 1)
+                .limit(1)
+            )
+            return paginator, (previous.category, previous.score, previous.id)
+
+    with contextlib.suppress(OSError):
+        os.remove("benchmarks_pagination.db")
+    yield edgy.run_sync(prepare())
+    with contextlib.suppress(OSError):
+        os.remove("benchmarks_pagination.db")
+
+
+def get_page(paginator, cursor):
+    async def fetch():
+        async with pagination_models:
+            paginator.clear_caches()
+            return await paginator.get_page(cursor)
+
+    return edgy.run_sync(fetch())
+
+
+@pytest.mark.benchmark
+def test_cursor_pagination_first_page(deep_page_cursor):
+    paginator, _ = deep_page_cursor
+    assert len(get_page(paginator, None).content) == PAGE_SIZE
+
+
+@pytest.mark.benchmark
+def test_cursor_pagination_page_10000(deep_page_cursor):
+    """Benchmark page 10,000, the keyset predicate seeks in the index like the first page."""
+    paginator, cursor = deep_page_cursor
+    page = get_page(paginator, cursor)
+    assert page.content[0].id == PAGE_SIZE * DEEP_PAGE + 1
+
+
+@pytest.mark.benchmark
+def test_numbered_pagination_page_10000(deep_page_cursor):
+    """Benchmark page 10,000 of the offset based paginator for comparison."""
+    from edgy.contrib.pagination import NumberedPaginator
+
+    paginator, _ = deep_page_cursor
+    numbered = NumberedPaginator(paginator.queryset, PAGE_SIZE)
+    page = get_page(numbered, DEEP_PAGE + 1)
+    assert page.content[0].id == PAGE_SIZE * DEEP_PAGE + 1
+
+
+# -- File storage benchmarks --
+
+
+@pytest.mark.benchmark
+def test_filesystem_storage_save_file_backed(tmp_path):
+    """Benchmark saving file-backed content (copied in the kernel where possible)."""
+    from edgy.core.files.storage.filesystem import FileSystemStorage
+
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"\0" * 32 * 2**20)
+    storage = FileSystemStorage(location=tmp_path / "media")
+    with open(source, "rb") as f:
+        for i in range(4):
+            storage.save(f, f"copy{i}.bin")
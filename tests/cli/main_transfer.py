@@ -0,0 +1,38 @@
+import datetime
+import enum
+
+import edgy
+from edgy import Instance
+from tests.settings import DATABASE_URL
+
+models = edgy.Registry(database=DATABASE_URL)
+
+
+class Status(enum.Enum):
+    DRAFT = "draft"
+    RELEASED = "released"
+
+
+class Category(edgy.StrictModel):
+    name = edgy.fields.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Product(edgy.StrictModel):
+    name = edgy.fields.CharField(max_length=100)
+    amount = edgy.fields.IntegerField(null=True)
+    price = edgy.fields.DecimalField(max_digits=9, decimal_places=2, null=True)
+    active = edgy.fields.BooleanField(default=True)
+    created = edgy.fields.DateTimeField(default=datetime.datetime.now)
+    uid = edgy.fields.UUIDField(null=True)
+    status = edgy.fields.ChoiceField(Status, default=Status.DRAFT)
+    data = edgy.fields.JSONField(default=dict)
+    category = edgy.fields.ForeignKey(Category, null=True)
+
+    class Meta:
+        registry = models
+
+
+edgy.monkay.set_instance(Instance(registry=models))
@@ -0,0 +1,236 @@
+import contextlib
+import json
+import os
+import shutil
+import time
+import zlib
+from pathlib import Path
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import edgy
+from edgy.cli import base
+from edgy.cli.base import (
+    MigrationTarget,
+    MigrationTargetLocked,
+    _load_progress,
+    _run_locked,
+    _save_progress,
+    get_migration_targets,
+    upgrade_parallel,
+)
+from edgy.testing.client import DatabaseTestClient
+from tests.cli.utils import arun_cmd
+from tests.settings import TEST_DATABASE
+
+base_path = Path(os.path.abspath(__file__)).absolute().parent
+outer_database = DatabaseTestClient(
+    TEST_DATABASE, use_existing=False, drop_database=True, test_prefix=""
+)
+
+
+@pytest.fixture()
+def cleanup_folders():
+    with contextlib.suppress(OSError):
+        shutil.rmtree(str(base_path / "migrations"))
+
+    yield
+    with contextlib.suppress(OSError):
+        shutil.rmtree(str(base_path / "migrations"))
+
+
+@pytest.fixture()
+async def cleanup_prepare_db():
+    if await outer_database.is_database_exist():
+        await outer_database.drop_database(outer_database.url)
+    await outer_database.create_database(outer_database.url)
+    async with outer_database:
+        yield
+
+
+def test_target_names():
+    assert str(MigrationTarget()) == "main"
+    assert str(MigrationTarget("another")) == "another"
+    assert str(MigrationTarget(None, "tenant_a")) == "main:tenant_a"
+    assert str(MigrationTarget("another", "tenant_a")) == "another:tenant_a"
+
+
+def test_get_migration_targets():
+    with edgy.monkay.with_settings(
+        edgy.monkay.settings.model_copy(update={"migrate_databases": [None, "another"]})
+    ):
+        assert get_migration_targets(["tenant_a", "tenant_b"]) == [
+            MigrationTarget(None),
+            MigrationTarget("another"),
+            MigrationTarget(None, "tenant_a"),
+            MigrationTarget(None, "tenant_b"),
+        ]
+
+
+def test_progress_file(tmp_path):
+    progress_file = str(tmp_path / "progress.json")
+    assert _load_progress(progress_file, "head") == set()
+
+    _save_progress(progress_file, "head", {"main", "main:tenant_a"})
+    with open(progress_file) as f:
+        assert json.load(f) == {"revision": "head", "done": ["main", "main:tenant_a"]}
+    assert _load_progress(progress_file, "head") == {"main", "main:tenant_a"}
+    # the progress of another revision is ignored
+    assert _load_progress(progress_file, "abc123") == set()
+    assert not (tmp_path / "progress.json.tmp").exists()
+
+
+def record_upgrade_target(target, revision, tag, arg):
+    # runs in the forked worker processes, the log file is passed via the environment
+    with open(os.environ["TEST_MIGRATE_LOG"], "a") as f:
+        f.write(f"start {target}\n")
+    if target.schema is None:
+        time.sleep(0.2)
+        if target.database == "another":
+            raise ValueError("broken")
+    with open(os.environ["TEST_MIGRATE_LOG"], "a") as f:
+        f.write(f"end {target}\n")
+
+
+def test_main_targets_first(monkeypatch, tmp_path):
+    log_file = tmp_path / "log"
+    monkeypatch.setenv("TEST_MIGRATE_LOG", str(log_file))
+    monkeypatch.setattr(base, "_upgrade_target", record_upgrade_target)
+    monkeypatch.setattr(base, "_check_env_supports_schemas", lambda config: None)
+    targets = [
+        MigrationTarget(None, "tenant_a"),
+        MigrationTarget(None),
+        MigrationTarget("another"),
+        MigrationTarget("another", "tenant_b"),
+    ]
+
+    report = upgrade_parallel(targets=targets, workers=4)
+
+    lines = log_file.read_text().splitlines()
+    assert lines.index("start main:tenant_a") > lines.index("end main")
+    assert lines.index("start main:tenant_a") > lines.index("start another")
+    # the tenant schemas of a failed database aren't upgraded
+    assert "start another:tenant_b" not in lines
+    assert report.succeeded == [MigrationTarget(None), MigrationTarget(None, "tenant_a")]
+    assert [target for target, _ in report.failed] == [
+        MigrationTarget("another"),
+        MigrationTarget("another", "tenant_b"),
+    ]
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("cleanup_prepare_db")
+async def test_locked_target():
+    target = MigrationTarget(None, "tenant_a")
+    key = zlib.crc32(f"edgy-migrate:{target}".encode())
+    called: list[bool] = []
+    with edgy.monkay.with_instance(edgy.Instance(edgy.Registry(TEST_DATABASE))):
+        async with edgy.Database(TEST_DATABASE) as database, database.connection() as connection:
+            # another run migrates the target
+            await connection.fetch_val(
+                sqlalchemy.text("SELECT pg_advisory_lock(:key)").bindparams(key=key)
+            )
+            with pytest.raises(MigrationTargetLocked):
+                await _run_locked(target, lambda: called.append(True))
+            assert called == []
+
+            await connection.fetch_val(
+                sqlalchemy.text("SELECT pg_advisory_unlock(:key)").bindparams(key=key)
+            )
+            await _run_locked(target, lambda: called.append(True))
+            assert called == [True]
+            # the lock is released again
+            assert await connection.fetch_val(
+                sqlalchemy.text("SELECT pg_try_advisory_lock(:key)").bindparams(key=key)
+            )
+
+
+async def fetch_versions(schemas: list[str]) -> dict[str, tuple[str, bool]]:
+    """
+    Returns the alembic version and if the users table exists for every schema.
+    """
+    engine = create_async_engine(TEST_DATABASE)
+    result: dict[str, tuple[str, bool]] = {}
+    try:
+        async with engine.connect() as conn:
+            for schema in schemas:
+                version = await conn.scalar(
+                    sqlalchemy.text(f'SELECT version_num FROM "{schema}".alembic_version')
+                )
+                has_users = await conn.scalar(
+                    sqlalchemy.text(
+                        "SELECT EXISTS (SELECT 1 FROM information_schema.tables "
+                        "WHERE table_schema = :schema AND table_name = 'users')"
+                    ).bindparams(schema=schema)
+                )
+                result[schema] = (version, has_users)
+    finally:
+        await engine.dispose()
+    return result
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("cleanup_folders", "cleanup_prepare_db")
+@pytest.mark.parametrize("template_param", ["", " -t plain", " -t url"])
+async def test_upgrade_parallel(template_param, tmp_path):
+    os.chdir(base_path)
+    (o, e, ss) = await arun_cmd("tests.cli.main", f"edgy init{template_param}")
+    assert ss == 0
+    (o, e, ss) = await arun_cmd("tests.cli.main", "edgy makemigrations")
+    assert ss == 0
+    await outer_database.execute(sqlalchemy.text("CREATE SCHEMA tenant_a"))
+    await outer_database.execute(sqlalchemy.text("CREATE SCHEMA tenant_b"))
+
+    progress_file = tmp_path / "progress.json"
+    migrate_cmd = f"edgy migrate -w 2 -s tenant_a -s tenant_b --progress-file {progress_file}"
+    (o, e, ss) = await arun_cmd("tests.cli.main", migrate_cmd)
+    assert ss == 0
+    assert b"Upgraded 3 targets" in o
+    # the symbolic revision is stored resolved
+    first_head = json.loads(progress_file.read_text())["revision"]
+    assert first_head != "head"
+    # the env.py moves the version table and the tables into the tenant schema
+    assert await fetch_versions(["public", "tenant_a", "tenant_b"]) == {
+        "public": (first_head, True),
+        "tenant_a": (first_head, True),
+        "tenant_b": (first_head, True),
+    }
+
+    # finished targets are skipped
+    (o, e, ss) = await arun_cmd("tests.cli.main", migrate_cmd)
+    assert ss == 0
+    assert b"skipped 3" in o
+
+    # a new migration invalidates the progress of "head"
+    (o, e, ss) = await arun_cmd("tests.cli.main", "edgy revision -m second")
+    assert ss == 0
+    (o, e, ss) = await arun_cmd("tests.cli.main", migrate_cmd)
+    assert ss == 0
+    assert b"Upgraded 3 targets" in o
+    second_head = json.loads(progress_file.read_text())["revision"]
+    assert second_head != first_head
+    assert await fetch_versions(["public", "tenant_a", "tenant_b"]) == {
+        "public": (second_head, True),
+        "tenant_a": (second_head, True),
+        "tenant_b": (second_head, True),
+    }
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("cleanup_folders", "cleanup_prepare_db")
+async def test_upgrade_parallel_env_without_schemas():
+    os.chdir(base_path)
+    (o, e, ss) = await arun_cmd("tests.cli.main", "edgy init")
+    assert ss == 0
+    # an env.py of an older template
+    env_py = base_path / "migrations" / "env.py"
+    env_py.write_text(env_py.read_text().replace("EDGY_MIGRATE_SCHEMA", "UNKNOWN_VARIABLE"))
+
+    (o, e, ss) = await arun_cmd("tests.cli.main", "edgy migrate -w 2 -s tenant_a")
+    assert ss == 1
+    assert b"EDGY_MIGRATE_SCHEMA" in o + e
+    # databases only are fine
+    (o, e, ss) = await arun_cmd("tests.cli.main", "edgy migrate -w 2")
+    assert ss == 0
@@ -0,0 +1,143 @@
+import decimal
+import uuid
+
+import pytest
+
+import edgy
+from edgy.utils.transfer import export_models, import_model, import_models
+from tests.cli.utils import arun_cmd
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(scope="module")
+def main(anyio_backend):
+    old_instance = edgy.monkay.instance
+    from tests.cli import main_transfer as main
+
+    yield main
+    edgy.monkay.set_instance(old_instance)
+
+
+@pytest.fixture(autouse=True)
+async def create_test_database(main):
+    async with main.models:
+        await main.models.create_all()
+        yield
+        await main.models.drop_all()
+
+
+async def create_rows(main):
+    category = await main.Category.query.create(name="food")
+    await main.Product.query.create(
+        name="apple",
+        amount=3,
+        price=decimal.Decimal("1.50"),
+        uid=uuid.UUID(int=1),
+        status=main.Status.RELEASED,
+        data={"color": ["red", "green"]},
+        category=category,
+    )
+    await main.Product.query.create(name="pear", active=False)
+    await main.Product.query.create(name="", data={"a": None})
+
+
+async def dump_rows(main):
+    return [
+        [obj.model_dump(exclude={"category"}) for obj in await model.query.order_by("id")]
+        for model in (main.Category, main.Product)
+    ]
+
+
+async def clear_rows(main):
+    await main.Product.query.delete()
+    await main.Category.query.delete()
+
+
+@pytest.mark.parametrize("format", ["csv", "ndjson", "parquet"])
+async def test_roundtrip(main, tmp_path, format):
+    if format == "parquet":
+        pytest.importorskip("pyarrow")
+    await create_rows(main)
+    rows = await dump_rows(main)
+    progress = []
+
+    result = await export_models(
+        main.models,
+        ["Category", "Product"],
+        tmp_path,
+        format=format,
+        chunk_size=2,
+        progress=lambda name, count: progress.append((name, count)),
+    )
+    assert result == {"Category": 1, "Product": 3}
+    assert progress == [("Category", 1), ("Product", 2), ("Product", 3)]
+    assert (tmp_path / f"Product.{format}").exists()
+
+    await clear_rows(main)
+    result = await import_models(main.models, [], tmp_path, format=format, chunk_size=2)
+    assert result == {"Category": 1, "Product": 3}
+    assert await dump_rows(main) == rows
+    product = await main.Product.query.select_related("category").get(name="apple")
+    assert product.category.name == "food"
+
+
+async def test_parquet_null_first_chunk(main, tmp_path):
+    pytest.importorskip("pyarrow")
+    await main.Product.query.create(name="pear")
+    await main.Product.query.create(name="apple", price=decimal.Decimal("1.50"))
+    await main.Product.query.create(name="melon", price=decimal.Decimal("1234567.25"))
+    rows = await dump_rows(main)
+
+    await export_models(main.models, ["Product"], tmp_path, format="parquet", chunk_size=1)
+    await main.Product.query.delete()
+
+    count = await import_model(main.Product, tmp_path / "Product.parquet", format="parquet")
+    assert count == 3
+    assert await dump_rows(main) == rows
+
+
+async def test_import_parallel_workers(main, tmp_path):
+    await main.Product.query.bulk_create([{"name": f"product{i}"} for i in range(25)])
+    await export_models(main.models, ["Product"], tmp_path)
+    await main.Product.query.delete()
+
+    count = await import_model(main.Product, tmp_path / "Product.ndjson", chunk_size=3, workers=4)
+    assert count == 25
+    assert await main.Product.query.count() == 25
+
+
+async def test_import_failure(main, tmp_path):
+    (tmp_path / "Product.ndjson").write_text(
+        "".join(f'{{"id": {i % 3 + 1}, "name": "product"}}\n' for i in range(10))
+    )
+    with pytest.raises(Exception):  # noqa: B017
+        await import_model(main.Product, tmp_path / "Product.ndjson", chunk_size=2, workers=2)
+
+
+async def test_invalid_arguments(main, tmp_path):
+    with pytest.raises(ValueError):
+        await import_model(main.Product, tmp_path / "Product.xml", format="xml")
+    with pytest.raises(ValueError):
+        await import_model(main.Product, tmp_path / "Product.ndjson", workers=0)
+
+
+async def test_cli(main, tmp_path):
+    await create_rows(main)
+    rows = await dump_rows(main)
+
+    (out, error, ss) = await arun_cmd(
+        "tests.cli.main_transfer",
+        f"edgy export Category Product -d {tmp_path} -f csv --chunk-size 2",
+    )
+    assert ss == 0
+    assert b"Exported 4 rows of 2 models" in out
+
+    await clear_rows(main)
+    (out, error, ss) = await arun_cmd(
+        "tests.cli.main_transfer",
+        f"edgy import Category Product -d {tmp_path} -f csv -w 2",
+    )
+    assert ss == 0
+    assert b"Imported 4 rows of 2 models" in out
+    assert await dump_rows(main) == rows
@@ -0,0 +1,147 @@
+from base64 import urlsafe_b64encode
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import orjson
+import pytest
+from httpx import ASGITransport, AsyncClient
+from lilya.apps import Lilya
+from lilya.middleware import DefineMiddleware
+from lilya.middleware.sessions import SessionMiddleware
+from lilya.routing import Include
+
+import edgy
+from edgy.contrib.admin import create_admin_app
+from edgy.contrib.admin.utils.models import get_related_items
+from edgy.testclient import DatabaseTestClient
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = DatabaseTestClient(DATABASE_URL, force_rollback=False)
+models = edgy.Registry(database=edgy.Database(database, force_rollback=True))
+
+
+class Tag(edgy.StrictModel):
+    name: str = edgy.fields.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Album(edgy.StrictModel):
+    name: str = edgy.fields.CharField(max_length=100)
+    tags = edgy.fields.ManyToMany(Tag, related_name="albums")
+
+    @classmethod
+    def get_admin_marshall_config(cls, *, phase: str, for_schema: bool) -> dict[str, Any]:
+        config = super().get_admin_marshall_config(phase=phase, for_schema=for_schema)
+        if phase == "view":
+            # relations are excluded by default
+            config["fields"] = ["id", "name", "tags", "tracks"]
+        return config
+
+    class Meta:
+        registry = models
+
+
+class Track(edgy.StrictModel):
+    title: str = edgy.fields.CharField(max_length=100)
+    album: Album = edgy.fields.ForeignKey(Album, related_name="tracks")
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="module")
+async def create_test_database():
+    async with database:
+        await models.create_all()
+        yield
+        if not database.drop:
+            await models.drop_all()
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def rollback_connections():
+    async with models:
+        yield
+
+
+@pytest.fixture()
+async def async_client() -> AsyncGenerator:
+    app = Lilya(
+        routes=[Include("", create_admin_app(registry=models))],
+        middleware=[
+            DefineMiddleware(
+                SessionMiddleware, secret_key=edgy.monkay.settings.admin_config.SECRET_KEY
+            )
+        ],
+    )
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+def object_pk(instance: edgy.Model) -> str:
+    return urlsafe_b64encode(orjson.dumps({"id": instance.id})).decode()
+
+
+async def create_album(amount: int) -> Album:
+    album = await Album.query.create(name="album")
+    await Track.query.bulk_create(
+        [{"title": f"track {i:03}", "album": album} for i in range(amount)]
+    )
+    tags = [await Tag.query.create(name=f"tag {i:03}") for i in range(5)]
+    await album.tags.add_many(*tags)
+    return album
+
+
+async def test_get_related_items():
+    album = await create_album(30)
+    result = await get_related_items(album.tracks.all(), limit=10)
+    assert [track.title for track in result["items"]] == [f"track {i:03}" for i in range(10)]
+    assert result["total"] == 30
+    assert result["next_offset"] == 10
+
+    result = await get_related_items(album.tracks.all(), limit=10, offset=20)
+    assert [track.title for track in result["items"]][0] == "track 020"
+    assert result["next_offset"] is None
+    assert result["total"] == 30
+
+    result = await get_related_items(album.tags.all(), limit=10)
+    assert [tag.name for tag in result["items"]] == [f"tag {i:03}" for i in range(5)]
+    assert result["total"] == 5
+    assert result["next_offset"] is None
+
+
+async def test_detail_view_bounded(async_client):
+    album = await create_album(30)
+    response = await async_client.get(f"/models/Album/{object_pk(album)}")
+    assert response.status_code == 200
+    # only the first tracks are rendered
+    assert response.text.count("/models/Track/") == 20
+    assert "Load more (30 total)" in response.text
+    assert response.text.count("/models/Tag/") == 5
+
+
+async def test_related_json(async_client):
+    album = await create_album(30)
+    response = await async_client.get(
+        f"/models/Album/{object_pk(album)}/related/tracks?offset=20&limit=5"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["items"]) == 5
+    assert "/models/Track/" in data["items"][0]["url"]
+    assert data["next_offset"] == 25
+    assert data["total"] == 30
+
+    response = await async_client.get(f"/models/Album/{object_pk(album)}/related/tags")
+    assert response.json()["next_offset"] is None
+    assert len(response.json()["items"]) == 5
+
+    # only relations are served
+    response = await async_client.get(f"/models/Album/{object_pk(album)}/related/name")
+    assert response.status_code == 404
+    response = await async_client.get(f"/models/Album/{object_pk(album)}/related/tracks?limit=x")
+    assert response.status_code == 404
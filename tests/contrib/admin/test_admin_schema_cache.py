@@ -0,0 +1,91 @@
+import time
+import uuid
+from datetime import datetime
+
+import edgy
+from edgy.contrib.admin.utils.models import (
+    CallableDefaultJsonSchema,
+    NoCallableDefaultJsonSchema,
+    clear_admin_caches,
+    get_model_json_schema,
+)
+
+models = edgy.Registry(database="sqlite:///test_admin_schema_cache.db")
+
+
+class Author(edgy.StrictModel):
+    name: str = edgy.fields.CharField(max_length=100, default="anonymous")
+
+    class Meta:
+        registry = models
+
+
+class Post(edgy.StrictModel):
+    token: uuid.UUID = edgy.fields.UUIDField(default=uuid.uuid4)
+    created: datetime = edgy.fields.DateTimeField(default=datetime.now)
+    title: str = edgy.fields.CharField(max_length=100, default="")
+    author: Author = edgy.fields.ForeignKey(Author, null=True)
+    data: dict = edgy.fields.JSONField(default=dict)
+
+    class Meta:
+        registry = models
+
+
+def test_marshall_class_cached():
+    assert Post.get_admin_marshall_class(phase="view") is Post.get_admin_marshall_class(
+        phase="view"
+    )
+    assert Post.get_admin_marshall_class(
+        phase="view", for_schema=True
+    ) is not Post.get_admin_marshall_class(phase="view")
+    # different configs
+    assert Post.get_admin_marshall_class(phase="create") is not Post.get_admin_marshall_class(
+        phase="view"
+    )
+    marshall_class = Post.get_admin_marshall_class(phase="view")
+    Post.meta.invalidate()
+    assert Post.get_admin_marshall_class(phase="view") is not marshall_class
+
+
+def test_schema_matches_uncached():
+    clear_admin_caches()
+    for model in (Author, Post):
+        for phase in ("view", "create", "update"):
+            marshall_class = model.get_admin_marshall_class(phase=phase, for_schema=True)
+            expected = marshall_class.model_json_schema(
+                schema_generator=NoCallableDefaultJsonSchema, mode="validation"
+            )
+            for _ in range(2):
+                assert get_model_json_schema(model, phase=phase) == expected
+
+            expected = marshall_class.model_json_schema(
+                schema_generator=CallableDefaultJsonSchema, mode="validation"
+            )
+            schema = get_model_json_schema(model, phase=phase, include_callable_defaults=True)
+            if model is Post:
+                # fresh values
+                for name in ("token", "created"):
+                    assert schema["properties"].pop(name)["default"] is not None
+                    expected["properties"].pop(name)
+            assert schema == expected
+
+
+def test_schema_callable_defaults_fresh():
+    first = get_model_json_schema(Post, phase="view", include_callable_defaults=True)
+    second = get_model_json_schema(Post, phase="view", include_callable_defaults=True)
+    assert first["properties"]["token"]["default"] != second["properties"]["token"]["default"]
+    # the returned schemas are copies
+    first["properties"].clear()
+    assert get_model_json_schema(Post, phase="view")["properties"]
+
+
+def test_schema_cache_speed():
+    clear_admin_caches()
+    start = time.perf_counter()
+    get_model_json_schema(Post, phase="view", include_callable_defaults=True)
+    uncached = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(10):
+        get_model_json_schema(Post, phase="view", include_callable_defaults=True)
+    cached = (time.perf_counter() - start) / 10
+    assert cached < uncached
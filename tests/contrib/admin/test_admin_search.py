@@ -0,0 +1,208 @@
+import re
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+import sqlalchemy
+from httpx import ASGITransport, AsyncClient
+from lilya.apps import Lilya
+from lilya.middleware import DefineMiddleware
+from lilya.middleware.sessions import SessionMiddleware
+from lilya.routing import Include
+
+import edgy
+from edgy.contrib.admin import create_admin_app
+from edgy.contrib.admin.utils.models import apply_search
+from edgy.contrib.pagination.cursor import encode_cursor
+from edgy.testclient import DatabaseTestClient
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = DatabaseTestClient(DATABASE_URL, force_rollback=False)
+models = edgy.Registry(database=edgy.Database(database, force_rollback=True))
+sqlite_models = edgy.Registry(
+    database=DatabaseTestClient("sqlite:///test_admin_search.db", drop_database=True),
+)
+
+
+class Article(edgy.StrictModel):
+    title: str = edgy.fields.CharField(max_length=100)
+    body: str = edgy.fields.TextField(default="")
+
+    @classmethod
+    def get_admin_search_config(cls) -> dict[str, Any]:
+        return {"tsvector": ["title", "body"], "tsvector_config": "english"}
+
+    class Meta:
+        registry = models
+
+
+class Plain(edgy.StrictModel):
+    first: str = edgy.fields.CharField(max_length=100)
+    second: str = edgy.fields.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class ArticleStats(edgy.StrictModel):
+    article = edgy.fields.ForeignKey(Article, primary_key=True, on_delete=edgy.CASCADE)
+    views: int = edgy.fields.IntegerField(default=0)
+
+    class Meta:
+        registry = models
+
+
+class Note(edgy.StrictModel):
+    text: str = edgy.fields.CharField(max_length=100)
+
+    @classmethod
+    def get_admin_search_config(cls) -> dict[str, Any]:
+        return {"fts5_table": "notes_fts"}
+
+    class Meta:
+        registry = sqlite_models
+
+
+@pytest.fixture(autouse=True, scope="module")
+async def create_test_database():
+    async with database:
+        await models.create_all()
+        yield
+        if not database.drop:
+            await models.drop_all()
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def rollback_connections():
+    async with models:
+        yield
+
+
+@pytest.fixture()
+async def async_client() -> AsyncGenerator:
+    app = Lilya(
+        routes=[Include("", create_admin_app(registry=models))],
+        middleware=[
+            DefineMiddleware(
+                SessionMiddleware, secret_key=edgy.monkay.settings.admin_config.SECRET_KEY
+            )
+        ],
+    )
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+def get_links(text: str) -> dict[str, str]:
+    return {
+        name: href.replace("&amp;", "&")
+        for href, name in re.findall(r'href="(\?[^"]+)"\s+class="[^"]+">(Previous|Next)</a>', text)
+    }
+
+
+async def test_keyset_navigation(async_client):
+    await Article.query.bulk_create([{"title": f"article {i:03}"} for i in range(30)])
+
+    response = await async_client.get("/models/Article?per_page=10")
+    assert response.status_code == 200
+    links = get_links(response.text)
+    assert set(links) == {"Next"}
+    assert links["Next"].startswith("?after=")
+
+    response = await async_client.get(f"/models/Article{links['Next']}")
+    links = get_links(response.text)
+    assert set(links) == {"Previous", "Next"}
+    assert "article 010" in response.text
+    assert "article 009" not in response.text
+    assert links["Previous"].startswith("?before=")
+
+    response = await async_client.get(f"/models/Article{links['Previous']}")
+    assert "article 000" in response.text
+    assert "article 010" not in response.text
+    assert set(get_links(response.text)) == {"Next"}
+
+    # invalid tokens show the first page
+    response = await async_client.get("/models/Article?after=invalid")
+    assert response.status_code == 200
+    assert "article 000" in response.text
+
+
+async def test_keyset_previous_to_start(async_client):
+    await Article.query.bulk_create([{"title": f"article {i:03}"} for i in range(30)])
+    articles = await Article.query.order_by("id")
+
+    # a page starting at the 6th article, e.g. after changing per_page
+    response = await async_client.get(
+        f"/models/Article?per_page=10&after={encode_cursor((articles[4].id,))}"
+    )
+    assert "article 005" in response.text
+    assert "article 004" not in response.text
+    links = get_links(response.text)
+
+    # going back to the start shows a complete first page
+    response = await async_client.get(f"/models/Article{links['Previous']}")
+    assert "article 000" in response.text
+    assert "article 009" in response.text
+    assert "article 010" not in response.text
+    assert set(get_links(response.text)) == {"Next"}
+
+
+@pytest.mark.parametrize("parameter", ["after", "before"])
+async def test_keyset_token_of_wrong_type(async_client, parameter):
+    await Article.query.create(title="article 000")
+    for token in [encode_cursor(("foo",)), encode_cursor((1, 2)), "invalid"]:
+        response = await async_client.get(f"/models/Article?{parameter}={token}")
+        assert response.status_code == 200
+        assert "article 000" in response.text
+        assert "Previous" not in response.text
+
+
+async def test_page_number_window(async_client):
+    articles = [await Article.query.create(title=f"article {i:03}") for i in range(12)]
+    await ArticleStats.query.bulk_create([{"article": article} for article in articles])
+
+    response = await async_client.get("/models/ArticleStats?per_page=1&page=2")
+    assert response.status_code == 200
+    links = re.findall(r'href="\?page=(\d+)&', response.text)
+    assert links == ["1", "1", "2", "3", "4", "5", "6", "7", "3"]
+    assert "of 12" in response.text
+
+
+async def test_search_tsvector():
+    await Article.query.create(title="Running shoes", body="light and fast")
+    await Article.query.create(title="Dinner", body="pasta")
+    queryset = apply_search(Article.query.all(), "runs")
+    sql = str((await queryset.as_select()).compile())
+    if models.database.url.dialect == "postgresql":
+        assert "@@" in sql
+        assert [article.title for article in await queryset] == ["Running shoes"]
+    else:
+        assert "lower" in sql.lower() or "like" in sql.lower()
+        assert await queryset == []
+
+
+async def test_search_ilike_any_field():
+    queryset = apply_search(Plain.query.all(), "foo")
+    sql = str((await queryset.as_select()).compile())
+    assert " OR " in sql
+
+
+async def test_search_fts5():
+    async with sqlite_models.database:
+        await sqlite_models.create_all()
+        async with sqlite_models.database as db:
+            await db.execute(
+                sqlalchemy.text(
+                    "CREATE VIRTUAL TABLE notes_fts USING fts5(text, content='notes', "
+                    "content_rowid='id')"
+                )
+            )
+        await Note.query.create(text="buy milk")
+        await Note.query.create(text="call bob")
+        async with sqlite_models.database as db:
+            await db.execute(sqlalchemy.text("INSERT INTO notes_fts(notes_fts) VALUES('rebuild')"))
+        notes = await apply_search(Note.query.all(), "milk")
+        assert [note.text for note in notes] == ["buy milk"]
+        # quotes are part of the phrase instead of the query syntax
+        assert await apply_search(Note.query.all(), 'mi"lk') == []
@@ -184,3 +184,18 @@ async def test_extra_reflection():
         )
         obj = await reflected.get_model("AutoFoofoos").query.create(a="edgy")
         assert (await Foo.query.get(a="edgy")).id == obj.id
+
+
+async def test_only_matching_tables_are_reflected():
+    reflected = edgy.Registry(DATABASE_URL)
+
+    class AutoFoo(AutoReflectModel):
+        class Meta:
+            registry = reflected
+            include_pattern = r"^(not)?foos$"
+            exclude_pattern = r"^not"
+
+    async with reflected:
+        tables = await reflected._reflect_pattern_tables(None, reflected.database)
+        assert [table.name for table in tables] == ["foos"]
+        assert [model.meta.tablename for model in reflected.reflected.values()] == ["foos"]
@@ -0,0 +1,166 @@
+import hashlib
+import os
+
+import pytest
+
+import edgy
+from edgy.contrib.content_addressed import BaseContentBlob, ContentAddressedStorage
+from edgy.contrib.content_addressed import storage as content_addressed_storage
+from edgy.core.files import base as files_base
+from edgy.core.files.storage import StorageHandler
+from edgy.exceptions import SuspiciousFileOperation
+from edgy.testclient import DatabaseTestClient
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = DatabaseTestClient(DATABASE_URL, drop_database=True, use_existing=False)
+models = edgy.Registry(database=database)
+
+
+class ContentBlob(BaseContentBlob):
+    class Meta:
+        registry = models
+
+
+@pytest.fixture()
+def storage(tmp_path):
+    handler = StorageHandler(
+        {
+            "cas": {
+                "backend": "edgy.contrib.content_addressed.ContentAddressedStorage",
+                "options": {"location": tmp_path, "blob_model": ContentBlob},
+            }
+        }
+    )
+    return handler["cas"]
+
+
+@pytest.fixture()
+async def create_test_database():
+    async with database:
+        await models.create_all()
+        yield
+
+
+def make_model(storage):
+    class Upload(edgy.StrictModel):
+        file: edgy.files.FieldFile = edgy.fields.FileField(storage=storage, null=True)
+
+        class Meta:
+            registry = models
+
+    return Upload
+
+
+async def test_deduplication(create_test_database, storage):
+    Upload = make_model(storage)
+    await models.create_all()
+    digest = hashlib.sha256(b"same").hexdigest()
+    first = await Upload.query.create(file=edgy.files.ContentFile(b"same", name="a.pdf"))
+    second = await Upload.query.create(file=edgy.files.ContentFile(b"same", name="b.pdf"))
+    assert first.file.name == second.file.name == f"{digest[:2]}/{digest[2:4]}/{digest}"
+    assert isinstance(storage, ContentAddressedStorage)
+    path = storage.path(first.file.name)
+    assert os.path.exists(path)
+    assert (await ContentBlob.query.get(name=first.file.name)).refcount == 2
+
+    # saving the same content again doesn't add a reference
+    first.file.save(b"same")
+    await first.save()
+    assert (await ContentBlob.query.get(name=first.file.name)).refcount == 2
+
+    await first.delete()
+    assert os.path.exists(path)
+    assert (await ContentBlob.query.get(name=second.file.name)).refcount == 1
+
+    # replacing the content removes the last reference
+    second.file.save(b"other")
+    await second.save()
+    assert not os.path.exists(path)
+    assert await ContentBlob.query.filter(name=first.file.name).count() == 0
+    assert await ContentBlob.query.count() == 1
+    await second.delete()
+    assert await ContentBlob.query.count() == 0
+
+
+async def test_content_hashed_once(create_test_database, storage, monkeypatch):
+    class HashedUpload(edgy.StrictModel):
+        file: edgy.files.FieldFile = edgy.fields.FileField(
+            storage=storage, hash_algorithm="sha256", null=True
+        )
+
+        class Meta:
+            registry = models
+
+    await models.create_all()
+    scans = []
+    original = content_addressed_storage.scan_file
+
+    def scan_file(file, **kwargs):
+        scans.append(kwargs)
+        return original(file, **kwargs)
+
+    monkeypatch.setattr(content_addressed_storage, "scan_file", scan_file)
+    monkeypatch.setattr(files_base, "scan_file", scan_file)
+    upload = await HashedUpload.query.create(file=edgy.files.ContentFile(b"once", name="a.txt"))
+    assert len(scans) == 1
+    assert upload.file.metadata["sha256"] == hashlib.sha256(b"once").hexdigest()
+    assert upload.file.metadata["size"] == 4
+
+
+async def test_delete_keeps_rereferenced_blob(create_test_database, storage):
+    name = storage.get_content_name(edgy.files.ContentFile(b"blob").file, "")
+    await storage.asave(b"blob", name)
+    original = storage._remove_reference
+
+    async def remove_reference(name: str) -> bool:
+        result = await original(name)
+        # referenced concurrently
+        await storage._add_reference(name)
+        return result
+
+    storage._remove_reference = remove_reference
+    await storage.adelete(name)
+    assert storage.exists(name)
+    assert await storage._get_refcount(name) == 1
+
+
+def test_names(storage):
+    with pytest.raises(SuspiciousFileOperation):
+        storage.sanitize_name("foo.txt")
+    with pytest.raises(SuspiciousFileOperation):
+        storage.sanitize_name("ab/cd/ef12")
+    assert storage.sanitize_name("ef/12/ef12") == "ef/12/ef12"
+
+
+async def test_sync_methods(create_test_database, storage):
+    name = storage.get_content_name(edgy.files.ContentFile(b"sync").file, "")
+    storage.save(b"sync", name)
+    storage.save(b"sync", name)
+    assert await storage._get_refcount(name) == 2
+    storage.delete(name)
+    storage.delete(name)
+    assert not storage.exists(name)
+
+
+async def test_add_reference_race_in_transaction(create_test_database, storage, monkeypatch):
+    name = storage.get_content_name(edgy.files.ContentFile(b"race").file, "")
+    execute = database.execute
+    calls = 0
+
+    async def execute_after_race(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            # the row is inserted concurrently after the update missed it
+            await execute(ContentBlob.table.insert().values(name=name, refcount=1))
+            return 0
+        return await execute(*args, **kwargs)
+
+    async with database.transaction():
+        monkeypatch.setattr(database, "execute", execute_after_race)
+        # the failed insert doesn't abort the transaction
+        await storage._add_reference(name)
+        monkeypatch.undo()
+        assert await storage._get_refcount(name) == 2
@@ -0,0 +1,131 @@
+import logging
+import os
+
+import pytest
+
+import edgy
+from edgy.contrib.file_cleanup import BaseFileCleanup, process_file_cleanups
+from edgy.core.files.storage import StorageHandler
+from edgy.testclient import DatabaseTestClient
+from tests.settings import DATABASE_ALTERNATIVE_URL, DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = DatabaseTestClient(DATABASE_URL, drop_database=True, use_existing=False)
+another_db = DatabaseTestClient(DATABASE_ALTERNATIVE_URL, drop_database=True, use_existing=False)
+models = edgy.Registry(database=database, extra={"another": another_db})
+
+
+class FileCleanup(BaseFileCleanup):
+    class Meta:
+        registry = models
+
+
+class Document(edgy.StrictModel):
+    file: edgy.files.FieldFile = edgy.fields.FileField(null=True)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True)
+def cleanup_model():
+    with edgy.monkay.with_settings(
+        edgy.monkay.settings.model_copy(update={"file_cleanup_model": "FileCleanup"})
+    ):
+        yield
+
+
+@pytest.fixture()
+async def create_test_database():
+    async with models:
+        await models.create_all()
+        # the same tables on the other database
+        await another_db.run_sync(models.metadata_by_name[None].create_all)
+        yield
+
+
+async def create_documents(amount: int) -> list[str]:
+    paths = []
+    for i in range(amount):
+        document = await Document.query.create(
+            file=edgy.files.ContentFile(b"content", name=f"document{i}.txt")
+        )
+        paths.append(document.file.path)
+    return paths
+
+
+async def test_queryset_delete_deferred(create_test_database):
+    paths = await create_documents(5)
+    await Document.query.delete()
+    # still there
+    assert all(os.path.exists(path) for path in paths)
+    assert await FileCleanup.query.count() == 5
+
+    assert await process_file_cleanups(FileCleanup, batch_size=3, concurrency=2) == 3
+    assert await process_file_cleanups(FileCleanup, batch_size=3) == 2
+    assert await process_file_cleanups(FileCleanup) == 0
+    assert not any(os.path.exists(path) for path in paths)
+    assert await FileCleanup.query.count() == 0
+
+
+async def test_queryset_delete_inserts_per_batch(create_test_database, monkeypatch):
+    paths = await create_documents(5)
+    batches = []
+    enqueue_many = FileCleanup.enqueue_many
+
+    async def record_enqueue_many(files):
+        batches.append(len(files))
+        await enqueue_many(files)
+
+    monkeypatch.setattr(FileCleanup, "enqueue_many", record_enqueue_many)
+    await Document.query.batch_size(2).delete()
+    assert batches == [2, 2, 1]
+    assert await FileCleanup.query.count() == 5
+
+    assert await process_file_cleanups(FileCleanup) == 5
+    assert not any(os.path.exists(path) for path in paths)
+
+
+async def test_rollback_keeps_files(create_test_database):
+    paths = await create_documents(2)
+    with pytest.raises(ZeroDivisionError):
+        async with Document.transaction():
+            await Document.query.delete()
+            assert await FileCleanup.query.count() == 2
+            raise ZeroDivisionError()
+    assert await FileCleanup.query.count() == 0
+    assert await Document.query.count() == 2
+    assert all(os.path.exists(path) for path in paths)
+    for path in paths:
+        os.remove(path)
+
+
+async def test_failed_deletions_retried(create_test_database):
+    await FileCleanup.query.create(storage="missing", name="foo.txt", attempts=0)
+    # the storage isn't configured
+    assert await process_file_cleanups(FileCleanup, storages=StorageHandler({})) == 0
+    assert (await FileCleanup.query.get()).attempts == 1
+
+
+async def test_failed_deletions_dropped_after_max_attempts(create_test_database, caplog):
+    await FileCleanup.query.create(storage="missing", name="foo.txt", attempts=2)
+    with caplog.at_level(logging.ERROR, logger="edgy.contrib.file_cleanup.worker"):
+        assert (
+            await process_file_cleanups(FileCleanup, storages=StorageHandler({}), max_attempts=3)
+            == 0
+        )
+    assert await FileCleanup.query.count() == 0
+    assert "Gave up deleting the file 'foo.txt' of storage 'missing'" in caplog.text
+
+
+async def test_delete_on_other_database_instant(create_test_database):
+    document = await Document.query.using(database="another").create(
+        file=edgy.files.ContentFile(b"content", name="other.txt")
+    )
+    path = document.file.path
+    await document.delete()
+    # the queue row wouldn't be part of the transaction of the other database
+    assert not os.path.exists(path)
+    assert await FileCleanup.query.count() == 0
+    assert await Document.query.using(database="another").count() == 0
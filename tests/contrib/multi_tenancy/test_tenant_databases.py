@@ -0,0 +1,130 @@
+import os
+from typing import ClassVar
+
+import pytest
+
+import edgy
+from edgy.contrib.multi_tenancy.databases import (
+    TenantDatabase,
+    TenantDatabaseManager,
+    TenantDatabaseRouter,
+)
+from edgy.core.db import with_tenant
+
+pytestmark = pytest.mark.anyio
+
+models = edgy.Registry(database="sqlite:///test_tenant_databases.db")
+TENANTS = ["a", "b", "c"]
+
+
+def resolve(tenant: str) -> str | None:
+    if tenant == "missing":
+        return None
+    return f"sqlite:///test_tenant_databases_{tenant}.db"
+
+
+router = TenantDatabaseRouter(resolve, max_pools=2)
+
+
+class Product(edgy.StrictModel):
+    name: str = edgy.CharField(max_length=100)
+
+    query: ClassVar[TenantDatabaseManager] = TenantDatabaseManager(router=router)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="module")
+async def create_test_databases():
+    metadata = Product.table.metadata
+    for tenant in [None, *TENANTS]:
+        url = resolve(tenant) if tenant else str(models.database.url)
+        async with edgy.Database(url) as database:
+            await database.create_all(metadata)
+    yield
+    await router.disconnect()
+    for tenant in [None, *TENANTS]:
+        path = f"test_tenant_databases{f'_{tenant}' if tenant else ''}.db"
+        if os.path.exists(path):
+            os.remove(path)
+
+
+@pytest.fixture(autouse=True)
+async def reset_router():
+    router.max_pools = 2
+    router.reset_stats()
+    async with models:
+        yield
+    await router.disconnect()
+
+
+async def test_routing():
+    for tenant in TENANTS:
+        with with_tenant(tenant):
+            await Product.query.create(name=tenant)
+    await Product.query.create(name="default")
+
+    for tenant in TENANTS:
+        with with_tenant(tenant):
+            assert [product.name for product in await Product.query.all()] == [tenant]
+    assert [product.name for product in await Product.query.all()] == ["default"]
+    # falls back to the schema of the tenant
+    with with_tenant("missing"):
+        assert Product.query.all().database is models.database
+        assert Product.query.all().active_schema == "missing"
+
+
+async def test_lazy_pools_and_eviction():
+    with with_tenant("a"):
+        queryset = Product.query.all()
+    database = queryset.database
+    assert isinstance(database, TenantDatabase)
+    assert not database.is_connected
+    assert router.stats().pools == 0
+
+    await queryset.count()
+    assert database.is_connected
+    assert router.stats().pools == 1
+    assert set(router.idle_pools()) == {"a"}
+
+    for tenant in ["b", "c"]:
+        with with_tenant(tenant):
+            await Product.query.count()
+
+    # the least recently used pool is disconnected
+    assert not database.is_connected
+    stats = router.stats()
+    assert (stats.evictions, stats.pools, stats.idle) == (1, 2, 2)
+    assert set(router.idle_pools()) == {"b", "c"}
+
+    # the evicted database reconnects lazily
+    await queryset.all().count()
+    assert database.is_connected
+    assert set(router.idle_pools()) == {"a", "c"}
+
+
+async def test_pools_in_use_are_not_evicted():
+    router.max_pools = 1
+    with with_tenant("a"):
+        database = Product.query.all().database
+    async with database:
+        with with_tenant("b"):
+            other = Product.query.all().database
+            await Product.query.count()
+        # the idle pool is evicted instead of the used one
+        assert database.is_connected
+        assert not other.is_connected
+        stats = router.stats()
+        assert (stats.evictions, stats.pools, stats.idle) == (1, 1, 0)
+    assert database.is_connected
+    assert set(router.idle_pools()) == {"a"}
+
+
+async def test_disconnect_idle():
+    for tenant in ["a", "b"]:
+        with with_tenant(tenant):
+            await Product.query.count()
+    assert await router.disconnect_idle(3600) == 0
+    assert await router.disconnect_idle() == 2
+    assert router.stats().pools == 0
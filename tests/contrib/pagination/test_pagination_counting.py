@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+import sqlalchemy
+
+import edgy
+from edgy.contrib.pagination import NumberedPaginator
+from edgy.core.db.querysets.counting import count_cache, estimate_count, get_total
+from edgy.testclient import DatabaseTestClient
+from tests.settings import DATABASE_URL
+
+database = DatabaseTestClient(DATABASE_URL)
+models = edgy.Registry(database=edgy.Database(database, force_rollback=True))
+
+pytestmark = pytest.mark.anyio
+
+
+class Item(edgy.Model):
+    value: int = edgy.IntegerField()
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="module")
+async def create_test_database():
+    async with database:
+        await models.create_all()
+        yield
+        if not database.drop:
+            await models.drop_all()
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def rollback_connection():
+    async with models:
+        count_cache.clear()
+        yield
+
+
+async def create_items(amount: int = 200) -> None:
+    await Item.query.bulk_create([{"value": i % 10} for i in range(amount)])
+    async with models.database as db:
+        await db.execute(sqlalchemy.text("ANALYZE"))
+
+
+async def test_estimate_count():
+    await create_items()
+    estimate = await estimate_count(Item.query.all())
+    if models.database.url.dialect in {"postgresql", "sqlite"}:
+        assert estimate == 200
+    # filtered querysets are estimated by the planner (PostgreSQL) or counted
+    assert await Item.query.filter(value=1).estimate_count() > 0
+    assert await Item.query.estimate_count() == 200
+
+
+async def test_get_total_threshold():
+    await create_items()
+    if models.database.url.dialect in {"postgresql", "sqlite"}:
+        assert await get_total(Item.query.all(), estimate_threshold=100) == (200, True)
+    assert await get_total(Item.query.all(), estimate_threshold=1000) == (200, False)
+    assert await get_total(Item.query.filter(value=1)) == (20, False)
+
+    paginator = NumberedPaginator(Item.query.order_by("id"), page_size=30, estimate_threshold=1000)
+    assert await paginator.get_amount_pages() == 7
+    assert not paginator.total_is_estimate
+
+
+async def test_count_cache_ttl():
+    await create_items(10)
+    queryset = Item.query.filter(value__gte=0)
+    assert await get_total(queryset, cache_ttl=60) == (10, False)
+    await Item.query.create(value=1)
+    # cached
+    assert await get_total(Item.query.filter(value__gte=0), cache_ttl=60) == (10, False)
+    # stale: returned once more and refreshed in the background
+    assert await get_total(Item.query.filter(value__gte=0), cache_ttl=0.0001) == (10, False)
+    for _ in range(100):
+        if not count_cache._refreshing:
+            break
+        await asyncio.sleep(0.01)
+    assert await get_total(Item.query.filter(value__gte=0), cache_ttl=60) == (11, False)
+    # other filters have other entries
+    assert await get_total(Item.query.filter(value=1), cache_ttl=60) == (2, False)
@@ -0,0 +1,169 @@
+import datetime
+import decimal
+import uuid
+
+import pytest
+import sqlalchemy
+
+import edgy
+from edgy.contrib.pagination import CursorPaginator, NumberedPaginator
+from edgy.contrib.pagination.cursor import decode_cursor, encode_cursor
+from edgy.testclient import DatabaseTestClient
+from tests.settings import DATABASE_URL
+
+database = DatabaseTestClient(DATABASE_URL)
+models = edgy.Registry(database=edgy.Database(database, force_rollback=True))
+
+pytestmark = pytest.mark.anyio
+
+
+class Entry(edgy.Model):
+    category: int = edgy.IntegerField()
+    score: int = edgy.IntegerField()
+    created: datetime.datetime = edgy.DateTimeField(
+        default=datetime.datetime(2025, 1, 1), with_timezone=False
+    )
+
+    class Meta:
+        registry = models
+        indexes = [edgy.Index(fields=["category", "score", "id"])]
+
+
+@pytest.fixture(autouse=True, scope="module")
+async def create_test_database():
+    async with database:
+        await models.create_all()
+        yield
+        if not database.drop:
+            await models.drop_all()
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def rollback_connection():
+    async with models:
+        yield
+
+
+async def create_entries(amount: int = 100) -> None:
+    await Entry.query.bulk_create(
+        [
+            {
+                "category": i % 3,
+                "score": i % 7,
+                "created": datetime.datetime(2025, 1, 1) + datetime.timedelta(minutes=i),
+            }
+            for i in range(amount)
+        ]
+    )
+
+
+@pytest.mark.parametrize("row_values", [None, True, False])
+@pytest.mark.parametrize(
+    "order_by",
+    [("category", "score", "id"), ("-category", "-score", "-id"), ("category", "-score", "id")],
+)
+async def test_keyset_order(order_by, row_values):
+    await create_entries()
+    expected = [entry.id for entry in await Entry.query.order_by(*order_by)]
+    paginator = CursorPaginator(
+        Entry.query.order_by(*order_by), page_size=7, row_values=row_values
+    )
+    same_direction = len({criteria[0] == "-" for criteria in order_by}) == 1
+    assert paginator.use_row_values(paginator.queryset) == (
+        same_direction and row_values is not False
+    )
+
+    ids: list[int] = []
+    cursor = None
+    while True:
+        page = await paginator.get_page(cursor)
+        ids.extend(entry.id for entry in page.content)
+        if page.is_last:
+            break
+        cursor = page.next_cursor
+    assert ids == expected
+
+    # backwards, the page ends with the cursor
+    last_size = len(page.content)
+    position = len(ids) - last_size - 1
+    page = await paginator.get_page(cursor, backward=True)
+    assert [entry.id for entry in page.content][:7] == ids[position - 6 : position + 1]
+    assert [entry.id for entry in (await paginator.get_page(cursor)).content] == ids[-last_size:]
+
+
+async def test_keyset_row_value_sql():
+    paginator = CursorPaginator(Entry.query.order_by("category", "score"), page_size=5)
+    queryset = paginator.queryset.filter(paginator.get_cursor_filter((1, 2)))
+    expression = await queryset.as_select()
+    sql = str(expression.compile(compile_kwargs={"literal_binds": True})).replace('"', "")
+    if paginator.use_row_values(paginator.queryset):
+        assert "(entrys.category, entrys.score) > (1, 2)" in sql
+    else:
+        assert "entrys.category >= 1" in sql
+
+
+async def test_cursor_tokens():
+    await create_entries(20)
+    paginator = CursorPaginator(
+        Entry.query.order_by("-created", "id"), page_size=5, cursor_tokens=True
+    )
+    page = await paginator.get_page()
+    assert isinstance(page.next_cursor, str)
+    assert decode_cursor(page.next_cursor) == (page.content[-1].created, page.content[-1].id)
+
+    next_page = await paginator.get_page(page.next_cursor)
+    assert next_page.current_cursor == page.next_cursor
+    assert next_page.content[0].created <= page.content[-1].created
+    previous_page = await paginator.get_page(next_page.current_cursor, backward=True)
+    assert previous_page.current_cursor == page.next_cursor
+    assert page.content[-1].id in {entry.id for entry in previous_page.content}
+
+    with pytest.raises(ValueError):
+        await paginator.get_page("not a token")
+
+
+async def test_token_roundtrip():
+    vector = (
+        1,
+        "text",
+        None,
+        1.5,
+        True,
+        datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        datetime.date(2025, 1, 2),
+        datetime.time(3, 4),
+        datetime.timedelta(hours=1),
+        decimal.Decimal("1.20"),
+        uuid.UUID(int=5),
+        b"\x00\xff",
+    )
+    token = encode_cursor(vector)
+    assert "=" not in token
+    assert decode_cursor(token) == vector
+
+
+async def test_deep_page_uses_keyset_predicate():
+    await create_entries(20)
+    paginator = CursorPaginator(Entry.query.order_by("category", "score", "id"), page_size=2)
+    deep = (await NumberedPaginator(paginator.queryset, 2).get_page(8)).content[0]
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.replace('"', ""))
+
+    sqlalchemy.event.listen(sqlalchemy.engine.Engine, "before_cursor_execute", record)
+    try:
+        page = await paginator.get_page((deep.category, deep.score, deep.id - 1))
+    finally:
+        sqlalchemy.event.remove(sqlalchemy.engine.Engine, "before_cursor_execute", record)
+    assert page.content[0].id == deep.id
+
+    # deep pages seek via the index instead of skipping rows
+    assert statements
+    assert not any("OFFSET" in statement for statement in statements)
+    if paginator.use_row_values(paginator.queryset):
+        assert any(
+            "(entrys.category, entrys.score, entrys.id) >" in statement for statement in statements
+        )
+    else:
+        assert any("entrys.category >=" in statement for statement in statements)
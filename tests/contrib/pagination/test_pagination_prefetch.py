@@ -0,0 +1,99 @@
+import pytest
+
+import edgy
+from edgy.contrib.pagination import CursorPaginator, NumberedPaginator
+from edgy.testclient import DatabaseTestClient
+from tests.settings import DATABASE_URL
+
+database = DatabaseTestClient(DATABASE_URL)
+models = edgy.Registry(database=edgy.Database(database, force_rollback=True))
+
+pytestmark = pytest.mark.anyio
+
+
+class IntCounter(edgy.Model):
+    id: int = edgy.IntegerField(primary_key=True, autoincrement=False)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="module")
+async def create_test_database():
+    async with database:
+        await models.create_all()
+        yield
+        if not database.drop:
+            await models.drop_all()
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def rollback_connection():
+    async with models:
+        yield
+
+
+@pytest.mark.parametrize("paginator_class", [NumberedPaginator, CursorPaginator])
+async def test_prefetch_same_pages(paginator_class):
+    await IntCounter.query.bulk_create([{"id": i} for i in range(50)])
+    paginator = paginator_class(IntCounter.query.order_by("id"), page_size=7)
+    expected = [[item.id for item in page.content] async for page in paginator.paginate()]
+    paginator.clear_caches()
+    pages = [page async for page in paginator.paginate(prefetch=2)]
+    assert [[item.id for item in page.content] for page in pages] == expected
+    assert pages[0].is_first
+    assert pages[-1].is_last
+
+
+async def test_prefetch_stop_early():
+    await IntCounter.query.bulk_create([{"id": i} for i in range(50)])
+    paginator = CursorPaginator(IntCounter.query.order_by("id"), page_size=5)
+    async for page in paginator.paginate(prefetch=3):
+        assert page.content[0].id == 0
+        break
+    # the connection is still usable
+    assert await IntCounter.query.count() == 50
+
+
+async def test_prefetch_raises():
+    async def failing():
+        yield 1
+        raise ValueError("broken")
+
+    from edgy.contrib.pagination.base import prefetch_pages
+
+    items = []
+    with pytest.raises(ValueError):
+        async for item in prefetch_pages(failing(), 2):
+            items.append(item)
+    assert items == [1]
+
+
+async def test_cursor_reuses_trailing_item():
+    await IntCounter.query.bulk_create([{"id": i} for i in range(20)])
+    paginator = CursorPaginator(
+        IntCounter.query.order_by("id"),
+        page_size=5,
+        next_item_attr="next",
+        previous_item_attr="prev",
+    )
+    page = await paginator.get_page()
+    next_page = await paginator.get_page(page.next_cursor)
+    # the trailing item of the previous page is linked, without querying it again
+    assert next_page.content[0].prev.id == page.content[-1].id == 4
+    assert page.content[-1].prev.id == 3
+    assert not next_page.is_first
+
+    # a fresh paginator queries the item at the cursor
+    paginator = CursorPaginator(
+        IntCounter.query.order_by("id"),
+        page_size=5,
+        next_item_attr="next",
+        previous_item_attr="prev",
+    )
+    next_page = await paginator.get_page(4)
+    assert [item.id for item in next_page.content] == [5, 6, 7, 8, 9]
+    assert next_page.content[0].prev.id == 4
+    assert not next_page.is_first
+    page = [page async for page in paginator.paginate(start_cursor=4)][0]
+    assert page.content[0].prev.id == 4
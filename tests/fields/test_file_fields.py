@@ -1,3 +1,4 @@
+import hashlib
 import os
 from typing import Any
 from unittest.mock import call
@@ -7,7 +8,7 @@ import pytest
 import sqlalchemy
 
 import edgy
-from edgy.exceptions import FileOperationError
+from edgy.exceptions import FieldDefinitionError, FileOperationError
 from edgy.testclient import DatabaseTestClient
 from tests.settings import DATABASE_URL
 
@@ -24,7 +25,7 @@ class MyModäl(edgy.StrictModel):
 
 
 class MyModel(edgy.StrictModel):
-    file_field: edgy.files.FieldFile = edgy.fields.FileField(null=True)
+    file_field: edgy.files.FieldFile = edgy.fields.FileField(null=True, hash_algorithm="sha256")
     file_field_size: int = edgy.fields.IntegerField(null=True)
 
     class Meta:
@@ -131,6 +132,41 @@ async def test_save_file_create(create_test_database):
     assert not os.path.exists(path)
 
 
+async def test_save_file_metadata(create_test_database, monkeypatch):
+    model = await MyModel.query.create(
+        file_field=edgy.files.ContentFile(b"!# /bin/sh", name="foo.sh")
+    )
+    assert model.file_field.metadata["size"] == 10
+    assert model.file_field.metadata["sha256"] == hashlib.sha256(b"!# /bin/sh").hexdigest()
+
+    def scan(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("file read")
+
+    # unchanged files aren't read again
+    monkeypatch.setattr(edgy.files.FieldFile, "scan", scan)
+    model = await MyModel.query.get(id=model.id)
+    await model.save()
+    model = await MyModel.query.get(id=model.id)
+    assert model.file_field.metadata["sha256"] == hashlib.sha256(b"!# /bin/sh").hexdigest()
+
+
+async def test_save_file_not_read(create_test_database, monkeypatch):
+    def scan(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("file read")
+
+    # without hashing only the name is needed for the metadata
+    monkeypatch.setattr(edgy.files.FieldFile, "scan", scan)
+    model = await MyModäl.query.create(ä=edgy.files.ContentFile(b"!# /bin/sh", name="foo.sh"))
+    assert model.ä.metadata["mime"].endswith("x-sh")
+    assert "sha256" not in model.ä.metadata
+    assert model.ä.size == 10
+
+
+def test_hash_algorithm():
+    with pytest.raises(FieldDefinitionError):
+        edgy.fields.FileField(hash_algorithm="unknown")
+
+
 async def test_save_file_create_special(create_test_database):
     model = await MyModäl.query.create(ä=edgy.files.ContentFile(b"!# /bin/sh", name="foo.sh"))
     # get cached
@@ -78,3 +78,18 @@ async def test_save_file_create_approved(create_test_database):
 
         assert model.ifield.metadata["height"] == 1
         assert model.ifield.metadata["width"] == 1
+
+
+async def test_save_file_dimensions_from_header(create_test_database, monkeypatch):
+    def open_image(self):
+        raise AssertionError("image opened")
+
+    # the dimensions are read from the first bytes of the file
+    monkeypatch.setattr(edgy.files.ImageFieldFile, "open_image", open_image)
+    image = BASE_PATH / "tests/images/mini_image.jpg"
+    model = await MyModel.query.create(
+        ifield=edgy.files.File(open(image, mode="rb"), name=str(image.name))
+    )
+    assert model.ifield.metadata["height"] == 1
+    assert model.ifield.metadata["width"] == 1
+    assert model.ifield.metadata["size"] == image.stat().st_size
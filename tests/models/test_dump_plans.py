@@ -0,0 +1,75 @@
+import edgy
+from edgy.core.db.models.mixins.dump import get_dump_plan
+
+models = edgy.Registry(database="sqlite:///test_dump_plans.db")
+
+
+def callback(field, model_instance, model_owner):
+    return "computed"
+
+
+class Profile(edgy.StrictModel):
+    name: str = edgy.CharField(max_length=100)
+    computed = edgy.fields.ComputedField(callback, exclude=False)
+
+    class Meta:
+        registry = models
+
+
+class User(edgy.StrictModel):
+    name: str = edgy.CharField(max_length=100)
+    profile: Profile = edgy.ForeignKey(Profile, on_delete=edgy.CASCADE)
+
+    class Meta:
+        registry = models
+
+
+def test_plan_is_reused():
+    user = User(id=1, name="edgy", profile=Profile(id=2, name="foo"))
+    plan = get_dump_plan(user, include=None, exclude=None, show_pk=False)
+    assert plan is get_dump_plan(user, include=None, exclude=None, show_pk=False)
+    assert plan is not get_dump_plan(user, include=None, exclude=None, show_pk=True)
+    assert plan is get_dump_plan(
+        User(id=3, name="edgy2", profile=Profile(id=4, name="bar")),
+        include=None,
+        exclude=None,
+        show_pk=False,
+    )
+    assert "profile" in plan.exclude
+    assert [entry[0] for entry in plan.second_pass] == ["profile"]
+
+
+def test_plan_is_decoupled_from_arguments():
+    user = User(id=1, name="edgy", profile=Profile(id=2, name="foo"))
+    exclude = {"profile": {"computed"}}
+    assert user.model_dump(exclude=exclude) == {
+        "id": 1,
+        "name": "edgy",
+        "profile": {"id": 2, "name": "foo"},
+    }
+    exclude["profile"].add("name")
+    assert user.model_dump(exclude=exclude) == {"id": 1, "name": "edgy", "profile": {"id": 2}}
+    assert user.model_dump(exclude={"profile": {"computed"}}) == {
+        "id": 1,
+        "name": "edgy",
+        "profile": {"id": 2, "name": "foo"},
+    }
+
+
+def test_unhashable_filters_bypass_cache():
+    user = User(id=1, name="edgy", profile=Profile(id=2, name="foo"))
+    include = {"name": True, "profile": {"name": [{}]}}
+    plan = get_dump_plan(user, include=include, exclude=None, show_pk=False)
+    assert plan is not get_dump_plan(user, include=include, exclude=None, show_pk=False)
+
+
+def test_plan_invalidated_on_meta_change():
+    user = User(id=1, name="edgy", profile=Profile(id=2, name="foo"))
+    plan = get_dump_plan(user, include=None, exclude=None, show_pk=False)
+    Profile.meta.invalidate(clear_class_attrs=False)
+    assert plan is not get_dump_plan(user, include=None, exclude=None, show_pk=False)
+    assert user.model_dump() == {
+        "id": 1,
+        "name": "edgy",
+        "profile": {"id": 2, "name": "foo", "computed": "computed"},
+    }
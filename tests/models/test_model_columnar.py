@@ -0,0 +1,144 @@
+import datetime
+import decimal
+import enum
+import uuid
+
+import pytest
+
+import edgy
+from edgy.exceptions import QuerySetError
+from edgy.testclient import DatabaseTestClient
+from tests.settings import DATABASE_URL
+
+numpy = pytest.importorskip("numpy")
+
+database = DatabaseTestClient(DATABASE_URL, full_isolation=False)
+models = edgy.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Status(enum.Enum):
+    DRAFT = "draft"
+    RELEASED = "released"
+
+
+class Product(edgy.StrictModel):
+    id = edgy.IntegerField(primary_key=True, autoincrement=True)
+    name = edgy.CharField(max_length=100)
+    amount = edgy.IntegerField(null=True)
+    price = edgy.FloatField(null=True)
+    exact_price = edgy.DecimalField(max_digits=9, decimal_places=2, null=True)
+    active = edgy.BooleanField(default=True)
+    created = edgy.DateTimeField(default=datetime.datetime.now, remove_timezone=True)
+    uid = edgy.UUIDField(default=uuid.uuid4)
+    status = edgy.ChoiceField(Status, default=Status.DRAFT)
+    previous_status = edgy.ChoiceField(Status, null=True)
+    data = edgy.JSONField(default=dict)
+    secret = edgy.CharField(max_length=100, null=True, secret=True)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    async with database:
+        await models.create_all()
+        yield
+        if not database.drop:
+            await models.drop_all()
+
+
+async def create_products():
+    await Product.query.create(name="foo", amount=1, price=1.5, exact_price=decimal.Decimal("2"))
+    await Product.query.create(name="bar", status=Status.RELEASED, data={"a": [1, 2]})
+    await Product.query.create(name="baz", amount=3, active=False, secret="x")
+
+
+async def test_to_numpy_columns():
+    await create_products()
+
+    columns = await Product.query.order_by("id").to_numpy_columns(chunk_size=2)
+
+    assert list(columns["id"]) == [1, 2, 3]
+    assert columns["id"].dtype == numpy.dtype("int64")
+    assert list(columns["name"]) == ["foo", "bar", "baz"]
+    assert columns["amount"].dtype == numpy.dtype("int64")
+    assert list(columns["amount"].mask) == [False, True, False]
+    assert columns["amount"].sum() == 4
+    assert columns["price"].dtype == numpy.dtype("float64")
+    assert list(columns["active"]) == [True, True, False]
+    assert columns["created"].dtype == numpy.dtype("datetime64[us]")
+    assert list(columns["status"]) == [Status.DRAFT, Status.RELEASED, Status.DRAFT]
+    assert columns["data"][1] == {"a": [1, 2]}
+    assert columns["exact_price"][0] == decimal.Decimal("2")
+
+
+async def test_to_numpy_columns_field_selection():
+    await create_products()
+
+    columns = await Product.query.exclude_secrets().to_numpy_columns()
+    assert "secret" not in columns
+
+    columns = await Product.query.only("name").to_numpy_columns()
+    assert set(columns) == {"id", "name"}
+
+    columns = await Product.query.filter(name="bar").defer("data").to_numpy_columns()
+    assert "data" not in columns
+    assert list(columns["name"]) == ["bar"]
+
+
+async def test_to_numpy_columns_empty():
+    columns = await Product.query.to_numpy_columns()
+    assert len(columns["id"]) == 0
+    assert len(columns["amount"]) == 0
+
+
+async def test_invalid_chunk_size():
+    with pytest.raises(QuerySetError):
+        await Product.query.to_numpy_columns(chunk_size=0)
+
+
+async def test_to_arrow():
+    pyarrow = pytest.importorskip("pyarrow")
+    await create_products()
+
+    table = await Product.query.order_by("id").to_arrow(chunk_size=2)
+
+    assert table.num_rows == 3
+    assert table.column("id").to_pylist() == [1, 2, 3]
+    assert table.column("amount").to_pylist() == [1, None, 3]
+    assert table.schema.field("amount").nullable
+    assert table.schema.field("created").type == pyarrow.timestamp("us")
+    assert table.column("status").to_pylist() == ["draft", "released", "draft"]
+    assert table.column("data").to_pylist() == ["{}", '{"a":[1,2]}', "{}"]
+    assert isinstance(table.column("uid").to_pylist()[0], str)
+
+
+async def test_to_arrow_null_first_chunk():
+    pyarrow = pytest.importorskip("pyarrow")
+    await Product.query.create(name="foo")
+    await Product.query.create(
+        name="bar", exact_price=decimal.Decimal("1.5"), previous_status=Status.DRAFT
+    )
+    await Product.query.create(name="baz", exact_price=decimal.Decimal("1234567.25"))
+
+    table = await Product.query.order_by("id").to_arrow(chunk_size=1)
+
+    assert table.schema.field("exact_price").type == pyarrow.decimal128(9, 2)
+    assert table.column("exact_price").to_pylist() == [
+        None,
+        decimal.Decimal("1.50"),
+        decimal.Decimal("1234567.25"),
+    ]
+    assert table.schema.field("previous_status").type == pyarrow.string()
+    assert table.column("previous_status").to_pylist() == [None, "draft", None]
+
+
+async def test_to_arrow_empty():
+    pytest.importorskip("pyarrow")
+
+    table = await Product.query.only("name").to_arrow()
+    assert table.num_rows == 0
+    assert table.column_names == ["id", "name"]
@@ -0,0 +1,90 @@
+import orjson
+import pytest
+
+import edgy
+from edgy.core.marshalls import ConfigMarshall, Marshall
+from edgy.exceptions import QuerySetError
+from edgy.testclient import DatabaseTestClient
+from tests.settings import DATABASE_URL
+
+database = DatabaseTestClient(DATABASE_URL, full_isolation=False)
+models = edgy.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class User(edgy.StrictModel):
+    id = edgy.IntegerField(primary_key=True, autoincrement=True)
+    name = edgy.CharField(max_length=100)
+    language = edgy.CharField(max_length=200, null=True)
+    token = edgy.CharField(max_length=200, null=True, secret=True)
+
+    class Meta:
+        registry = models
+
+
+class UserMarshall(Marshall):
+    marshall_config = ConfigMarshall(model=User, fields=["id", "name"])
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    async with database:
+        await models.create_all()
+        yield
+        if not database.drop:
+            await models.drop_all()
+
+
+async def collect(iterator):
+    return [chunk async for chunk in iterator]
+
+
+async def test_iter_json_array():
+    for i in range(5):
+        await User.query.create(name=f"user{i}", language="EN", token="secret")
+
+    chunks = await collect(User.query.order_by("id").iter_json(chunk_size=2))
+    # 3 chunks of rows and the closing bracket
+    assert len(chunks) == 4
+    assert orjson.loads(b"".join(chunks)) == await User.query.order_by("id").values()
+
+
+async def test_iter_json_empty():
+    assert b"".join(await collect(User.query.iter_json())) == b"[]"
+    assert await collect(User.query.iter_json(ndjson=True)) == []
+
+
+async def test_iter_json_ndjson():
+    for i in range(3):
+        await User.query.create(name=f"user{i}", language="EN")
+
+    chunks = await collect(User.query.order_by("id").iter_json(chunk_size=2, ndjson=True))
+    assert len(chunks) == 2
+    lines = b"".join(chunks).splitlines()
+    assert [orjson.loads(line)["name"] for line in lines] == ["user0", "user1", "user2"]
+
+
+async def test_iter_json_field_selection():
+    await User.query.create(name="edgy", language="EN", token="secret")
+
+    data = b"".join(await collect(User.query.only("name").iter_json()))
+    assert orjson.loads(data) == [{"id": 1, "name": "edgy"}]
+
+    data = b"".join(await collect(User.query.exclude_secrets().iter_json()))
+    assert orjson.loads(data) == [{"id": 1, "name": "edgy", "language": "EN"}]
+
+    data = b"".join(await collect(User.query.iter_json(exclude={"language", "token"})))
+    assert orjson.loads(data) == [{"id": 1, "name": "edgy"}]
+
+
+async def test_iter_json_marshall():
+    await User.query.create(name="edgy", language="EN", token="secret")
+
+    data = b"".join(await collect(User.query.iter_json(marshall_class=UserMarshall)))
+    assert orjson.loads(data) == [{"id": 1, "name": "edgy"}]
+
+
+async def test_iter_json_invalid_chunk_size():
+    with pytest.raises(QuerySetError):
+        await collect(User.query.iter_json(chunk_size=0))
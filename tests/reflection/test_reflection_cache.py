@@ -0,0 +1,139 @@
+import pytest
+import sqlalchemy
+
+import edgy
+from edgy.contrib.autoreflection import AutoReflectModel
+from edgy.core.connection import ReflectionCache
+from edgy.testclient import DatabaseTestClient
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = DatabaseTestClient(DATABASE_URL, use_existing=False)
+source = edgy.Registry(database=database)
+
+
+class CachedFoo(edgy.StrictModel):
+    a = edgy.CharField(max_length=40)
+
+    class Meta:
+        registry = source
+
+
+class CachedBar(edgy.StrictModel):
+    a = edgy.CharField(max_length=40)
+    foo = edgy.ForeignKey(CachedFoo, null=True)
+
+    class Meta:
+        registry = source
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    async with database:
+        await source.create_all()
+        yield
+        if not database.drop:
+            await source.drop_all()
+
+
+def create_registry(cache: ReflectionCache) -> edgy.Registry:
+    reflected = edgy.Registry(
+        edgy.Database(database, force_rollback=False), reflection_cache=cache
+    )
+
+    class AutoCached(AutoReflectModel):
+        class Meta:
+            registry = reflected
+            include_pattern = r"^cached"
+
+    return reflected
+
+
+async def add_column():
+    async with database:
+        await database.execute(sqlalchemy.text("ALTER TABLE cachedfoos ADD COLUMN b VARCHAR(40)"))
+
+
+async def test_autoreflection_cache(tmp_path):
+    cache = ReflectionCache(tmp_path)
+    async with create_registry(cache) as registry:
+        assert set(registry.reflected) == {"AutoCachedcachedfoos", "AutoCachedcachedbars"}
+        assert cache.misses == 2
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+    # a new process loads the tables from disk
+    cache = ReflectionCache(tmp_path)
+    async with create_registry(cache) as registry:
+        model = registry.get_model("AutoCachedcachedbars")
+        assert (cache.hits, cache.misses) == (2, 0)
+        # the reflection of the model table is served by the cache too
+        assert "foo" in model.table.columns
+        assert cache.misses == 0
+        assert await model.query.count() == 0
+
+    # the fingerprint changes with the schema
+    await add_column()
+    cache = ReflectionCache(tmp_path)
+    async with create_registry(cache) as registry:
+        assert cache.misses == 2
+        assert "b" in registry.get_model("AutoCachedcachedfoos").table.columns
+
+
+async def test_fixed_fingerprint(tmp_path):
+    async with create_registry(ReflectionCache(tmp_path, fingerprint="rev1")):
+        pass
+    await add_column()
+    cache = ReflectionCache(tmp_path, fingerprint="rev1")
+    async with create_registry(cache) as registry:
+        assert cache.misses == 0
+        assert "b" not in registry.get_model("AutoCachedcachedfoos").table.columns
+
+
+async def test_stale_while_revalidate(tmp_path):
+    async with create_registry(ReflectionCache(tmp_path)):
+        pass
+    await add_column()
+
+    cache = ReflectionCache(tmp_path, stale_while_revalidate=True)
+    async with create_registry(cache) as registry:
+        # the stale tables are used
+        assert cache.misses == 0
+        assert "b" not in registry.get_model("AutoCachedcachedfoos").table.columns
+        await cache.wait_for_refresh()
+        assert cache.refreshes == 1
+
+    cache = ReflectionCache(tmp_path)
+    async with create_registry(cache) as registry:
+        assert cache.misses == 0
+        assert "b" in registry.get_model("AutoCachedcachedfoos").table.columns
+
+
+async def test_reflect_model(tmp_path):
+    cache = ReflectionCache(tmp_path)
+    reflected = edgy.Registry(
+        edgy.Database(database, force_rollback=False), reflection_cache=cache
+    )
+
+    class Foo(edgy.ReflectModel):
+        a = edgy.CharField(max_length=40)
+
+        class Meta:
+            registry = reflected
+            tablename = "cachedfoos"
+
+    async with reflected:
+        assert "a" in Foo.table.columns
+        assert (cache.hits, cache.misses) == (0, 1)
+        await Foo.query.create(a="edgy")
+        assert await Foo.query.count() == 1
+
+
+async def test_other_sqlalchemy_version(tmp_path, monkeypatch):
+    async with create_registry(ReflectionCache(tmp_path, fingerprint="rev1")):
+        pass
+    monkeypatch.setattr(sqlalchemy, "__version__", "0.0.0")
+    cache = ReflectionCache(tmp_path, fingerprint="rev1")
+    async with create_registry(cache):
+        # the tables pickled by another SQLAlchemy version are reflected again
+        assert cache.misses == 2
@@ -0,0 +1,58 @@
+import gc
+
+import edgy
+from edgy.core.db.schema_cache import schema_table_cache
+
+models = edgy.Registry(database="sqlite:///test_registry_prewarm.db")
+
+
+class User(edgy.StrictModel):
+    name: str = edgy.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Product(edgy.StrictModel):
+    name: str = edgy.CharField(max_length=100)
+    user: User = edgy.ForeignKey(User, null=True, related_name="products")
+
+    class Meta:
+        registry = models
+
+
+def test_prewarm():
+    models.invalidate_models()
+    assert "_table" not in Product.__dict__
+
+    try:
+        report = models.prewarm(schemas=["tenant_a"])
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+    assert report.models == 2
+    assert report.statements == 10
+    assert set(report.timings) == {
+        "init_models",
+        "tables",
+        "proxy_models",
+        "schema_tables",
+        "statements",
+        "gc_freeze",
+    }
+    assert report.duration >= sum(report.timings.values()) * 0.99
+    for model in (User, Product):
+        assert "_table" in model.__dict__
+        assert model.__dict__["__proxy_model__"] is not None
+        assert model.meta._field_stats_are_initialized
+    hits = schema_table_cache.stats().hits
+    assert Product.table_schema("tenant_a").schema == "tenant_a"
+    assert schema_table_cache.stats().hits == hits + 1
+
+
+def test_prewarm_without_statements():
+    report = models.prewarm(compile_statements=False, freeze=False)
+    assert report.statements == 0
+    assert "statements" not in report.timings
+    assert "gc_freeze" not in report.timings
@@ -0,0 +1,75 @@
+import edgy
+from edgy.core.db.schema_cache import schema_table_cache
+
+models = edgy.Registry(database="sqlite:///test_registry_refresh_metadata.db")
+
+
+class User(edgy.StrictModel):
+    name: str = edgy.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Product(edgy.StrictModel):
+    name: str = edgy.CharField(max_length=100)
+    user: User = edgy.ForeignKey(User, null=True, related_name="products")
+
+    class Meta:
+        registry = models
+
+
+class Unrelated(edgy.StrictModel):
+    name: str = edgy.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+def test_refresh_metadata_incremental():
+    models.refresh_metadata()
+    metadata = models.metadata_by_name[None]
+    tables = dict(metadata.tables)
+    unrelated_copy = Unrelated.table_schema("foo")
+
+    class Tag(edgy.StrictModel):
+        name: str = edgy.CharField(max_length=100)
+        product: Product = edgy.ForeignKey(Product, null=True, related_name="tags")
+
+        class Meta:
+            registry = models
+
+    models.refresh_metadata(models=["Tag"])
+
+    assert "tags" in metadata.tables
+    for key, table in tables.items():
+        assert metadata.tables[key] is table
+    tag_table = metadata.tables["tags"]
+
+    class NewProduct(edgy.StrictModel):
+        name: str = edgy.CharField(max_length=100)
+        sku: str = edgy.CharField(max_length=20, null=True)
+        user: User = edgy.ForeignKey(User, null=True, related_name="products")
+
+        class Meta:
+            registry = False
+            tablename = "products"
+
+    NewProduct.add_to_registry(
+        models, name="Product", on_conflict="replace", replace_related_field=True
+    )
+    models.refresh_metadata(models=[NewProduct])
+
+    # the replaced table and the tables referencing it are rebuilt
+    assert "sku" in metadata.tables["products"].columns
+    assert metadata.tables["tags"] is not tag_table
+    (foreign_key,) = metadata.tables["tags"].foreign_keys
+    assert foreign_key.column.table is metadata.tables["products"]
+    # the other tables and caches are kept
+    assert metadata.tables["users"] is tables["users"]
+    assert metadata.tables["unrelateds"] is tables["unrelateds"]
+    assert Unrelated.table_schema("foo") is unrelated_copy
+
+    models.delete_model("Tag")
+    models.refresh_metadata()
+    schema_table_cache.invalidate(Unrelated)
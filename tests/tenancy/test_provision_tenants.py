@@ -0,0 +1,105 @@
+import pytest
+
+import edgy
+from edgy.contrib.multi_tenancy import TenantModel
+from edgy.core.tenancy.utils import clone_schema, create_schema, provision_tenants
+from edgy.exceptions import ModelSchemaError
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = edgy.Database(DATABASE_URL, full_isolation=False)
+models = edgy.Registry(database=database)
+
+SCHEMAS = ["template_tenant", "clone_a", "clone_b", "bulk_1", "bulk_2", "bulk_3"]
+
+
+class User(TenantModel):
+    name: str = edgy.CharField(max_length=255)
+
+    class Meta:
+        registry = models
+        is_tenant = True
+
+
+class Product(TenantModel):
+    name: str = edgy.CharField(max_length=255)
+    user: User = edgy.ForeignKey(User, null=True, related_name="products")
+
+    class Meta:
+        registry = models
+        is_tenant = True
+
+
+async def drop_schemas():
+    for schema in SCHEMAS:
+        await models.schema.drop_schema(schema, cascade=True, if_exists=True)
+
+
+@pytest.fixture(autouse=True, scope="module")
+async def create_test_database():
+    async with database:
+        await models.create_all()
+        await drop_schemas()
+        yield
+        await drop_schemas()
+        await models.drop_all()
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def connect():
+    async with models:
+        yield
+        await drop_schemas()
+
+
+async def test_provision_tenants():
+    await provision_tenants(models, ["bulk_1", "bulk_2", "bulk_3"], limit=2)
+
+    for schema in ["bulk_1", "bulk_2", "bulk_3"]:
+        user = await User.query.using(schema=schema).create(name=schema)
+        await Product.query.using(schema=schema).create(name="product", user=user)
+        assert await Product.query.using(schema=schema).filter(user__name=schema).count() == 1
+
+    # existing schemas and tables are skipped
+    await provision_tenants(models, ["bulk_1"], if_not_exists=True)
+    assert await User.query.using(schema="bulk_1").count() == 1
+
+
+async def test_create_schema_is_atomic():
+    await create_schema(models, "bulk_1", models=models.tenant_models, should_create_tables=True)
+    with pytest.raises(Exception):  # noqa: B017
+        await create_schema(
+            models, "bulk_1", models=models.tenant_models, should_create_tables=True
+        )
+    assert await User.query.using(schema="bulk_1").count() == 0
+
+
+@pytest.mark.skipif(database.url.dialect != "postgresql", reason="postgresql only")
+async def test_clone_schema():
+    await create_schema(
+        models, "template_tenant", models=models.tenant_models, should_create_tables=True
+    )
+    await User.query.using(schema="template_tenant").create(name="template")
+
+    await provision_tenants(models, ["clone_a", "clone_b"], template="template_tenant")
+
+    for schema in ["clone_a", "clone_b"]:
+        # data is not copied and the sequences start fresh
+        assert await User.query.using(schema=schema).count() == 0
+        user = await User.query.using(schema=schema).create(name=schema)
+        assert user.id == 1
+        product = await Product.query.using(schema=schema).create(name="product", user=user)
+        assert product.id == 1
+
+    # the foreign keys reference the tables of the clone
+    with pytest.raises(Exception):  # noqa: B017
+        await Product.query.using(schema="clone_a").create(name="orphan", user=2)
+
+    await clone_schema(models, "template_tenant", "clone_a", if_not_exists=True)
+    assert await User.query.using(schema="clone_a").count() == 1
+
+
+async def test_default_schema_is_rejected():
+    with pytest.raises(ModelSchemaError):
+        await provision_tenants(models, ["public"])
@@ -0,0 +1,126 @@
+import pytest
+
+import edgy
+from edgy.core.db.schema_cache import SchemaTableCache, schema_table_cache
+from edgy.types import Undefined
+
+models = edgy.Registry(database="sqlite:///test_schema_table_cache.db")
+
+
+class Category(edgy.StrictModel):
+    name = edgy.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Product(edgy.StrictModel):
+    name = edgy.CharField(max_length=100)
+    category = edgy.ForeignKey(Category)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    schema_table_cache.invalidate()
+    schema_table_cache.reset_stats()
+    yield
+    schema_table_cache._max_size = Undefined
+    schema_table_cache._max_memory = Undefined
+    schema_table_cache.invalidate()
+
+
+def test_hits_and_misses():
+    table = Category.table_schema("foo")
+    assert table.schema == "foo"
+    assert Category.table_schema("foo") is table
+    assert Category.proxy_model.table_schema("foo") is table
+    assert Category._db_schemas == {"foo": table}
+
+    stats = schema_table_cache.stats()
+    assert (stats.hits, stats.misses, stats.size, stats.schemas) == (2, 1, 1, 1)
+    assert stats.memory > 0
+
+    assert Category.table_schema("foo", update_cache=True) is not table
+    assert schema_table_cache.stats().misses == 2
+
+
+def test_shared_schema_metadata():
+    category_table = Category.table_schema("foo")
+    product_table = Product.table_schema("foo")
+    assert category_table.metadata is product_table.metadata
+    assert category_table.metadata is not models.metadata_by_name[None]
+    assert "foo.categorys" not in models.metadata_by_name[None].tables
+    assert Product.table_schema("bar").metadata is not product_table.metadata
+
+    fk = next(iter(product_table.foreign_keys))
+    assert fk.column.table is category_table
+
+
+def test_references_outside_of_the_schema():
+    product_table = Product.table_schema("foo")
+    fk = next(iter(product_table.foreign_keys))
+    # the shared table is copied into the schema metadata
+    assert fk.column.table.schema is None
+    assert fk.column.table.metadata is product_table.metadata
+
+
+def test_evict_by_size():
+    schema_table_cache.max_size = 2
+    first = Category.table_schema("a")
+    Category.table_schema("b")
+    Category.table_schema("a")
+    Category.table_schema("c")
+
+    assert set(Category._db_schemas) == {"a", "c"}
+    assert Category.table_schema("a") is first
+    stats = schema_table_cache.stats()
+    assert (stats.evictions, stats.size, stats.schemas) == (1, 2, 2)
+
+
+def test_evict_by_memory():
+    table = Category.table_schema("a")
+    budget = schema_table_cache.stats().memory
+    schema_table_cache.max_memory = budget * 2
+    Category.table_schema("b")
+    Category.table_schema("c")
+
+    assert set(Category._db_schemas) == {"b", "c"}
+    assert "a.categorys" not in table.metadata.tables
+    assert schema_table_cache.stats().memory == budget * 2
+
+
+def test_invalidate():
+    Category.table_schema("a")
+    Product.table_schema("a")
+    schema_table_cache.invalidate(Category)
+    assert Category._db_schemas == {}
+    assert set(Product._db_schemas) == {"a"}
+    assert schema_table_cache.stats().size == 1
+
+    Category.meta.invalidate()
+    schema_table_cache.invalidate()
+    assert Product._db_schemas == {}
+    assert schema_table_cache.stats() == (0, 2, 0, 0, 0, 0)
+
+
+def test_prewarm():
+    models.prewarm_schema_tables(["a", "b"])
+    assert schema_table_cache.stats().size == 4
+    assert schema_table_cache.stats().misses == 0
+
+    models.prewarm_schema_tables(["c"], models=["Product"])
+    assert set(Product._db_schemas) == {"a", "b", "c"}
+    assert set(Category._db_schemas) == {"a", "b"}
+
+    Category.table_schema("a")
+    assert schema_table_cache.stats().hits == 1
+
+
+def test_limits_from_settings():
+    cache = SchemaTableCache()
+    assert cache.max_size == edgy.monkay.settings.schema_table_cache_size
+    assert cache.max_memory == edgy.monkay.settings.schema_table_cache_memory
+    assert SchemaTableCache(max_size=None).max_size is None
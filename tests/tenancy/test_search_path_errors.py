@@ -0,0 +1,82 @@
+import pytest
+import sqlalchemy
+
+from edgy import Registry, fields
+from edgy.contrib.multi_tenancy import TenantModel
+from edgy.core.tenancy.search_path import search_path
+from edgy.testclient import DatabaseTestClient
+from tests.settings import DATABASE_URL
+
+# no force_rollback, so the scopes run on the own connection of the task
+database = DatabaseTestClient(DATABASE_URL)
+models = Registry(database=database)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class Item(TenantModel):
+    name: str = fields.CharField(max_length=255)
+
+    class Meta:
+        registry = models
+        is_tenant = True
+
+
+@pytest.fixture(autouse=True, scope="module")
+async def create_test_database():
+    try:
+        await models.create_all()
+        async with database:
+            await models.schema.create_schema("tenant_err", if_not_exists=True, init_models=True)
+            await Item.query.create(name="shared")
+            await Item.query.using(schema="tenant_err").create(name="tenant")
+        yield
+        async with database:
+            await models.schema.drop_schema("tenant_err", cascade=True, if_exists=True)
+        if not database.drop:
+            await models.drop_all()
+    except Exception:
+        pytest.skip("No database available")
+
+
+async def get_search_path() -> str:
+    return await database.fetch_val(sqlalchemy.text("SHOW search_path"))
+
+
+async def get_item_names() -> list[str]:
+    rows = await database.fetch_all(sqlalchemy.text(f"SELECT name FROM {Item.meta.tablename}"))
+    return [row[0] for row in rows]
+
+
+async def test_failed_transaction_does_not_leak_search_path():
+    async with database:
+        default_path = await get_search_path()
+    async with database, database.connection():
+        with pytest.raises(sqlalchemy.exc.ProgrammingError, match="does_not_exist"):
+            async with database.transaction():
+                async with search_path(database, "tenant_err"):
+                    assert await get_item_names() == ["tenant"]
+                    await database.execute(sqlalchemy.text("SELECT * FROM does_not_exist"))
+        # the rollback restored the server side value
+        assert await get_search_path() == default_path
+        assert await get_item_names() == ["shared"]
+
+        # the same schema is bound again instead of trusting a stale value
+        async with search_path(database, "tenant_err"):
+            assert await get_search_path() == "tenant_err, public"
+            assert await get_item_names() == ["tenant"]
+        assert await get_item_names() == ["shared"]
+
+
+async def test_session_search_path_restored_after_error():
+    async with database, database.connection():
+        default_path = await get_search_path()
+        with pytest.raises(sqlalchemy.exc.ProgrammingError, match="does_not_exist"):
+            async with search_path(database, "tenant_err"):
+                await database.execute(sqlalchemy.text("SELECT * FROM does_not_exist"))
+        assert await get_search_path() == default_path
+
+        async with search_path(database, "tenant_err"):
+            assert await get_item_names() == ["tenant"]
+        assert await get_item_names() == ["shared"]
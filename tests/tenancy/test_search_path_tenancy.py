@@ -0,0 +1,146 @@
+import pytest
+import sqlalchemy
+
+import edgy
+from edgy import Registry, fields
+from edgy.contrib.multi_tenancy import TenantModel
+from edgy.contrib.multi_tenancy.models import TenantMixin
+from edgy.core.db import with_tenant
+from edgy.core.tenancy.search_path import SearchPathDatabase, search_path
+from edgy.exceptions import SchemaError
+from edgy.testclient import DatabaseTestClient
+from tests.settings import DATABASE_URL
+
+database = DatabaseTestClient(DATABASE_URL)
+models = Registry(database=database)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class Tenant(TenantMixin):
+    class Meta:
+        registry = models
+
+
+class User(TenantModel):
+    name: str = fields.CharField(max_length=255)
+
+    class Meta:
+        registry = models
+        is_tenant = True
+
+
+class Product(TenantModel):
+    name: str = fields.CharField(max_length=255)
+    user: User = fields.ForeignKey(User, null=True, related_name="products")
+
+    class Meta:
+        registry = models
+        is_tenant = True
+
+
+@pytest.fixture(autouse=True, scope="module")
+async def create_test_database():
+    try:
+        await models.create_all()
+        yield
+        if not database.drop:
+            await models.drop_all()
+    except Exception:
+        pytest.skip("No database available")
+
+
+@pytest.fixture(autouse=True)
+async def rollback_transactions():
+    with (
+        edgy.monkay.with_settings(
+            edgy.monkay.settings.model_copy(update={"tenancy_mode": "search_path"})
+        ),
+        database.force_rollback(),
+    ):
+        async with database:
+            yield
+
+
+async def get_search_path() -> str:
+    async with database:
+        return await database.fetch_val(sqlalchemy.text("SHOW search_path"))
+
+
+async def test_queries_use_unqualified_tables():
+    await Tenant.query.create(schema_name="tenant_a", tenant_name="tenant_a")
+    await Tenant.query.create(schema_name="tenant_b", tenant_name="tenant_b")
+    default_path = await get_search_path()
+
+    queryset = User.query.using(schema="tenant_a")
+    assert queryset.search_path_schema == "tenant_a"
+    assert queryset.table is User.table
+    assert isinstance(queryset.database, SearchPathDatabase)
+
+    await queryset.bulk_create([{"name": "a1"}, {"name": "a2"}])
+    await User.query.using(schema="tenant_b").bulk_create([{"name": "b1"}])
+
+    assert await User.query.using(schema="tenant_a").count() == 2
+    assert await User.query.using(schema="tenant_b").count() == 1
+    with with_tenant("tenant_b"):
+        assert [user.name for user in await User.query.all()] == ["b1"]
+    assert await User.query.count() == 0
+    # the connection is restored
+    assert await get_search_path() == default_path
+
+    # the compiled statements are the same for all tenants
+    statement_a = str((await User.query.using(schema="tenant_a").as_select()).compile())
+    statement_b = str((await User.query.using(schema="tenant_b").as_select()).compile())
+    assert statement_a == statement_b
+    assert "tenant_" not in statement_a
+
+
+async def test_joins():
+    await Tenant.query.create(schema_name="tenant_c", tenant_name="tenant_c")
+    user = await User.query.using(schema="tenant_c").create(name="user")
+    await Product.query.using(schema="tenant_c").create(name="product", user=user)
+
+    product = (
+        await Product.query.using(schema="tenant_c")
+        .select_related("user")
+        .filter(user__name="user")
+        .get()
+    )
+    assert product.user.name == "user"
+    assert await Product.query.filter(user__name="user").count() == 0
+
+
+async def test_search_path_scope():
+    await Tenant.query.create(schema_name="tenant_d", tenant_name="tenant_d")
+    default_path = await get_search_path()
+    async with search_path(database, "tenant_d"):
+        assert await get_search_path() == "tenant_d, public"
+        async with search_path(database, "public"):
+            assert await get_search_path() == "public"
+        # the queryset reuses the bound schema
+        await User.query.using(schema="tenant_d").create(name="user")
+        assert await get_search_path() == "tenant_d, public"
+    assert await get_search_path() == default_path
+    assert await User.query.using(schema="tenant_d").count() == 1
+
+
+async def test_qualified_mode_unaffected():
+    with edgy.monkay.with_settings(
+        edgy.monkay.settings.model_copy(update={"tenancy_mode": "qualified"})
+    ):
+        queryset = User.query.using(schema="tenant_a")
+        assert queryset.search_path_schema is None
+        assert queryset.table.schema == "tenant_a"
+
+
+async def test_missing_tenant_table_raises():
+    # a schema without the tables of the tenant models
+    await models.schema.create_schema("tenant_empty", if_not_exists=True)
+    await User.query.create(name="shared")
+    # the table of public would be used otherwise
+    with pytest.raises(SchemaError):
+        await User.query.using(schema="tenant_empty").count()
+    with pytest.raises(SchemaError):
+        async with search_path(database, "tenant_empty", tablename=User.meta.tablename):
+            pass
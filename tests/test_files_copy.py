@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import os
+from io import BytesIO
+
+import pytest
+
+from edgy.core.files import move
+from edgy.core.files.move import copy_file_descriptor, file_move_safe
+from edgy.core.files.storage.filesystem import FileSystemStorage
+
+CONTENT = os.urandom(3 * 64 * 2**10 + 17)
+
+
+@pytest.fixture()
+def source(tmp_path):
+    path = tmp_path / "source.bin"
+    path.write_bytes(CONTENT)
+    return path
+
+
+@pytest.mark.parametrize("kernel", [True, False])
+def test_copy_file_descriptor(tmp_path, source, monkeypatch, kernel):
+    if not kernel:
+        # force the chunked fallback
+        monkeypatch.setattr(move, "_reflink", lambda src_fd, dst_fd: False)
+        monkeypatch.delattr(os, "copy_file_range", raising=False)
+        monkeypatch.delattr(os, "sendfile", raising=False)
+    with open(source, "rb") as src, open(tmp_path / "target.bin", "wb") as dst:
+        src.read(10)
+        assert copy_file_descriptor(src.fileno(), dst.fileno(), chunk_size=1000) == len(CONTENT)
+        # the source position isn't changed
+        assert src.tell() == 10
+    assert (tmp_path / "target.bin").read_bytes() == CONTENT
+
+    with open(source, "rb") as src, open(tmp_path / "target2.bin", "wb") as dst:
+        dst.write(b"head")
+        dst.flush()
+        assert copy_file_descriptor(src.fileno(), dst.fileno(), offset=100) == len(CONTENT) - 100
+    assert (tmp_path / "target2.bin").read_bytes() == b"head" + CONTENT[100:]
+
+
+def test_storage_save_file_backed(tmp_path, source):
+    storage = FileSystemStorage(location=tmp_path / "media")
+    with open(source, "rb") as f:
+        storage.save(f, "copy.bin")
+    assert (tmp_path / "media" / "copy.bin").read_bytes() == CONTENT
+    # in-memory content uses the chunks
+    storage.save(BytesIO(b"abc"), "memory.bin")
+    assert (tmp_path / "media" / "memory.bin").read_bytes() == b"abc"
+
+    # unflushed writes are copied too
+    with open(tmp_path / "written.bin", "w+b") as f:
+        f.write(b"written")
+        storage.save(f, "written.bin")
+    assert (tmp_path / "media" / "written.bin").read_bytes() == b"written"
+
+
+def test_file_move_safe_across_filesystems(tmp_path, source, monkeypatch):
+    def rename(src, dst):
+        raise OSError("Invalid cross-device link")
+
+    monkeypatch.setattr(os, "rename", rename)
+    file_move_safe(str(source), str(tmp_path / "moved.bin"))
+    assert (tmp_path / "moved.bin").read_bytes() == CONTENT
+    assert not source.exists()
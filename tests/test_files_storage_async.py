@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import threading
+from io import BytesIO
+
+import pytest
+
+from edgy.core.files.storage.base import get_storage_executor, run_in_storage_thread
+from edgy.core.files.storage.filesystem import FileSystemStorage
+
+pytestmark = pytest.mark.anyio
+
+
+class AsyncUpload:
+    def __init__(self, content: bytes, filename: str) -> None:
+        self.stream = BytesIO(content)
+        self.filename = filename
+        self.reads = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        self.reads += 1
+        return self.stream.read(size)
+
+
+async def test_async_storage_methods(tmp_path):
+    storage = FileSystemStorage(location=tmp_path)
+    await storage.asave(b"abcdef", "demo.txt")
+    assert await storage.aexists("demo.txt")
+    assert await storage.asize("demo.txt") == 6
+    file = await storage.aopen("demo.txt")
+    with file:
+        assert file.read() == b"abcdef"
+    await storage.adelete("demo.txt")
+    assert not await storage.aexists("demo.txt")
+
+
+async def test_async_storage_stream(tmp_path):
+    storage = FileSystemStorage(location=tmp_path)
+    content = b"x" * (3 * 64 * 2**10 + 5)
+    upload = AsyncUpload(content, "upload.bin")
+    await storage.asave(upload)
+    # streamed chunk by chunk
+    assert upload.reads == 5
+    assert (tmp_path / "upload.bin").read_bytes() == content
+
+
+async def test_run_in_storage_thread():
+    assert await run_in_storage_thread(threading.current_thread) is not (
+        threading.current_thread()
+    )
+    assert (await run_in_storage_thread(threading.current_thread)).name.startswith("edgy-storage")
+    assert get_storage_executor() is get_storage_executor()
@@ -0,0 +1,71 @@
+import sys
+
+import edgy
+
+MODEL_COUNT = 500
+
+
+def define_models(count: int = MODEL_COUNT) -> edgy.Registry:
+    registry = edgy.Registry(database="sqlite:///lazy_model_build.db")
+    previous = None
+    for i in range(count):
+        attrs = {
+            "__module__": __name__,
+            "name": edgy.CharField(max_length=100),
+            "value": edgy.IntegerField(null=True),
+            "Meta": type("Meta", (), {"registry": registry}),
+        }
+        if previous is not None:
+            attrs["parent"] = edgy.ForeignKey(
+                previous, null=True, related_name=f"children_{i}", on_delete=edgy.SET_NULL
+            )
+        previous = type(f"SyntheticModel{i}", (edgy.Model,), attrs)
+    return registry
+
+
+def define_deferred_models(count: int = MODEL_COUNT) -> edgy.Registry:
+    with edgy.monkay.with_settings(
+        edgy.monkay.settings.model_copy(update={"model_defer_build": True}),
+        evaluate_settings_with={},
+    ):
+        return define_models(count)
+
+
+def test_deferred_build():
+    registry = define_deferred_models(20)
+    model = registry.get_model("SyntheticModel19")
+    assert not model.__pydantic_complete__
+    assert not registry.get_model("SyntheticModel0").__pydantic_complete__
+
+    instance = model(name="foo", value=1, parent=None)
+
+    assert model.__pydantic_complete__
+    assert instance.model_dump(include={"name", "value"}) == {"name": "foo", "value": 1}
+    assert "children_19" in registry.get_model("SyntheticModel18").meta.fields
+    assert model.table.name == "syntheticmodel19s"
+
+
+def test_eager_build():
+    registry = define_models(20)
+    assert registry.get_model("SyntheticModel19").__pydantic_complete__
+
+
+def test_deferred_build_of_long_relation_chain():
+    registry = define_deferred_models()
+    model = registry.get_model(f"SyntheticModel{MODEL_COUNT - 1}")
+    recursion_limit = sys.getrecursionlimit()
+
+    assert model(name="foo").name == "foo"
+    assert sys.getrecursionlimit() == recursion_limit
+    # the targets of the relations were built first
+    assert registry.get_model("SyntheticModel0").__pydantic_complete__
+
+
+def test_setting_ignored_before_evaluation():
+    with edgy.monkay.with_settings(
+        edgy.monkay.settings.model_copy(update={"model_defer_build": True})
+    ):
+        # importing models must not evaluate the settings
+        registry = define_models(2)
+        assert not edgy.monkay.settings_evaluated
+    assert registry.get_model("SyntheticModel1").__pydantic_complete__
@@ -0,0 +1 @@
+!# /bin/sh
\ No newline at end of file